@@ -0,0 +1,248 @@
+"""
+검출기 단계별 벤치마크
+
+합성 장면(src/capture/synthetic.py)으로 화면 없이 같은 입력을 재현하여 각 단계의
+실행 시간을 측정하고 JSON으로 저장합니다. 버전 사이의 성능 회귀는 --compare로 확인합니다.
+
+예)
+    python benchmarks/bench_detector.py --output bench.json
+    python benchmarks/bench_detector.py --sizes 320 720p --repeat 20 --cold
+    python benchmarks/bench_detector.py --compare bench.json --threshold 15
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+import tempfile
+from typing import Callable, Dict, List, Optional
+
+# 저장소 루트에서 src 패키지를 가져오기 위함
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+import numba
+
+from src.capture.synthetic import make_scene, SCENES, RESOLUTIONS, TARGET_RANGE
+from src.detection.custom_detector import CustomDetector
+from src.detection.labeling import connected_components_with_stats
+
+STAGES = ('bgr_to_hsv', 'create_mask', 'threshold', '_dilate_compute', 'apply_morphology',
+          'connected_components', 'find_contours', 'draw_objects', 'detect')
+
+
+def _time_call(fn: Callable[[], object], repeat: int,
+               setup: Optional[Callable[[], None]] = None) -> List[float]:
+    """fn을 repeat번 실행한 각 소요 시간(ms)"""
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000.0)
+    return times
+
+
+def _stage_calls(detector: CustomDetector, frame: np.ndarray) -> Dict[str, tuple]:
+    """단계 이름 -> (측정할 함수, 준비 함수)
+
+    각 단계의 입력은 앞 단계 결과를 미리 계산해 두어 해당 단계만 측정합니다.
+    """
+    hsv = detector.bgr_to_hsv(frame)
+    mask = detector.create_mask(hsv)
+    dilated = detector.apply_morphology(mask)
+    _, stats, centroids = connected_components_with_stats(dilated)
+    objects = detector.objects_from_stats(stats, centroids)
+    canvas = [frame.copy()]
+
+    def reset_canvas():
+        canvas[0][...] = frame
+
+    return {
+        'bgr_to_hsv': (lambda: detector.bgr_to_hsv(frame), None),
+        'create_mask': (lambda: detector.create_mask(hsv), None),
+        'threshold': (lambda: detector.threshold(frame), None),
+        '_dilate_compute': (lambda: detector._dilate_compute(mask), None),
+        'apply_morphology': (lambda: detector.apply_morphology(mask), None),
+        'connected_components': (lambda: connected_components_with_stats(dilated), None),
+        'find_contours': (lambda: detector.find_contours(dilated), None),
+        'draw_objects': (lambda: detector.draw_objects(canvas[0], objects), reset_canvas),
+        'detect': (lambda: detector.detect(frame), None),
+    }
+
+
+def run_warm(sizes: List[str], scenes: List[str], stages: List[str], repeat: int) -> List[dict]:
+    """JIT 컴파일이 끝난 상태에서 단계별 실행 시간 측정"""
+    detector = CustomDetector(*TARGET_RANGE)
+    results = []
+    for size_name in sizes:
+        size = RESOLUTIONS[size_name]
+        for scene in scenes:
+            frame = make_scene(scene, size)
+            calls = _stage_calls(detector, frame)
+            objects = len(detector.detect(frame)['objects'])
+            for stage in stages:
+                fn, setup = calls[stage]
+                if setup is not None:
+                    setup()
+                fn()  # 워밍업 (컴파일 및 캐시 적재)
+                times = _time_call(fn, repeat, setup)
+                results.append({
+                    'size': size_name,
+                    'width': size[0],
+                    'height': size[1],
+                    'scene': scene,
+                    'stage': stage,
+                    'objects': objects,
+                    'min_ms': round(min(times), 4),
+                    'median_ms': round(float(np.median(times)), 4),
+                    'mean_ms': round(float(np.mean(times)), 4),
+                })
+                print(f"{size_name:>6} {scene:<13} {stage:<21} "
+                      f"median {results[-1]['median_ms']:10.3f} ms", file=sys.stderr)
+    return results
+
+
+def run_first_calls(stages: List[str]) -> Dict[str, float]:
+    """현재 프로세스에서 단계별 첫 호출 시간(ms) 측정 (컴파일 또는 캐시 로드 포함)"""
+    detector = CustomDetector(*TARGET_RANGE)
+    frame = make_scene('sparse_blobs', RESOLUTIONS['320'])
+    first = {}
+    # 앞 단계 결과를 만드는 호출도 컴파일을 일으키므로 단계 순서대로 측정
+    hsv = mask = dilated = objects = None
+    for stage in stages:
+        start = time.perf_counter()
+        if stage == 'bgr_to_hsv':
+            hsv = detector.bgr_to_hsv(frame)
+        elif stage == 'create_mask':
+            mask = detector.create_mask(hsv if hsv is not None else detector.bgr_to_hsv(frame))
+        elif stage == 'threshold':
+            mask = detector.threshold(frame)
+        elif stage == '_dilate_compute':
+            detector._dilate_compute(mask if mask is not None else detector.threshold(frame))
+        elif stage == 'apply_morphology':
+            dilated = detector.apply_morphology(mask if mask is not None else detector.threshold(frame))
+        elif stage == 'connected_components':
+            _, stats, centroids = connected_components_with_stats(
+                dilated if dilated is not None else detector.apply_morphology(detector.threshold(frame)))
+            objects = detector.objects_from_stats(stats, centroids)
+        elif stage == 'find_contours':
+            detector.find_contours(dilated if dilated is not None else detector.threshold(frame))
+        elif stage == 'draw_objects':
+            detector.draw_objects(frame.copy(), objects or [])
+        elif stage == 'detect':
+            detector.detect(frame)
+        first[stage] = round((time.perf_counter() - start) * 1000.0, 3)
+    return first
+
+
+def run_cold(stages: List[str]) -> dict:
+    """빈 JIT 캐시(컴파일)와 채워진 캐시(디스크 로드)에서의 첫 호출 시간을 새 프로세스로 측정"""
+    report = {}
+    with tempfile.TemporaryDirectory(prefix='numba-cache-') as cache_dir:
+        env = dict(os.environ, NUMBA_CACHE_DIR=cache_dir)
+        for label in ('compile', 'disk_cache'):
+            start = time.perf_counter()
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--first-calls', '--stages', *stages],
+                env=env, check=True, capture_output=True, text=True).stdout
+            report[label] = {
+                'process_ms': round((time.perf_counter() - start) * 1000.0, 1),
+                'first_call_ms': json.loads(output),
+            }
+            print(f"cold ({label}): {report[label]['process_ms']} ms", file=sys.stderr)
+    return report
+
+
+def environment() -> dict:
+    """측정 환경 정보"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'git_commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'numba': numba.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numba_threads': numba.get_num_threads(),
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[str]:
+    """기준 결과보다 threshold(%) 이상 느려진 항목 목록 (중앙값 기준)"""
+    base = {(r['size'], r['scene'], r['stage']): r for r in baseline.get('results', [])}
+    regressions = []
+    for r in current['results']:
+        b = base.get((r['size'], r['scene'], r['stage']))
+        if b is None or b['median_ms'] <= 0:
+            continue
+        change = (r['median_ms'] - b['median_ms']) / b['median_ms'] * 100.0
+        if change > threshold:
+            regressions.append(f"{r['size']} {r['scene']} {r['stage']}: "
+                               f"{b['median_ms']:.3f} -> {r['median_ms']:.3f} ms (+{change:.1f}%)")
+    return regressions
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="검출기 단계별 벤치마크")
+    parser.add_argument('--sizes', nargs='+', choices=list(RESOLUTIONS), default=list(RESOLUTIONS))
+    parser.add_argument('--scenes', nargs='+', choices=SCENES, default=list(SCENES))
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(STAGES))
+    parser.add_argument('--repeat', type=int, default=5, help="단계별 반복 측정 횟수")
+    parser.add_argument('--cold', action='store_true',
+                        help="새 프로세스에서 JIT 컴파일/캐시 로드 시간도 측정")
+    parser.add_argument('--output', default=None, help="결과 JSON 파일 (기본값: 표준 출력)")
+    parser.add_argument('--compare', default=None, help="비교할 기준 결과 JSON 파일")
+    parser.add_argument('--threshold', type=float, default=10.0, help="회귀로 판단할 감속 비율(%%)")
+    parser.add_argument('--first-calls', action='store_true', help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+    if args.first_calls:
+        # run_cold가 실행하는 하위 프로세스
+        print(json.dumps(run_first_calls(args.stages)))
+        return 0
+
+    report = {
+        'environment': environment(),
+        'config': {'sizes': args.sizes, 'scenes': args.scenes, 'stages': args.stages,
+                   'repeat': args.repeat},
+        'cold': run_cold(args.stages) if args.cold else None,
+        'results': run_warm(args.sizes, args.scenes, args.stages, args.repeat),
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+        print(f"Results saved to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions above {args.threshold}% against {args.compare}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""
+UI 없이 실행하는 HSV 기반 객체 탐지 프로그램
+
+검출 결과를 표준 출력으로 스트리밍하며 (JSON 줄 또는 바이너리 레코드),
+진행 메시지는 표준 오류로 출력합니다. tkinter와 UI 모듈은 가져오지 않습니다.
+
+예)
+    python headless.py --frames 100 > detections.jsonl
+    python headless.py --input frames.npy --format binary > detections.bin
+    python headless.py --input synthetic:small_blobs --size 1280 720 --profile > /dev/null
+"""
+
+import time
+_process_start = time.perf_counter()  # 시작 시간 측정 기준 (무거운 모듈 import 전)
+
+import os
+import sys
+import argparse
+from src.detection.custom_detector import CustomDetector
+from src.detection.incremental import IncrementalDetector
+from src.detection.warmup import StartupTimer, warm_up, kernel_cache_stats
+from src.detection.profiling import StageProfiler
+from src.capture.sources import open_source
+from src.headless.settings import load_hsv_range
+from src.headless.runner import JsonLinesWriter, BinaryRecordWriter, run
+from src.pipeline.scheduler import FrameGovernor
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="UI 없이 실행하는 HSV 기반 객체 탐지")
+    parser.add_argument('--settings', default=None,
+                        help="HSV 설정 파일 (hsv_settings.json 또는 settings.json 형식, "
+                             "기본값: 현재 디렉토리에서 순서대로 찾음)")
+    parser.add_argument('--preset', default=None, help="settings.json 형식에서 사용할 프리셋 이름 (--settings가 없으면 settings.json에서 찾음)")
+    parser.add_argument('--input', default=None,
+                        help="화면 대신 사용할 프레임 소스: .npy/프레임 묶음 파일, 이미지 폴더, "
+                             "synthetic[:장면] (src.capture.sources.open_source 참고)")
+    parser.add_argument('--monitor', type=int, default=0, help="캡처할 모니터 인덱스")
+    parser.add_argument('--size', type=int, nargs=2, default=(320, 320), metavar=('WIDTH', 'HEIGHT'),
+                        help="캡처 영역 (합성 소스는 장면) 크기")
+    parser.add_argument('--format', choices=('jsonl', 'binary'), default='jsonl', help="출력 형식")
+    parser.add_argument('--frames', type=int, default=None, help="처리할 최대 프레임 수")
+    parser.add_argument('--fps', type=float, default=None, help="목표 FPS (기본값: 제한 없음)")
+    parser.add_argument('--profile', action='store_true',
+                        help="단계별 처리 시간을 계측하여 종료 시 표준 오류로 출력")
+    return parser.parse_args()
+
+
+def log(message: str):
+    """진행 메시지 출력 (표준 출력은 검출 결과 전용)"""
+    print(message, file=sys.stderr, flush=True)
+
+
+def source_frames(source):
+    """프레임 소스 반복자 (반복하지 않는 소스는 끝나면 종료, 캡처 실패 시 잠시 후 재시도)
+
+    다음 프레임을 요청받으면 이전 프레임 처리가 끝난 것이므로 그 버퍼를 소스에 돌려줌
+    """
+    while True:
+        frame = source.capture()
+        if frame is None:
+            if source.exhausted:
+                return
+            time.sleep(0.01)
+            continue
+        yield frame
+        source.release(frame)
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+    timer = StartupTimer(_process_start)
+    timer.mark('imports')
+
+    try:
+        hsv_range, settings_path = load_hsv_range(args.settings, args.preset)
+    except (OSError, ValueError) as e:
+        log(f"Error loading settings: {e}")
+        return 2
+    log(f"HSV range {hsv_range} from {settings_path or 'defaults'}")
+
+    detector = CustomDetector(*hsv_range)
+    incremental_detector = IncrementalDetector(detector, draw=False)
+
+    try:
+        # 파일/합성 소스는 한 번만 재생 (화면 캡처는 --frames 또는 중단 시까지)
+        source = open_source(args.input or 'screen', tuple(args.size), pool_size=2, loop=False)
+    except (OSError, ValueError) as e:
+        log(f"Error opening frame source: {e}")
+        return 2
+    if not source.select_monitor(args.monitor):
+        log(f"Invalid monitor index {args.monitor}")
+        return 2
+    width, height = source.capture_size
+    frame_shape = (height, width, 3)
+    frames = source_frames(source)
+    timer.mark('source')
+
+    warm_up(detector, frame_shape, incremental_detector, timer=timer)
+    log("Startup time breakdown:\n" + timer.report())
+    log(f"JIT kernels: {kernel_cache_stats()}")
+    profiler = StageProfiler() if args.profile else None
+    if profiler is not None:
+        detector.profiler = profiler
+
+    if args.format == 'binary':
+        writer = BinaryRecordWriter(sys.stdout.buffer)
+    else:
+        writer = JsonLinesWriter(sys.stdout)
+    governor = FrameGovernor(target_fps=args.fps) if args.fps else None
+
+    try:
+        stats = run(frames, incremental_detector.detect, writer, args.frames, governor, profiler,
+                    release=incremental_detector.release_result)
+    except KeyboardInterrupt:
+        log("Interrupted.")
+        return 130
+    except BrokenPipeError:
+        # 출력을 읽는 쪽이 먼저 종료한 경우 (예: | head), 종료 시 flush 오류도 막음
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    log(f"Done: {stats}")
+    if profiler is not None:
+        log("Stage timings: " + profiler.format_summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
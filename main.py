@@ -2,83 +2,156 @@
 HSV 기반 객체 탐지 프로그램
 """
 
+import time
+_process_start = time.perf_counter()  # 시작 시간 측정 기준 (무거운 모듈 import 전)
+
 import sys
-import threading
+import argparse
 import tkinter as tk
-import time
-import queue
-from src.capture.screen_capture import ScreenCapture
+from src.capture.sources import open_source
+from src.capture.recorder import FrameRecorder
 from src.ui.control_window import ControlWindow
+from src.ui.preview import PreviewCompositor
 from src.detection.custom_detector import CustomDetector
+from src.detection.incremental import IncrementalDetector
+from src.detection.warmup import StartupTimer, warm_up, kernel_cache_stats
+from src.detection.profiling import StageProfiler
+from src.pipeline.runner import PipelineRunner
+from src.pipeline.scheduler import FrameGovernor
+from src.pipeline.process_pool import ProcessPoolRunner
 
 # 종료 플래그
 exit_flag = False
 
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="HSV 기반 객체 탐지 프로그램")
+    parser.add_argument('--workers', type=int, default=0,
+                        help="실시간 검출 작업자 프로세스 수 (0이면 같은 프로세스에서 증분 검출)")
+    parser.add_argument('--source', default='screen',
+                        help="프레임 소스: screen, synthetic[:장면], 이미지 폴더, "
+                             ".npy/프레임 묶음 파일 (기본값: screen)")
+    parser.add_argument('--playback-fps', type=float, default=None,
+                        help="파일/합성 소스 재생 속도 (기본값: 최대 속도)")
+    parser.add_argument('--target-fps', type=float, default=60.0,
+                        help="실시간 캡처 목표 FPS (0이면 제한 없음)")
+    parser.add_argument('--cpu-budget', type=float, default=1.0,
+                        help="검출이 차지할 수 있는 시간 비율 (0 < 비율 <= 1, 0.5이면 검출 시간의 두 배 간격으로 캡처)")
+    parser.add_argument('--record', default=None, metavar='PATH',
+                        help="실시간 프레임/마스크/검출 결과를 녹화할 파일 (최근 --record-frames개 보관)")
+    parser.add_argument('--record-frames', type=int, default=600,
+                        help="녹화 파일에 보관할 최대 프레임 수 (파일 크기 고정)")
+    parser.add_argument('--preview-scale', type=float, default=1.0,
+                        help="모니터 창 미리보기 배율 (0 < 배율 <= 1)")
+    parser.add_argument('--preview-fps', type=float, default=60.0,
+                        help="모니터 창 미리보기 최대 FPS (0이면 제한 없음)")
+    parser.add_argument('--profile', action='store_true',
+                        help="단계별 처리 시간을 계측하여 모니터 창에 표시")
+    return parser.parse_args()
+
 def main():
     """메인 함수"""
     global exit_flag
+    args = parse_args()
+    timer = StartupTimer(_process_start)
+    timer.mark('imports')
     
-    # 화면 캡처 객체 생성
-    screen_capture = ScreenCapture()
+    # 실시간 캡처 스케줄러 (목표 FPS, 정적 모드에서는 ControlWindow가 일시 정지)
+    try:
+        governor = FrameGovernor(target_fps=args.target_fps, cpu_budget=args.cpu_budget)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 2
+    
+    # 프레임 소스 생성 (기본값: 화면 캡처)
+    # (버퍼 6개를 빌려 씀: 캡처 중 1 + 단계 사이 버퍼 2 + 검출/표시 중 2 + 여유 1,
+    #  다 쓴 프레임은 파이프라인/UI가 돌려주며 빈 버퍼가 없으면 캡처가 프레임을 버림)
+    try:
+        screen_capture = open_source(args.source, pool_size=6, playback_fps=args.playback_fps)
+    except (OSError, ValueError) as e:
+        print(f"Error opening frame source: {e}")
+        return 2
+    timer.mark('frame source')
     
     # 객체 검출기 생성
     detector = CustomDetector()
     
+    # 실시간 모드용 증분 검출기 (바뀐 화면 영역만 다시 처리, 작업자 풀을 쓰면 사용하지 않음)
+    incremental_detector = None if args.workers > 0 else IncrementalDetector(detector)
+    
+    # 캡처 시작 전에 모든 커널 컴파일 (디스크 캐시가 있으면 로드만 함)
+    width, height = screen_capture.capture_size
+    warm_up(detector, (height, width, 3), incremental_detector, timer=timer)
+    
+    # 단계별 시간 계측 (워밍업 이후부터 기록, 끄면 기록 비용 없음)
+    profiler = StageProfiler() if args.profile else None
+    if profiler is not None:
+        detector.profiler = profiler
+    
+    # 녹화기 (고정 크기 링 파일, 쓰기는 별도 스레드)
+    recorder = None
+    if args.record:
+        recorder = FrameRecorder(args.record, (height, width, 3), slots=args.record_frames)
+        print(f"Recording the last {args.record_frames} frames to {args.record}")
+    
+    # 모니터 창 미리보기 (세 패널을 한 버퍼에 합성, 큰 캡처 영역은 축소)
+    preview = PreviewCompositor(scale=args.preview_scale, max_panel_width=640, max_fps=args.preview_fps)
+    preview.warm_up((height, width, 3))
+    timer.mark('preview')
+    
     # 컨트롤 윈도우 생성 (루트 Tk 객체 및 큐 포함)
-    control_window = ControlWindow(screen_capture, detector)
-    data_queue = control_window.queue # 컨트롤 윈도우의 큐 참조
+    control_window = ControlWindow(screen_capture, detector, governor, profiler, preview)
+    data_queue = control_window.queue # 컨트롤 윈도우의 출력 버퍼 참조 (최신 결과 하나만 보관)
+    timer.mark('ui')
+    first_frame = []
     
-    def update_monitor_thread():
-        """화면 캡처 및 객체 검출 스레드 함수"""
-        while not exit_flag:
-            # === 모드 확인 ===
-            current_mode = control_window.monitoring_mode.get()
-            if current_mode == "static":
-                # 정적 모드일 때는 스레드가 할 일이 없음 (CPU 점유 방지 위해 짧은 sleep)
-                # sleep 대신 Event 사용 등으로 개선 가능
-                time.sleep(0.1) 
-                continue # 루프 다음 반복으로
-            # ================
-                
-            # === 실시간 모드 처리 ===
-            try:
-                frame = screen_capture.capture()
-                if frame is None:
-                    time.sleep(0.01) 
-                    continue
-                
-                result = detector.detect(frame)
-                
-                original_frame = frame 
-                mask_image = result['mask']
-                bbox_frame = result['bbox_frame']
-                
-                # 현재 HSV 범위 가져오기
-                hsv_ranges = (
-                    (detector.lower_color[0], detector.upper_color[0]),
-                    (detector.lower_color[1], detector.upper_color[1]),
-                    (detector.lower_color[2], detector.upper_color[2])
-                )
-                
-                # 데이터를 큐에 넣음
-                try:
-                    data_queue.put_nowait((original_frame, mask_image, bbox_frame, hsv_ranges))
-                except queue.Full:
-                    pass 
-                    
-                # time.sleep(0.01) # 실시간 처리를 위해 제거됨
-
-            except Exception as e:
-                if not exit_flag:
-                     print(f"Error in update_monitor_thread (realtime): {e}")
-                time.sleep(0.1) 
-            # ===================
-            
-        print("Update monitor thread finished.")
-
-    # 모니터링 스레드 시작
-    monitor_thread = threading.Thread(target=update_monitor_thread, daemon=True)
-    monitor_thread.start()
+    def package_result(frame, result):
+        """검출 결과를 UI 스레드로 보낼 항목으로 변환"""
+        if not first_frame:
+            first_frame.append(timer.mark('first frame'))
+            print(f"First frame ready {timer.total() * 1000.0:.1f} ms after start")
+        # 현재 HSV 범위 가져오기
+        hsv_ranges = (
+            (detector.lower_color[0], detector.upper_color[0]),
+            (detector.lower_color[1], detector.upper_color[1]),
+            (detector.lower_color[2], detector.upper_color[2])
+        )
+        if recorder is not None:
+            table = result.get('object_table')
+            if table is None:
+                table = CustomDetector.table_from_objects(result['objects'])
+            recorder.record(frame, result['mask'], table)
+        return (frame, result['mask'], result['bbox_frame'], hsv_ranges)
+    
+    # 캡처와 검출을 별도 스레드로 실행하는 파이프라인 (정적 모드에서는 캡처 중지)
+    if args.workers > 0:
+        # 검출을 작업자 프로세스들에 분산 (프레임은 공유 메모리 슬롯으로 전달)
+        pipeline = ProcessPoolRunner(
+            capture=screen_capture.capture,
+            detector=detector,
+            output=data_queue,
+            package=package_result,
+            frame_shape=(height, width, 3),
+            workers=args.workers,
+            governor=governor,
+            profiler=profiler
+        )
+    else:
+        pipeline = PipelineRunner(
+            capture=screen_capture.capture,
+            detect=incremental_detector.detect,
+            output=data_queue,
+            package=package_result,
+            governor=governor,
+            profiler=profiler,
+            release=screen_capture.release
+        )
+    # UI가 표시를 마친 마스크/바운딩 박스(작업자 풀 모드는 원본 프레임도)를 검출 단계의 풀에 돌려줌
+    control_window.release_result = pipeline.release if incremental_detector is None else incremental_detector.release
+    pipeline.start()
+    timer.mark('pipeline start')
+    print("Startup time breakdown:\n" + timer.report())
+    print(f"JIT kernels: {kernel_cache_stats()}")
     
     # 컨트롤 윈도우 시작 (Tkinter 메인 루프)
     try:
@@ -93,21 +166,25 @@ def main():
         if not exit_flag:
             exit_flag = True 
         
-        print("Signaling monitor thread to exit...")
-        # 큐에 종료 신호를 보내거나 exit_flag 확인으로 충분할 수 있음
-        try:
-             data_queue.put_nowait(None) # 큐 처리 루프 종료 신호
-        except queue.Full:
-             pass 
-             
-        print("Waiting for monitor thread to complete...")
-        monitor_thread.join(timeout=2.0) 
-        if monitor_thread.is_alive():
-             print("Warning: Monitor thread did not complete gracefully.")
-             
+        print("Signaling pipeline to exit...")
+        data_queue.put_nowait(None) # 큐 처리 루프 종료 신호
+        
+        print("Waiting for pipeline threads (and worker processes) to complete...")
+        pipeline.stop(timeout=2.0)
+        print(f"Pipeline stats: {pipeline.stats()}")
+        if incremental_detector is not None:
+            print(f"Result buffer stats: {incremental_detector.pool_stats()}")
+        if screen_capture.frame_pool is not None:
+            print(f"Frame pool stats: {screen_capture.frame_pool.stats()}")
+        if profiler is not None:
+            print("Stage timings: " + profiler.format_summary())
+        if recorder is not None:
+            recorder.close()
+            print(f"Recorder stats: {recorder.stats()}")
+        
         # ControlWindow의 start 메서드 finally 블록에서 Tk 윈도우 destroy 처리
             
         print("Application shutdown complete.")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main()) 
\ No newline at end of file
@@ -0,0 +1,127 @@
+"""
+캡처 프레임을 담는 미리 할당된 버퍼 풀
+"""
+
+import threading
+import numpy as np
+from typing import Optional, Tuple
+
+
+class FramePool:
+    """같은 모양의 프레임 버퍼를 빌려 주고 돌려받는 버퍼 풀
+
+    acquire()는 아무도 쓰지 않는 버퍼만 빌려 주며, 빌린 버퍼는 마지막 사용자가
+    release()할 때 빈 목록으로 돌아갑니다. 여러 단계가 같은 프레임을 보관하면
+    retain()으로 사용자 수를 늘립니다. 빈 버퍼가 없으면 timeout 동안 기다린 뒤
+    None을 반환하므로 (호출자는 그 프레임을 버림) 아직 읽고 있는 버퍼는 덮어써지지
+    않습니다. 따라서 size는 정확성이 아니라 단계들이 겹쳐 실행될 수 있는 정도를 정합니다.
+    """
+
+    def __init__(self, size: int = 6, dtype=np.uint8):
+        """버퍼 풀 초기화 (버퍼는 첫 acquire 때 할당)
+
+        Args:
+            size (int): 버퍼 수
+            dtype: 버퍼 자료형
+        """
+        if size < 1:
+            raise ValueError(f"Pool size must be positive: {size}")
+        self.size = size
+        self.dtype = np.dtype(dtype)
+        self._cond = threading.Condition()
+        self._buffers = []
+        self._index = {}  # id(버퍼) -> 버퍼 번호
+        self._refs = []   # 버퍼별 사용자 수
+        self._free = []   # 빈 버퍼 번호
+        self._shape = None
+        self.allocations = 0
+        self.starved = 0  # 빈 버퍼가 없어 None을 반환한 횟수
+
+    def _allocate(self, shape: Tuple[int, ...]):
+        # 이전 모양의 버퍼를 아직 쓰는 사용자가 있으면 그 버퍼는 풀에서 빠지고,
+        # 이후 release()는 무시됨
+        self._buffers = [np.empty(shape, dtype=self.dtype) for _ in range(self.size)]
+        self._index = {id(buf): i for i, buf in enumerate(self._buffers)}
+        self._refs = [0] * self.size
+        self._free = list(range(self.size))
+        self._shape = shape
+        self.allocations += self.size
+
+    def acquire(self, shape: Tuple[int, ...], timeout: float = 0.0) -> Optional[np.ndarray]:
+        """빈 버퍼를 빌림 (모양이 바뀌면 풀 전체를 다시 할당)
+
+        Args:
+            shape (Tuple[int, ...]): 필요한 버퍼 모양
+            timeout (float): 빈 버퍼가 없을 때 기다릴 최대 시간(초)
+
+        Returns:
+            Optional[np.ndarray]: 사용자 수가 1인 C 연속 버퍼 (내용은 이전 프레임 값),
+                                  빈 버퍼가 없으면 None
+        """
+        shape = tuple(shape)
+        with self._cond:
+            if shape != self._shape:
+                self._allocate(shape)
+            if not self._free and timeout > 0:
+                self._cond.wait_for(lambda: self._free or self._shape != shape, timeout)
+                if self._shape != shape:
+                    self._allocate(shape)
+            if not self._free:
+                self.starved += 1
+                return None
+            i = self._free.pop()
+            self._refs[i] = 1
+            return self._buffers[i]
+
+    def acquire_or_allocate(self, shape: Tuple[int, ...]) -> np.ndarray:
+        """빈 버퍼를 빌리고, 없으면 풀 밖의 새 배열을 반환 (그 배열의 release()는 무시됨)
+
+        결과 버퍼처럼 버릴 수 없는 출력에 사용합니다. 사용자가 버퍼를 돌려주지 않아도
+        할당이 다시 생길 뿐 내용이 덮어써지지는 않습니다.
+        """
+        buf = self.acquire(shape)
+        return buf if buf is not None else np.empty(shape, dtype=self.dtype)
+
+    def retain(self, buf: np.ndarray) -> bool:
+        """빌린 버퍼의 사용자 수를 1 늘림
+
+        Returns:
+            bool: 풀에서 빌린 버퍼이면 True (그 외의 배열은 무시)
+        """
+        with self._cond:
+            i = self._index.get(id(buf))
+            if i is None or self._refs[i] == 0:
+                return False
+            self._refs[i] += 1
+            return True
+
+    def release(self, buf: np.ndarray) -> bool:
+        """버퍼 사용을 마침 (사용자 수가 0이 되면 빈 목록으로 돌려놓음)
+
+        풀 버퍼가 아닌 배열(새로 할당한 프레임, 공유 메모리 슬롯 등)은 무시하므로
+        호출자는 프레임 출처와 관계없이 release()를 부를 수 있습니다.
+
+        Returns:
+            bool: 풀에서 빌린 버퍼이면 True
+        """
+        with self._cond:
+            i = self._index.get(id(buf))
+            if i is None or self._buffers[i] is not buf or self._refs[i] == 0:
+                return False
+            self._refs[i] -= 1
+            if self._refs[i] == 0:
+                self._free.append(i)
+                self._cond.notify()
+            return True
+
+    @property
+    def available(self) -> int:
+        """지금 빌릴 수 있는 버퍼 수 (첫 acquire 전에는 size)"""
+        with self._cond:
+            return len(self._free) if self._shape is not None else self.size
+
+    def stats(self) -> dict:
+        """할당/부족 횟수"""
+        with self._cond:
+            return {'size': self.size, 'available': len(self._free) if self._shape is not None else self.size,
+                    'allocations': self.allocations, 'starved': self.starved}
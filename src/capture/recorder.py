@@ -0,0 +1,333 @@
+"""
+검출 결과 녹화 (메모리 매핑 링 파일)
+
+캡처 프레임, 비트 패킹한 마스크, 프레임별 객체 표(OBJECT_DTYPE)를 고정 크기 링
+파일에 기록합니다. 파일 크기는 만들 때 정해지며(슬롯 수 x 슬롯 크기), 가득 차면
+가장 오래된 프레임부터 덮어씁니다.
+
+파일 구성 (리틀 엔디언)
+- 헤더 (HEADER_DTYPE, DATA_ALIGN 바이트로 채움)
+- 색인: 슬롯마다 INDEX_DTYPE 하나 (seq가 -1이면 빈 슬롯 또는 쓰는 중,
+  헤더의 written 이상이면 헤더가 아직 갱신되지 않은 슬롯)
+- 슬롯: [프레임 H*W*C][마스크 H*ceil(W/8)][객체 표 max_objects*ARCHIVE_OBJECT_DTYPE] (DATA_ALIGN 정렬)
+
+FrameRecorder는 쓰기를 별도 스레드에서 처리하므로 record()는 프레임 복사 후 바로
+반환합니다. 쓰기가 밀리면 기다리지 않고 그 프레임을 버립니다. ArchiveReader는 파일을
+메모리 매핑으로 열어 필요한 프레임만 읽습니다.
+"""
+
+import queue
+import threading
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src.capture.sources import SequenceSource
+from src.detection.custom_detector import OBJECT_DTYPE
+
+ARCHIVE_MAGIC = b'HSVA'
+ARCHIVE_VERSION = 1
+DATA_ALIGN = 4096
+
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S4'),
+    ('version', '<u4'),
+    ('slots', '<u4'),
+    ('height', '<u4'),
+    ('width', '<u4'),
+    ('channels', '<u4'),
+    ('max_objects', '<u4'),
+    ('slot_size', '<u4'),
+    ('index_offset', '<u8'),
+    ('data_offset', '<u8'),
+    ('written', '<u8'),     # 지금까지 기록을 마친 프레임 수 (다음 seq)
+])
+
+# 파일에 저장하는 객체 표 (OBJECT_DTYPE과 같은 필드, 플랫폼과 관계없이 리틀 엔디언)
+ARCHIVE_OBJECT_DTYPE = OBJECT_DTYPE.newbyteorder('<')
+
+INDEX_DTYPE = np.dtype([
+    ('seq', '<i8'),         # 녹화 순번 (-1: 비어 있음)
+    ('time', '<f8'),        # 유닉스 시각
+    ('objects', '<u4'),     # 검출된 객체 수 (max_objects보다 많으면 앞부분만 저장)
+    ('reserved', '<u4'),
+])
+
+
+def _align(size: int) -> int:
+    return (size + DATA_ALIGN - 1) // DATA_ALIGN * DATA_ALIGN
+
+
+def _layout(frame_shape: Tuple[int, int, int], max_objects: int) -> Tuple[int, int, int, int]:
+    """(프레임 바이트, 마스크 바이트, 객체 표 바이트, 슬롯 크기)"""
+    height, width, channels = frame_shape
+    frame_bytes = height * width * channels
+    mask_bytes = height * ((width + 7) // 8)
+    table_bytes = max_objects * ARCHIVE_OBJECT_DTYPE.itemsize
+    return frame_bytes, mask_bytes, table_bytes, _align(frame_bytes + mask_bytes + table_bytes)
+
+
+def archive_size(frame_shape: Tuple[int, int, int], slots: int, max_objects: int = 256) -> int:
+    """녹화 파일 크기(바이트)"""
+    slot_size = _layout(frame_shape, max_objects)[3]
+    return _align(HEADER_DTYPE.itemsize) + _align(slots * INDEX_DTYPE.itemsize) + slots * slot_size
+
+
+class _ArchiveViews:
+    """메모리 매핑 파일 위의 헤더/색인/슬롯 뷰"""
+
+    def __init__(self, mm: np.memmap):
+        self.mm = mm
+        self.header = mm[:HEADER_DTYPE.itemsize].view(HEADER_DTYPE)
+        h = self.header[0]
+        if h['magic'] != ARCHIVE_MAGIC or h['version'] != ARCHIVE_VERSION:
+            raise ValueError(f"Not a recording archive (magic {bytes(h['magic'])!r}, "
+                             f"version {int(h['version'])})")
+        self.slots = int(h['slots'])
+        self.frame_shape = (int(h['height']), int(h['width']), int(h['channels']))
+        self.max_objects = int(h['max_objects'])
+        self.frame_bytes, self.mask_bytes, self.table_bytes, slot_size = _layout(
+            self.frame_shape, self.max_objects)
+        index_offset, data_offset = int(h['index_offset']), int(h['data_offset'])
+        self.index = mm[index_offset:index_offset + self.slots * INDEX_DTYPE.itemsize].view(INDEX_DTYPE)
+        self.data = mm[data_offset:data_offset + self.slots * slot_size].reshape(self.slots, slot_size)
+
+    def frame(self, slot: int) -> np.ndarray:
+        return self.data[slot, :self.frame_bytes].reshape(self.frame_shape)
+
+    def packed_mask(self, slot: int) -> np.ndarray:
+        start = self.frame_bytes
+        return self.data[slot, start:start + self.mask_bytes].reshape(self.frame_shape[0], -1)
+
+    def table(self, slot: int) -> np.ndarray:
+        start = self.frame_bytes + self.mask_bytes
+        return self.data[slot, start:start + self.table_bytes].view(ARCHIVE_OBJECT_DTYPE)
+
+
+class FrameRecorder:
+    """프레임/마스크/객체 표를 링 파일에 기록하는 녹화기
+
+    record()는 어느 스레드에서든 호출할 수 있으며 디스크 쓰기를 기다리지 않습니다.
+    """
+
+    def __init__(self, path: str, frame_shape: Tuple[int, int, int], slots: int = 600,
+                 max_objects: int = 256, queue_size: int = 8, flush_interval: float = 1.0):
+        """녹화 파일 생성 (같은 이름의 파일은 덮어씀) 및 쓰기 스레드 시작
+
+        Args:
+            path (str): 녹화 파일 경로
+            frame_shape (Tuple[int, int, int]): 프레임 모양 (H, W, C)
+            slots (int): 보관할 최대 프레임 수 (파일 크기는 archive_size() 참고)
+            max_objects (int): 프레임마다 저장할 최대 객체 수
+            queue_size (int): 쓰기 대기 프레임 수 (넘치면 새 프레임을 버림)
+            flush_interval (float): 변경 내용을 디스크에 내보내는 주기(초)
+        """
+        if slots < 1 or max_objects < 0:
+            raise ValueError(f"Invalid archive geometry: slots={slots}, max_objects={max_objects}")
+        self.path = path
+        self.frame_shape = tuple(frame_shape)
+        height, width, channels = self.frame_shape
+        slot_size = _layout(self.frame_shape, max_objects)[3]
+        index_offset = _align(HEADER_DTYPE.itemsize)
+        data_offset = index_offset + _align(slots * INDEX_DTYPE.itemsize)
+
+        mm = np.memmap(path, dtype=np.uint8, mode='w+',
+                       shape=(archive_size(self.frame_shape, slots, max_objects),))
+        header = mm[:HEADER_DTYPE.itemsize].view(HEADER_DTYPE)
+        header[0] = (ARCHIVE_MAGIC, ARCHIVE_VERSION, slots, height, width, channels,
+                     max_objects, slot_size, index_offset, data_offset, 0)
+        self._views = _ArchiveViews(mm)
+        self._views.index['seq'] = -1
+        mm.flush()
+
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._seq = 0
+        self.recorded = 0
+        self.dropped = 0          # 쓰기가 밀려 버린 프레임 수
+        self.truncated = 0        # 객체 수가 max_objects를 넘어 일부만 저장한 프레임 수
+        self._thread = threading.Thread(target=self._write_loop, name='recorder-writer', daemon=True)
+        self._thread.start()
+
+    def record(self, frame: np.ndarray, mask: np.ndarray, objects: np.ndarray,
+               timestamp: Optional[float] = None) -> bool:
+        """프레임 하나를 기록 대기열에 넣음 (기다리지 않음)
+
+        frame과 mask는 버퍼 풀에서 다시 쓰일 수 있으므로 frame은 복사하고 mask는 바로
+        비트로 압축하며, objects는 이후 수정되지 않는다고 보고 그대로 넘깁니다.
+
+        Args:
+            frame (np.ndarray): (H, W, C) 프레임
+            mask (np.ndarray): (H, W) 이진 마스크 (0이 아니면 객체)
+            objects (np.ndarray): OBJECT_DTYPE 객체 표
+            timestamp (Optional[float]): 유닉스 시각 (기본값: 현재 시각)
+
+        Returns:
+            bool: 대기열에 넣었으면 True, 쓰기가 밀려 버렸으면 False
+        """
+        if frame.shape != self.frame_shape:
+            raise ValueError(f"Frame shape {frame.shape} does not match archive {self.frame_shape}")
+        item = (frame.copy(), np.packbits(mask != 0, axis=1), objects, time.time() if timestamp is None else timestamp)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def _write_loop(self):
+        """쓰기 스레드: 대기열의 프레임을 다음 슬롯에 기록"""
+        views = self._views
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = ()
+            if item is None:
+                break
+            if item:
+                self._write(*item)
+            if time.monotonic() - last_flush >= self.flush_interval:
+                views.mm.flush()
+                last_flush = time.monotonic()
+        views.mm.flush()
+
+    def _write(self, frame: np.ndarray, packed_mask: np.ndarray, objects: np.ndarray, timestamp: float):
+        views = self._views
+        seq = self._seq
+        slot = seq % views.slots
+        entry = views.index[slot:slot + 1]
+        # 쓰는 동안 읽는 쪽이 섞인 내용을 보지 않도록 먼저 슬롯을 비움 표시
+        entry['seq'] = -1
+        views.frame(slot)[...] = frame
+        views.packed_mask(slot)[...] = packed_mask
+        count = len(objects)
+        stored = min(count, views.max_objects)
+        # 필드별로 리틀 엔디언으로 변환하여 기록
+        views.table(slot)[:stored] = np.asarray(objects[:stored], dtype=OBJECT_DTYPE).astype(ARCHIVE_OBJECT_DTYPE)
+        if stored < count:
+            self.truncated += 1
+        entry['time'] = timestamp
+        entry['objects'] = count
+        entry['seq'] = seq
+        self._seq = seq + 1
+        views.header['written'] = self._seq
+        self.recorded += 1
+
+    def close(self, timeout: float = 5.0):
+        """대기 중인 프레임을 모두 기록하고 파일을 닫음"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=timeout)
+        if not self._thread.is_alive():
+            self._views = None  # 메모리 매핑 해제
+
+    def stats(self) -> dict:
+        """기록/버림 통계"""
+        return {'recorded': self.recorded, 'dropped': self.dropped, 'truncated': self.truncated,
+                'pending': self._queue.qsize()}
+
+
+class ArchiveReader:
+    """녹화 파일 임의 접근 읽기 (메모리 매핑, 읽은 프레임만 메모리에 올림)
+
+    녹화 중인 파일도 열 수 있으며, refresh()로 새로 기록된 프레임을 반영합니다.
+    위치 i는 남아 있는 프레임 중 오래된 순서입니다.
+    """
+
+    def __init__(self, path: str):
+        """녹화 파일 열기
+
+        Raises:
+            ValueError: 녹화 파일 형식이 아닌 경우
+        """
+        self.path = path
+        self._views = _ArchiveViews(np.memmap(path, dtype=np.uint8, mode='r'))
+        self.frame_shape = self._views.frame_shape
+        self.max_objects = self._views.max_objects
+        self.refresh()
+
+    def refresh(self):
+        """색인을 다시 읽어 남아 있는 프레임 목록 갱신
+
+        색인의 seq는 헤더의 written보다 먼저 기록되므로, written 이상인 seq는 기록이
+        끝나지 않은(또는 디스크에 일부만 반영된) 슬롯으로 보고 제외합니다. 마지막
+        slots개 범위보다 오래된 seq도 덮어쓰는 중에 남은 값이므로 제외합니다.
+        """
+        written = int(self._views.header[0]['written'])
+        index = np.array(self._views.index)
+        seq = index['seq']
+        valid = np.flatnonzero((seq >= 0) & (seq < written) & (seq >= written - self._views.slots))
+        order = np.argsort(index['seq'][valid], kind='stable')
+        self._slots = valid[order]
+        self.seqs = index['seq'][self._slots]
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _slot(self, i: int) -> int:
+        return int(self._slots[i])
+
+    def frame(self, i: int) -> np.ndarray:
+        """i번째 프레임 (파일을 가리키는 읽기 전용 뷰)"""
+        return self._views.frame(self._slot(i))
+
+    def mask(self, i: int) -> np.ndarray:
+        """i번째 마스크 (H, W) uint8 (0 또는 255)"""
+        width = self.frame_shape[1]
+        bits = np.unpackbits(self._views.packed_mask(self._slot(i)), axis=1, count=width)
+        return bits * np.uint8(255)
+
+    def objects(self, i: int) -> np.ndarray:
+        """i번째 프레임의 OBJECT_DTYPE 객체 표 (플랫폼 바이트 순서로 변환한 복사본)"""
+        slot = self._slot(i)
+        count = min(int(self._views.index[slot]['objects']), self.max_objects)
+        return self._views.table(slot)[:count].astype(OBJECT_DTYPE)
+
+    def timestamp(self, i: int) -> float:
+        """i번째 프레임의 유닉스 시각"""
+        return float(self._views.index[self._slot(i)]['time'])
+
+    def find(self, seq: int) -> Optional[int]:
+        """녹화 순번 seq인 프레임의 위치 (덮어써졌으면 None)"""
+        i = int(np.searchsorted(self.seqs, seq))
+        if i < len(self.seqs) and self.seqs[i] == seq:
+            return i
+        return None
+
+    def read(self, i: int) -> dict:
+        """i번째 기록 전체
+
+        Returns:
+            dict: {'seq', 'time', 'frame', 'mask', 'objects'}
+        """
+        return {'seq': int(self.seqs[i]), 'time': self.timestamp(i), 'frame': self.frame(i),
+                'mask': self.mask(i), 'objects': self.objects(i)}
+
+
+class RecordingSource(SequenceSource):
+    """녹화 파일의 프레임을 FrameSource로 재생 (녹화 당시의 입력을 파이프라인에 다시 넣음)"""
+
+    def __init__(self, path: str, pool_size: int = 0, playback_fps: Optional[float] = None,
+                 loop: bool = True):
+        """녹화 재생 소스 초기화
+
+        Args:
+            path (str): 녹화 파일 경로
+            pool_size (int): capture() 버퍼 풀 크기
+            playback_fps (Optional[float]): 재생 속도 (None이면 최대 속도)
+            loop (bool): 마지막 프레임 뒤에 처음부터 반복
+        """
+        self.reader = ArchiveReader(path)
+        super().__init__(len(self.reader), self.reader.frame_shape, pool_size, playback_fps, loop)
+
+    def frame_at(self, index: int) -> np.ndarray:
+        return self.reader.frame(index)[:, :, :3]
+
+
+def is_recording(path: str) -> bool:
+    """path가 녹화 파일인지 여부 (매직 바이트 확인)"""
+    with open(path, 'rb') as f:
+        return f.read(len(ARCHIVE_MAGIC)) == ARCHIVE_MAGIC
@@ -5,6 +5,7 @@
 from mss import mss
 import numpy as np
 import threading
+from src.capture.sources import FrameSource
 
 # 스레드 로컬 저장소 생성
 _thread_local = threading.local()
@@ -15,11 +16,17 @@ def get_sct():
         _thread_local.sct = mss()
     return _thread_local.sct
 
-class ScreenCapture:
-    def __init__(self, capture_size=(320, 320)):
-        """화면 캡처 클래스 초기화"""
+class ScreenCapture(FrameSource):
+    def __init__(self, capture_size=(320, 320), pool_size=0):
+        """화면 캡처 클래스 초기화
+        
+        Args:
+            capture_size: 캡처 영역 (너비, 높이)
+            pool_size: 0보다 크면 capture()가 이 개수의 미리 할당된 버퍼를 돌려 쓰며
+                       프레임마다 새 배열을 만들지 않음 (FramePool 참고)
+        """
         # self.sct = mss() # 제거: 스레드별 인스턴스 사용
-        self.capture_size = capture_size
+        super().__init__(capture_size, pool_size)
         
         # 모니터 정보는 초기화 시 한 번만 가져옴
         with mss() as sct: # 임시 mss 인스턴스 사용
@@ -40,8 +47,27 @@ class ScreenCapture:
             return True
         return False
         
-    def capture(self):
-        """선택된 모니터의 중앙 영역을 캡처하여 numpy 배열로 반환"""
+    def read(self):
+        """선택된 모니터의 중앙 영역을 RGB 순서 뷰로 반환 (capture()가 버퍼에 복사)
+        
+        Returns:
+            (H, W, 3) mss 원본 버퍼의 뷰 (BGRA -> BGR -> RGB 순서), 실패 시 None
+        """
+        raw = self.capture_raw()
+        if raw is None:
+            return None
+        # 복사는 capture()에서 출력 버퍼로 한 번만 수행
+        return raw[:, :, 2::-1]
+        
+    def capture_raw(self):
+        """선택된 모니터의 중앙 영역을 캡처하여 mss 원본 BGRA 버퍼의 뷰로 반환
+        
+        복사 없이 mss가 채운 바이트 배열을 그대로 가리키므로, 검출기에
+        layout=LAYOUT_BGRA로 바로 넘길 수 있습니다.
+        
+        Returns:
+            (H, W, 4) uint8 배열 (BGRA), 실패 시 None
+        """
         sct = get_sct() # 스레드별 mss 인스턴스 가져오기
         
         try:
@@ -84,8 +110,8 @@ class ScreenCapture:
                  "mon": monitor_number_for_mss # 어떤 모니터에서 가져올지 명시
              }
              screen = sct.grab(grab_region)
-             # BGR 순서로 반환되도록 처리 (mss는 BGRA 반환)
-             return np.array(screen)[:, :, :3][:, :, ::-1] # BGRA -> BGR -> RGB (RGB로 반환해야 함)
+             # mss는 BGRA 바이트 배열을 반환하므로 복사 없이 배열로 해석
+             return np.frombuffer(screen.raw, dtype=np.uint8).reshape(screen.height, screen.width, 4)
         except Exception as e:
              print(f"Error capturing screen: {e}")
              return None
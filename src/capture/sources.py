@@ -0,0 +1,380 @@
+"""
+프레임 소스 (화면 캡처 외의 입력)
+
+실시간 파이프라인과 ControlWindow는 FrameSource 인터페이스만 사용하므로, 화면
+(ScreenCapture) 대신 파일이나 합성 장면을 넣어 디스플레이 없이 같은 프레임으로
+반복 측정할 수 있습니다.
+
+- ImageFolderSource: 폴더의 .npy / .ppm(P6) 이미지를 이름 순서로 재생
+- ArchiveSource: 프레임 묶음 파일을 메모리 매핑으로 재생 (.npy 또는 RAW_HEADER 형식)
+- SyntheticSource: 시드로 결정되는 합성 장면(src/capture/synthetic.py) 재생
+- RecordingSource: 녹화 파일(src/capture/recorder.py)의 프레임 재생
+
+모든 소스의 프레임 채널 배치는 ScreenCapture.capture 출력(LAYOUT_RGB)과 같다고 봅니다.
+"""
+
+import abc
+import os
+import struct
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.capture.frame_pool import FramePool
+
+# 프레임 묶음 파일 헤더: 매직 b'HSVR', 버전, 프레임 수, 높이, 너비, 채널 수 (리틀 엔디언)
+# 헤더 뒤에 (프레임 수, 높이, 너비, 채널 수) uint8 프레임이 이어짐
+RAW_MAGIC = b'HSVR'
+RAW_VERSION = 1
+RAW_HEADER = struct.Struct('<4sIIIII')
+
+IMAGE_EXTENSIONS = ('.npy', '.ppm')
+
+
+class FrameSource(abc.ABC):
+    """프레임 소스 기본 클래스
+
+    하위 클래스는 read()만 구현하면 되며, capture()가 재생 속도 조절과 출력 버퍼
+    (버퍼 풀, 공유 메모리 슬롯) 복사를 처리합니다. 모니터 선택을 지원하지 않는
+    소스는 프레임 크기의 모니터 하나만 있는 것으로 보입니다.
+    """
+
+    def __init__(self, capture_size: Tuple[int, int], pool_size: int = 0,
+                 playback_fps: Optional[float] = None):
+        """프레임 소스 초기화
+
+        Args:
+            capture_size (Tuple[int, int]): 프레임 크기 (너비, 높이)
+            pool_size (int): 0보다 크면 capture()가 이 개수의 버퍼를 빌려 씀 (FramePool 참고,
+                             다 쓴 프레임은 release()로 돌려줘야 함)
+            playback_fps (Optional[float]): 재생 속도 (None 또는 0이면 최대 속도)
+        """
+        self.capture_size = tuple(capture_size)
+        self.frame_pool = FramePool(pool_size) if pool_size > 0 else None
+        self.pool_timeout = 0.05 # 초 (빈 버퍼를 기다리는 최대 시간, 넘으면 프레임을 버림)
+        self.playback_fps = playback_fps if playback_fps and playback_fps > 0 else None
+        self.selected_monitor_index = 0
+        self._deadline = None
+
+    @property
+    def exhausted(self) -> bool:
+        """반복하지 않는 소스가 끝에 닿았는지 여부 (True이면 capture()가 계속 None 반환)"""
+        return False
+
+    @abc.abstractmethod
+    def read(self) -> Optional[np.ndarray]:
+        """다음 프레임 (H, W, 3) 반환 (다음 read 호출 전까지만 유효한 뷰여도 됨)
+
+        Returns:
+            Optional[np.ndarray]: 프레임, 더 이상 없거나 실패하면 None
+        """
+
+    def get_monitors(self) -> List[dict]:
+        """사용 가능한 모니터 목록 반환"""
+        width, height = self.capture_size
+        return [{'left': 0, 'top': 0, 'width': width, 'height': height}]
+
+    def select_monitor(self, monitor_index: int) -> bool:
+        """캡처할 모니터 선택 (인덱스 기준)"""
+        if 0 <= monitor_index < len(self.get_monitors()):
+            self.selected_monitor_index = monitor_index
+            return True
+        return False
+
+    def _wait_playback(self):
+        """재생 속도에 맞춰 다음 프레임 시각까지 대기 (한 주기 이상 밀리면 현재 시각에 다시 맞춤)"""
+        if self.playback_fps is None:
+            return
+        interval = 1.0 / self.playback_fps
+        now = time.monotonic()
+        if self._deadline is None or now - self._deadline > interval:
+            self._deadline = now
+        elif self._deadline > now:
+            time.sleep(self._deadline - now)
+        self._deadline += interval
+
+    def _output_buffer(self, shape: Tuple[int, int, int], use_pool: bool,
+                       out: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """프레임을 채울 버퍼 (out 지정 > 버퍼 풀 > 새 배열 순서)"""
+        if out is not None:
+            if out.shape != shape:
+                print(f"Error: capture buffer shape {out.shape} does not match {shape[:2]}")
+                return None
+            return out
+        if use_pool and self.frame_pool is not None:
+            return self.frame_pool.acquire(shape, self.pool_timeout)
+        return np.empty(shape, dtype=np.uint8)
+
+    def capture(self, use_pool: bool = True, out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """다음 프레임을 버퍼에 복사하여 반환
+
+        Args:
+            use_pool: 버퍼 풀이 있으면 풀의 버퍼에 채워 반환 (오래 보관할 프레임은 False)
+            out: 결과를 채울 (H, W, 3) uint8 버퍼 (공유 메모리 슬롯 등, 지정 시 풀 미사용)
+
+        Returns:
+            (H, W, 3) C 연속 쓰기 가능 배열 (채널 순서는 LAYOUT_RGB),
+            실패하거나 풀에 빈 버퍼가 없으면 None
+        """
+        self._wait_playback()
+        frame = self.read()
+        if frame is None:
+            return None
+        out = self._output_buffer((frame.shape[0], frame.shape[1], 3), use_pool, out)
+        if out is None:
+            return None
+        out[...] = frame
+        return out
+
+    def release(self, frame: Optional[np.ndarray]):
+        """capture()가 반환한 프레임 사용을 마침 (풀 버퍼가 아니면 무시)
+
+        프레임을 마지막으로 읽는 쪽이 호출하며, 이후 그 버퍼는 다음 캡처에 다시 쓰입니다.
+        """
+        if frame is not None and self.frame_pool is not None:
+            self.frame_pool.release(frame)
+
+
+class SequenceSource(FrameSource):
+    """인덱스로 프레임을 꺼내는 유한 소스 (끝에 닿으면 처음부터 반복하거나 None 반환)"""
+
+    def __init__(self, count: int, frame_shape: Tuple[int, int, int], pool_size: int = 0,
+                 playback_fps: Optional[float] = None, loop: bool = True):
+        if count < 1:
+            raise ValueError("Frame source has no frames")
+        super().__init__((frame_shape[1], frame_shape[0]), pool_size, playback_fps)
+        self.count = count
+        self.loop = loop
+        self.position = 0
+
+    @abc.abstractmethod
+    def frame_at(self, index: int) -> np.ndarray:
+        """index번째 프레임 (H, W, 3) 반환 (0 <= index < count)"""
+
+    def read(self) -> Optional[np.ndarray]:
+        if self.position >= self.count:
+            if not self.loop:
+                return None
+            self.position = 0
+        frame = self.frame_at(self.position)
+        self.position += 1
+        return frame
+
+    @property
+    def exhausted(self) -> bool:
+        return not self.loop and self.position >= self.count
+
+    def rewind(self):
+        """처음 프레임부터 다시 재생"""
+        self.position = 0
+        self._deadline = None
+
+    def __len__(self) -> int:
+        return self.count
+
+
+def read_ppm(path: str) -> np.ndarray:
+    """바이너리 PPM(P6, 최댓값 255) 파일을 (H, W, 3) uint8 배열로 읽기
+
+    Raises:
+        ValueError: 지원하지 않는 형식인 경우
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    # 헤더: 매직, 너비, 높이, 최댓값 (공백으로 구분, '#' 주석 가능) 뒤에 공백 한 글자
+    fields = []
+    pos = 0
+    while len(fields) < 4:
+        while pos < len(data) and data[pos:pos + 1].isspace():
+            pos += 1
+        if data[pos:pos + 1] == b'#':
+            pos = data.index(b'\n', pos) + 1
+            continue
+        start = pos
+        while pos < len(data) and not data[pos:pos + 1].isspace():
+            pos += 1
+        fields.append(data[start:pos])
+    if fields[0] != b'P6' or int(fields[3]) != 255:
+        raise ValueError(f"Unsupported PPM file (P6 with maxval 255 only): {path}")
+    width, height = int(fields[1]), int(fields[2])
+    pixels = np.frombuffer(data, dtype=np.uint8, count=width * height * 3, offset=pos + 1)
+    return pixels.reshape(height, width, 3)
+
+
+def write_ppm(path: str, frame: np.ndarray):
+    """(H, W, 3) uint8 배열을 바이너리 PPM(P6)으로 저장"""
+    height, width = frame.shape[:2]
+    with open(path, 'wb') as f:
+        f.write(f'P6 {width} {height} 255 '.encode())
+        f.write(np.ascontiguousarray(frame, dtype=np.uint8).tobytes())
+
+
+class ImageFolderSource(SequenceSource):
+    """폴더의 이미지 파일(.npy, .ppm)을 파일 이름 순서로 재생
+
+    preload=True이면 시작 시 모든 파일을 메모리에 읽어 두어 재생 중 디스크 읽기가
+    측정에 섞이지 않습니다. 모든 이미지는 크기가 같아야 합니다.
+    """
+
+    def __init__(self, path: str, pool_size: int = 0, playback_fps: Optional[float] = None,
+                 loop: bool = True, preload: bool = True):
+        """이미지 폴더 소스 초기화
+
+        Args:
+            path (str): 이미지 폴더 경로
+            pool_size (int): capture() 버퍼 풀 크기
+            playback_fps (Optional[float]): 재생 속도 (None이면 최대 속도)
+            loop (bool): 마지막 이미지 뒤에 처음부터 반복
+            preload (bool): 시작 시 모든 이미지를 메모리에 읽음
+
+        Raises:
+            ValueError: 이미지가 없거나 크기가 다른 경우
+        """
+        self.paths = sorted(os.path.join(path, name) for name in os.listdir(path)
+                            if name.lower().endswith(IMAGE_EXTENSIONS))
+        if not self.paths:
+            raise ValueError(f"No {'/'.join(IMAGE_EXTENSIONS)} images in {path}")
+        first = self._load(self.paths[0])
+        self._frames = [first] + [self._load(p) for p in self.paths[1:]] if preload else None
+        if self._frames is not None:
+            for p, frame in zip(self.paths, self._frames):
+                if frame.shape != first.shape:
+                    raise ValueError(f"Image size {frame.shape} of {p} differs from {first.shape}")
+        super().__init__(len(self.paths), first.shape, pool_size, playback_fps, loop)
+
+    @staticmethod
+    def _load(path: str) -> np.ndarray:
+        if path.lower().endswith('.npy'):
+            frame = np.load(path)
+        else:
+            frame = read_ppm(path)
+        if frame.ndim != 3 or frame.shape[2] < 3 or frame.dtype != np.uint8:
+            raise ValueError(f"Expected (H, W, 3) uint8 image: {path} {frame.shape} {frame.dtype}")
+        return frame[:, :, :3]
+
+    def frame_at(self, index: int) -> np.ndarray:
+        if self._frames is not None:
+            return self._frames[index]
+        return self._load(self.paths[index])
+
+
+def save_frame_archive(path: str, frames: np.ndarray):
+    """(N, H, W, 3) uint8 프레임을 RAW_HEADER 형식 파일로 저장"""
+    frames = np.ascontiguousarray(frames, dtype=np.uint8)
+    count, height, width, channels = frames.shape
+    with open(path, 'wb') as f:
+        f.write(RAW_HEADER.pack(RAW_MAGIC, RAW_VERSION, count, height, width, channels))
+        f.write(frames.tobytes())
+
+
+def open_frame_archive(path: str) -> np.ndarray:
+    """프레임 묶음 파일을 읽기 전용 메모리 매핑 (N, H, W, C) 배열로 열기
+
+    .npy 파일 ((N, H, W, C) 또는 (H, W, C)) 또는 RAW_HEADER 형식 파일을 지원합니다.
+
+    Raises:
+        ValueError: 형식이 맞지 않는 경우
+    """
+    if path.lower().endswith('.npy'):
+        frames = np.load(path, mmap_mode='r')
+        if frames.ndim == 3:
+            frames = frames[np.newaxis]
+    else:
+        with open(path, 'rb') as f:
+            header = f.read(RAW_HEADER.size)
+        if len(header) < RAW_HEADER.size:
+            raise ValueError(f"Truncated frame archive header: {path}")
+        magic, version, count, height, width, channels = RAW_HEADER.unpack(header)
+        if magic != RAW_MAGIC or version != RAW_VERSION:
+            raise ValueError(f"Not a frame archive (magic {magic!r}, version {version}): {path}")
+        frames = np.memmap(path, dtype=np.uint8, mode='r', offset=RAW_HEADER.size,
+                           shape=(count, height, width, channels))
+    if frames.ndim != 4 or frames.shape[3] < 3 or frames.dtype != np.uint8:
+        raise ValueError(f"Expected (N, H, W, 3) uint8 frames: {path} {frames.shape} {frames.dtype}")
+    return frames
+
+
+class ArchiveSource(SequenceSource):
+    """프레임 묶음 파일을 메모리 매핑으로 재생 (파일 전체를 메모리에 올리지 않음)"""
+
+    def __init__(self, path: str, pool_size: int = 0, playback_fps: Optional[float] = None,
+                 loop: bool = True):
+        """프레임 묶음 소스 초기화
+
+        Args:
+            path (str): .npy 또는 RAW_HEADER 형식 파일 경로
+            pool_size (int): capture() 버퍼 풀 크기
+            playback_fps (Optional[float]): 재생 속도 (None이면 최대 속도)
+            loop (bool): 마지막 프레임 뒤에 처음부터 반복
+        """
+        self.frames = open_frame_archive(path)
+        super().__init__(len(self.frames), self.frames.shape[1:], pool_size, playback_fps, loop)
+
+    def frame_at(self, index: int) -> np.ndarray:
+        return self.frames[index, :, :, :3]
+
+
+class SyntheticSource(SequenceSource):
+    """시드로 결정되는 합성 장면을 차례로 재생 (매 실행 같은 프레임)"""
+
+    def __init__(self, scene: str = 'sparse_blobs', size: Tuple[int, int] = (320, 320),
+                 frames: int = 30, seed: int = 0, pool_size: int = 0,
+                 playback_fps: Optional[float] = None, loop: bool = True):
+        """합성 소스 초기화
+
+        Args:
+            scene (str): 장면 종류 (synthetic.SCENES)
+            size (Tuple[int, int]): 프레임 크기 (너비, 높이)
+            frames (int): 서로 다른 시드로 미리 만들어 둘 프레임 수
+            seed (int): 첫 프레임의 시드 (i번째 프레임은 seed + i)
+            pool_size (int): capture() 버퍼 풀 크기
+            playback_fps (Optional[float]): 재생 속도 (None이면 최대 속도)
+            loop (bool): 마지막 프레임 뒤에 처음부터 반복
+        """
+        from src.capture.synthetic import make_scene
+        self.scene = scene
+        self._frames = [make_scene(scene, size, seed + i) for i in range(frames)]
+        super().__init__(frames, self._frames[0].shape, pool_size, playback_fps, loop)
+
+    def frame_at(self, index: int) -> np.ndarray:
+        return self._frames[index]
+
+
+def open_source(spec: str = 'screen', capture_size: Tuple[int, int] = (320, 320),
+                pool_size: int = 0, playback_fps: Optional[float] = None,
+                loop: bool = True) -> FrameSource:
+    """문자열로 지정한 프레임 소스 열기
+
+    Args:
+        spec (str): 'screen' (화면 캡처), 'synthetic' 또는 'synthetic:장면 이름',
+                    이미지 폴더 경로, 프레임 묶음 파일 경로 (.npy / RAW_HEADER 형식),
+                    또는 녹화 파일 경로 (src/capture/recorder.py)
+        capture_size (Tuple[int, int]): 화면 캡처/합성 장면 크기 (너비, 높이)
+        pool_size (int): capture() 버퍼 풀 크기
+        playback_fps (Optional[float]): 파일/합성 소스 재생 속도 (None이면 최대 속도)
+        loop (bool): 파일/합성 소스를 끝에서 처음부터 반복
+
+    Returns:
+        FrameSource: 프레임 소스
+
+    Raises:
+        FileNotFoundError: 경로가 없는 경우
+        ValueError: 소스를 열 수 없는 경우
+    """
+    if spec == 'screen':
+        # mss는 화면 캡처를 쓸 때만 가져옴 (파일/합성 소스는 디스플레이 없이 실행 가능)
+        from src.capture.screen_capture import ScreenCapture
+        return ScreenCapture(capture_size, pool_size=pool_size)
+    if spec == 'synthetic' or spec.startswith('synthetic:'):
+        scene = spec.partition(':')[2] or 'sparse_blobs'
+        return SyntheticSource(scene, capture_size, pool_size=pool_size,
+                               playback_fps=playback_fps, loop=loop)
+    if os.path.isdir(spec):
+        return ImageFolderSource(spec, pool_size, playback_fps, loop)
+    if os.path.isfile(spec):
+        from src.capture.recorder import RecordingSource, is_recording
+        if is_recording(spec):
+            return RecordingSource(spec, pool_size, playback_fps, loop)
+        return ArchiveSource(spec, pool_size, playback_fps, loop)
+    raise FileNotFoundError(f"Frame source not found: {spec}")
@@ -0,0 +1,81 @@
+"""
+벤치마크/테스트용 합성 프레임 생성
+
+화면 없이도 같은 입력을 재현할 수 있도록 시드로 결정되는 장면을 만듭니다.
+프레임 채널 배치는 ScreenCapture.capture 출력과 같으며, 물체는 검출기 기준
+H=120, S=255, V=255 색(TARGET_COLOR)으로 그립니다.
+"""
+
+import numpy as np
+from typing import Tuple
+
+# 검출기 기준 HSV (120, 255, 255)인 색 (채널 0이 b 자리)
+TARGET_COLOR = (255, 0, 0)
+# TARGET_COLOR를 잡는 HSV 범위 (h_lower, h_upper, s_lower, s_upper, v_lower, v_upper)
+TARGET_RANGE = (100, 140, 50, 255, 50, 255)
+BACKGROUND_COLOR = (40, 40, 40)
+
+SCENES = ('solid', 'sparse_blobs', 'noise', 'small_blobs', 'huge_blob')
+
+# 벤치마크 해상도 (너비, 높이)
+RESOLUTIONS = {
+    '320': (320, 320),
+    '720p': (1280, 720),
+    '1080p': (1920, 1080),
+    '4k': (3840, 2160),
+}
+
+
+def _draw_disk(frame: np.ndarray, cx: int, cy: int, radius: int, color):
+    """원 그리기 (경계 사각형 안에서만 계산)"""
+    height, width = frame.shape[:2]
+    y0, y1 = max(0, cy - radius), min(height, cy + radius + 1)
+    x0, x1 = max(0, cx - radius), min(width, cx + radius + 1)
+    if y0 >= y1 or x0 >= x1:
+        return
+    yy, xx = np.ogrid[y0:y1, x0:x1]
+    inside = (yy - cy) ** 2 + (xx - cx) ** 2 <= radius * radius
+    frame[y0:y1, x0:x1][inside] = color
+
+
+def make_scene(kind: str, size: Tuple[int, int] = (320, 320), seed: int = 0) -> np.ndarray:
+    """합성 장면 생성
+
+    Args:
+        kind (str): 장면 종류
+            - 'solid': 화면 전체가 물체 색 (요소 1개, 모폴로지/라벨링 최대 부하)
+            - 'sparse_blobs': 배경 위 드문드문한 원 20개
+            - 'noise': 픽셀마다 무작위 색 (작은 요소가 매우 많음)
+            - 'small_blobs': 격자로 배치한 3~5픽셀 사각형 수천 개
+            - 'huge_blob': 화면 대부분을 덮는 큰 원 1개
+        size (Tuple[int, int]): (너비, 높이)
+        seed (int): 난수 시드
+
+    Returns:
+        np.ndarray: (H, W, 3) uint8 프레임
+    """
+    width, height = size
+    rng = np.random.default_rng(seed)
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    frame[:] = BACKGROUND_COLOR
+
+    if kind == 'solid':
+        frame[:] = TARGET_COLOR
+    elif kind == 'sparse_blobs':
+        radius = max(2, min(width, height) // 40)
+        for _ in range(20):
+            _draw_disk(frame, int(rng.integers(0, width)), int(rng.integers(0, height)),
+                       int(rng.integers(radius, radius * 3)), TARGET_COLOR)
+    elif kind == 'noise':
+        frame[:] = rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+    elif kind == 'small_blobs':
+        pitch = 12
+        for y in range(2, height - 6, pitch):
+            for x in range(2, width - 6, pitch):
+                side = int(rng.integers(3, 6))
+                frame[y:y + side, x:x + side] = TARGET_COLOR
+    elif kind == 'huge_blob':
+        _draw_disk(frame, width // 2, height // 2, int(min(width, height) * 0.45), TARGET_COLOR)
+    else:
+        raise ValueError(f"Unknown scene: {kind}")
+    return frame
@@ -0,0 +1,180 @@
+"""
+색상 → 마스크 룩업 테이블(LUT)
+
+모든 24비트 색상(또는 양자화된 색상)에 대해 HSV 범위 포함 여부를
+비트 단위로 미리 계산해 두고, 프레임 마스크를 픽셀당 한 번의 조회로 생성합니다.
+"""
+
+import threading
+import numpy as np
+from numba import jit, prange
+from typing import Optional
+
+from src.detection.hsv_kernels import _hsv_pixel, _in_hsv_range
+from src.detection.jit_cache import serial_variant
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _build_packed_lut(lower: np.ndarray, upper: np.ndarray, bits: int, out: np.ndarray) -> np.ndarray:
+    """비트 패킹된 LUT 생성
+
+    색상 인덱스는 (c0 << 2*bits) | (c1 << bits) | c2 이며, c0/c1/c2는
+    B/G/R 채널을 bits 비트로 양자화한 값입니다. 양자화된 경우 각 구간의
+    중앙 색상으로 판정합니다. 검출 스레드의 병렬 커널과 동시에 실행되므로
+    단일 스레드로 컴파일합니다.
+
+    Args:
+        lower (np.ndarray): HSV 하한값 [H, S, V]
+        upper (np.ndarray): HSV 상한값 [H, S, V]
+        bits (int): 채널당 비트 수 (1-8)
+        out (np.ndarray): (2**(3*bits) // 8,) uint8 출력 버퍼
+
+    Returns:
+        np.ndarray: out
+    """
+    shift = 8 - bits
+    half = (1 << shift) >> 1
+    channel_mask = (1 << bits) - 1
+    for j in range(out.shape[0]):
+        byte = 0
+        for k in range(8):
+            idx = j * 8 + k
+            b = (((idx >> (2 * bits)) & channel_mask) << shift) + half
+            g = (((idx >> bits) & channel_mask) << shift) + half
+            r = ((idx & channel_mask) << shift) + half
+            h, s, v = _hsv_pixel(b, g, r)
+            if _in_hsv_range(h, s, v, lower, upper):
+                byte |= 1 << k
+        out[j] = byte
+    return out
+
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def lut_mask(bgr_image: np.ndarray, lut: np.ndarray, bits: int, out: np.ndarray) -> np.ndarray:
+    """LUT 조회로 이진 마스크 생성
+
+    Args:
+        bgr_image (np.ndarray): (H, W, C>=3) uint8 BGR 이미지
+        lut (np.ndarray): _build_packed_lut로 만든 비트 패킹 테이블
+        bits (int): LUT 생성 시 사용한 채널당 비트 수
+        out (np.ndarray): (H, W) uint8 출력 마스크
+
+    Returns:
+        np.ndarray: out (범위 내 픽셀은 255)
+    """
+    shift = 8 - bits
+    height, width = bgr_image.shape[0], bgr_image.shape[1]
+    for y in prange(height):
+        for x in range(width):
+            idx = ((np.int64(bgr_image[y, x, 0]) >> shift) << (2 * bits)) \
+                | ((np.int64(bgr_image[y, x, 1]) >> shift) << bits) \
+                | (np.int64(bgr_image[y, x, 2]) >> shift)
+            if (lut[idx >> 3] >> (idx & 7)) & 1:
+                out[y, x] = 255
+            else:
+                out[y, x] = 0
+    return out
+
+
+# 스레드 풀 작업자에서 동시에 호출하기 위한 단일 스레드 버전
+lut_mask_serial = serial_variant(lut_mask)
+
+
+class ColorLUT:
+    """HSV 범위에 대한 비트 패킹 색상 LUT
+
+    임계값이 바뀌면 백그라운드 스레드에서 테이블을 다시 만들고,
+    완성되기 전까지는 lookup()이 None을 반환하여 호출자가 직접 변환 경로를
+    사용하도록 합니다. 따라서 슬라이더 조작이 캡처 스레드를 멈추지 않습니다.
+    """
+
+    def __init__(self, bits: int = 8):
+        """LUT 초기화
+
+        Args:
+            bits (int): 채널당 비트 수. 8이면 2^24 색상 전체(2MB),
+                        그보다 작으면 양자화된 근사 테이블
+        """
+        if not 1 <= bits <= 8:
+            raise ValueError(f"bits must be in 1..8, got {bits}")
+        self.bits = bits
+        self._size = max(1, (1 << (3 * bits)) // 8)
+        self._lock = threading.Lock()
+        self._table = None        # 완성된 테이블
+        self._table_range = None  # 완성된 테이블의 (lower, upper)
+        self._pending = None      # 다음에 만들 (lower, upper)
+        self._worker = None
+
+    def build(self, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """현재 스레드에서 즉시 테이블 생성 및 적용
+
+        Args:
+            lower (np.ndarray): HSV 하한값 [H, S, V]
+            upper (np.ndarray): HSV 상한값 [H, S, V]
+
+        Returns:
+            np.ndarray: 생성된 테이블
+        """
+        lower = np.array(lower, dtype=np.uint8)
+        upper = np.array(upper, dtype=np.uint8)
+        table = _build_packed_lut(lower, upper, self.bits, np.empty(self._size, dtype=np.uint8))
+        with self._lock:
+            self._table = table
+            self._table_range = (lower, upper)
+        return table
+
+    def request_build(self, lower: np.ndarray, upper: np.ndarray):
+        """백그라운드에서 테이블 재생성 요청
+
+        연속된 요청은 병합되어 가장 마지막 임계값만 생성됩니다.
+        """
+        with self._lock:
+            self._pending = (np.array(lower, dtype=np.uint8), np.array(upper, dtype=np.uint8))
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._build_loop, daemon=True)
+            self._worker.start()
+
+    def _build_loop(self):
+        """대기 중인 요청이 없어질 때까지 테이블 생성"""
+        while True:
+            with self._lock:
+                request = self._pending
+                self._pending = None
+                if request is None:
+                    self._worker = None
+                    return
+            self.build(*request)
+
+    def lookup(self, lower: np.ndarray, upper: np.ndarray) -> Optional[np.ndarray]:
+        """주어진 임계값에 해당하는 완성된 테이블 반환
+
+        Returns:
+            Optional[np.ndarray]: 테이블이 아직 준비되지 않았으면 None
+        """
+        with self._lock:
+            table, table_range = self._table, self._table_range
+        if table is None:
+            return None
+        if not (np.array_equal(table_range[0], lower) and np.array_equal(table_range[1], upper)):
+            return None
+        return table
+
+    def apply(self, bgr_image: np.ndarray, table: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """테이블로 이미지 마스크 생성
+
+        Args:
+            bgr_image (np.ndarray): BGR 이미지 (BGRA도 가능)
+            table (np.ndarray): lookup()으로 얻은 테이블
+            out (Optional[np.ndarray]): (H, W) uint8 출력 버퍼
+
+        Returns:
+            np.ndarray: 이진 마스크
+        """
+        if out is None:
+            out = np.empty(bgr_image.shape[:2], dtype=np.uint8)
+        return lut_mask(bgr_image, table, self.bits, out)
+
+    def apply_serial(self, bgr_image: np.ndarray, table: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """apply()의 단일 스레드 버전 (스레드 풀 작업자에서 동시 호출용)"""
+        return lut_mask_serial(bgr_image, table, self.bits, out)
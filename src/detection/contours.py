@@ -0,0 +1,278 @@
+"""
+경계 추적 기반 윤곽선 검출 (Suzuki-Abe 방식)
+
+윤곽선을 경계를 따라 순서대로 추적하면서 면적(신발끈 공식), 둘레, 경계 사각형을
+함께 계산합니다. 좌표 배열은 저장하지 않고 시작점과 시작 방향만 기록해 두었다가
+필요할 때 다시 추적하여 만듭니다.
+"""
+
+import numpy as np
+from numba import jit
+from typing import Tuple
+
+# 8-이웃 방향 (인덱스가 증가할수록 화면 기준 반시계 방향): E, NE, N, NW, W, SW, S, SE
+_DY = np.array([0, -1, -1, -1, 0, 1, 1, 1], dtype=np.int64)
+_DX = np.array([1, 1, 0, -1, -1, -1, 0, 1], dtype=np.int64)
+# (dy + 1, dx + 1) -> 방향 인덱스
+_DIR_OF = np.array([[3, 2, 1],
+                    [4, -1, 0],
+                    [5, 6, 7]], dtype=np.int64)
+
+# 경계 테이블의 열 인덱스
+_START_Y = 0
+_START_X = 1
+_START_DIR = 2   # 시작점에서 (i1, j1)로의 방향, 단일 점이면 -1
+_IS_HOLE = 3
+_PARENT = 4      # 부모 경계 인덱스 (없으면 -1)
+_LENGTH = 5      # 경계 점 수
+_X0 = 6
+_Y0 = 7
+_X1 = 8
+_Y1 = 9
+_COLUMNS = 10
+
+_SQRT2 = np.sqrt(2.0)
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _grow(table: np.ndarray, measures: np.ndarray):
+    """경계 테이블 용량을 두 배로 확장"""
+    new_table = np.empty((table.shape[0] * 2, table.shape[1]), dtype=table.dtype)
+    new_table[:table.shape[0]] = table
+    new_measures = np.empty((measures.shape[0] * 2, measures.shape[1]), dtype=measures.dtype)
+    new_measures[:measures.shape[0]] = measures
+    return new_table, new_measures
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _find_borders(mask: np.ndarray):
+    """모든 외곽/구멍 경계를 추적하고 경계별 통계 계산
+
+    Args:
+        mask (np.ndarray): (H, W) 마스크 (0이 아니면 전경)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            (작업 이미지 (H+2, W+2) int32, (n, _COLUMNS) int64 경계 테이블,
+             (n, 2) float64 [면적, 둘레])
+    """
+    height, width = mask.shape
+    f = np.zeros((height + 2, width + 2), dtype=np.int32)
+    for y in range(height):
+        for x in range(width):
+            if mask[y, x] != 0:
+                f[y + 1, x + 1] = 1
+
+    table = np.empty((64, _COLUMNS), dtype=np.int64)
+    measures = np.empty((64, 2), dtype=np.float64)
+    nbd = 1  # 1은 이미지 테두리(구멍 경계로 간주)
+
+    for i in range(1, height + 1):
+        lnbd = 1
+        for j in range(1, width + 1):
+            fij = f[i, j]
+            if fij == 0:
+                continue
+
+            is_outer = fij == 1 and f[i, j - 1] == 0
+            is_hole = (not is_outer) and fij >= 1 and f[i, j + 1] == 0
+            if is_outer or is_hole:
+                nbd += 1
+                k = nbd - 2
+                if k >= table.shape[0]:
+                    table, measures = _grow(table, measures)
+
+                if is_outer:
+                    d0 = 4  # (i, j-1)
+                else:
+                    d0 = 0  # (i, j+1)
+                    if fij > 1:
+                        lnbd = fij
+
+                # 부모 경계 결정 (직전 경계 LNBD의 종류에 따라)
+                if lnbd == 1:
+                    prime_hole, prime_idx, prime_parent = True, -1, -1
+                else:
+                    prime_idx = lnbd - 2
+                    prime_hole = table[prime_idx, _IS_HOLE] == 1
+                    prime_parent = table[prime_idx, _PARENT]
+                if is_outer:
+                    parent = prime_idx if prime_hole else prime_parent
+                else:
+                    parent = prime_parent if prime_hole else prime_idx
+
+                table[k, _START_Y] = i - 1
+                table[k, _START_X] = j - 1
+                table[k, _IS_HOLE] = 1 if is_hole else 0
+                table[k, _PARENT] = parent
+                x0, y0, x1, y1 = j - 1, i - 1, j - 1, i - 1
+
+                # 3.1 시계 방향으로 첫 번째 전경 이웃 탐색
+                d1 = -1
+                for step in range(8):
+                    d = (d0 - step) & 7
+                    if f[i + _DY[d], j + _DX[d]] != 0:
+                        d1 = d
+                        break
+
+                if d1 < 0:
+                    # 고립된 단일 픽셀
+                    f[i, j] = -nbd
+                    table[k, _START_DIR] = -1
+                    table[k, _LENGTH] = 1
+                    measures[k, 0] = 0.0
+                    measures[k, 1] = 0.0
+                else:
+                    i1, j1 = i + _DY[d1], j + _DX[d1]
+                    i2, j2 = i1, j1
+                    i3, j3 = i, j
+                    length = 0
+                    area2 = 0
+                    perimeter = 0.0
+                    while True:
+                        # 3.3 (i2, j2) 다음부터 반시계 방향으로 전경 이웃 탐색
+                        d = _DIR_OF[i2 - i3 + 1, j2 - j3 + 1]
+                        east_zero = False
+                        i4, j4, d4 = i3, j3, -1
+                        for step in range(1, 9):
+                            dd = (d + step) & 7
+                            ny, nx = i3 + _DY[dd], j3 + _DX[dd]
+                            if f[ny, nx] != 0:
+                                i4, j4, d4 = ny, nx, dd
+                                break
+                            if dd == 0:
+                                east_zero = True
+                        # 3.4 경계 표시
+                        if east_zero:
+                            f[i3, j3] = -nbd
+                        elif f[i3, j3] == 1:
+                            f[i3, j3] = nbd
+
+                        # 추적하면서 통계 누적
+                        length += 1
+                        px, py = j3 - 1, i3 - 1
+                        if px < x0:
+                            x0 = px
+                        if px > x1:
+                            x1 = px
+                        if py < y0:
+                            y0 = py
+                        if py > y1:
+                            y1 = py
+                        area2 += px * (i4 - 1) - (j4 - 1) * py
+                        perimeter += 1.0 if (d4 & 1) == 0 else _SQRT2
+
+                        # 3.5 시작점으로 돌아오면 종료
+                        if i4 == i and j4 == j and i3 == i1 and j3 == j1:
+                            break
+                        i2, j2 = i3, j3
+                        i3, j3 = i4, j4
+
+                    table[k, _START_DIR] = d1
+                    table[k, _LENGTH] = length
+                    measures[k, 0] = abs(area2) * 0.5
+                    measures[k, 1] = perimeter
+
+                table[k, _X0] = x0
+                table[k, _Y0] = y0
+                table[k, _X1] = x1
+                table[k, _Y1] = y1
+
+            if f[i, j] != 1:
+                lnbd = abs(f[i, j])
+
+    n = nbd - 1
+    return f, table[:n].copy(), measures[:n].copy()
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _trace_points(f: np.ndarray, start_y: int, start_x: int, start_dir: int, length: int) -> np.ndarray:
+    """기록된 시작점과 방향에서 경계를 다시 추적하여 좌표 배열 생성
+
+    추적 경로는 픽셀이 0인지 여부만으로 결정되므로 표시가 끝난 작업 이미지에서도
+    처음 추적과 같은 순서의 점을 얻습니다.
+
+    Returns:
+        np.ndarray: (length, 2) int32 [x, y] 좌표
+    """
+    points = np.empty((length, 2), dtype=np.int32)
+    i, j = start_y + 1, start_x + 1
+    if start_dir < 0:
+        points[0, 0] = start_x
+        points[0, 1] = start_y
+        return points
+    i1, j1 = i + _DY[start_dir], j + _DX[start_dir]
+    i2, j2 = i1, j1
+    i3, j3 = i, j
+    for n in range(length):
+        points[n, 0] = j3 - 1
+        points[n, 1] = i3 - 1
+        d = _DIR_OF[i2 - i3 + 1, j2 - j3 + 1]
+        i4, j4 = i3, j3
+        for step in range(1, 9):
+            dd = (d + step) & 7
+            ny, nx = i3 + _DY[dd], j3 + _DX[dd]
+            if f[ny, nx] != 0:
+                i4, j4 = ny, nx
+                break
+        i2, j2 = i3, j3
+        i3, j3 = i4, j4
+    return points
+
+
+class ContourSet:
+    """경계 추적 결과 (외곽/구멍 경계, 계층 구조, 경계별 측정값)
+
+    좌표 배열은 points()를 호출할 때 만들어집니다.
+    """
+
+    def __init__(self, mask: np.ndarray):
+        """마스크의 모든 경계 추적
+
+        Args:
+            mask (np.ndarray): (H, W) 이진 마스크
+        """
+        self._work, self._table, self._measures = _find_borders(mask)
+
+    def __len__(self) -> int:
+        return self._table.shape[0]
+
+    @property
+    def is_hole(self) -> np.ndarray:
+        """경계별 구멍 여부 (bool 배열)"""
+        return self._table[:, _IS_HOLE] == 1
+
+    @property
+    def parents(self) -> np.ndarray:
+        """경계별 부모 경계 인덱스 (최상위는 -1)"""
+        return self._table[:, _PARENT]
+
+    @property
+    def areas(self) -> np.ndarray:
+        """경계별 면적 (픽셀 중심을 잇는 다각형의 신발끈 공식)"""
+        return self._measures[:, 0]
+
+    @property
+    def perimeters(self) -> np.ndarray:
+        """경계별 둘레 (대각선 이동은 sqrt(2))"""
+        return self._measures[:, 1]
+
+    @property
+    def start_points(self) -> np.ndarray:
+        """경계별 시작점 [x, y] (외곽 경계는 해당 요소의 래스터 순서 첫 픽셀)"""
+        return self._table[:, [_START_X, _START_Y]]
+
+    def outer_indices(self) -> np.ndarray:
+        """외곽 경계 인덱스"""
+        return np.flatnonzero(self._table[:, _IS_HOLE] == 0)
+
+    def bounding_rect(self, index: int) -> Tuple[int, int, int, int]:
+        """경계의 경계 사각형 (x, y, width, height)"""
+        row = self._table[index]
+        return (int(row[_X0]), int(row[_Y0]),
+                int(row[_X1] - row[_X0] + 1), int(row[_Y1] - row[_Y0] + 1))
+
+    def points(self, index: int) -> np.ndarray:
+        """경계를 따라 순서대로 정렬된 좌표 배열 (n, 2) [x, y]"""
+        row = self._table[index]
+        return _trace_points(self._work, row[_START_Y], row[_START_X], row[_START_DIR], row[_LENGTH])
@@ -3,10 +3,35 @@ OpenCV를 사용하지 않는 HSV 기반 객체 검출기
 """
 
 import numpy as np
-from numba import jit, prange
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
 
+from src.detection.hsv_kernels import (bgr_to_hsv_image, bgr_to_mask, hsv_to_mask,
+                                       bgr_to_mask_serial, bgr_to_class_mask, channel_view, LAYOUT_RGB)
+from src.detection.color_lut import ColorLUT
+from src.detection import morphology
+from src.detection.contours import ContourSet
+from src.detection.profiling import NULL_PROFILER
+from src.detection.labeling import (connected_components_with_stats, label_components, label_batch,
+                                    stats_from_raw, STAT_X, STAT_Y, STAT_WIDTH, STAT_HEIGHT, STAT_AREA,
+                                    RAW_VALUE)
+
+# 클래스별 바운딩 박스 색상 (BGR)
+CLASS_COLORS = [(0, 255, 0), (0, 0, 255), (255, 0, 0), (0, 255, 255), (255, 0, 255), (255, 255, 0)]
+
+# detect_batch가 반환하는 프레임별 객체 표의 레코드 형식
+OBJECT_DTYPE = np.dtype([
+    ('frame', np.int32),    # 묶음 내 프레임 번호
+    ('label', np.int32),    # 해당 프레임 라벨 이미지에서의 요소 번호
+    ('x', np.int32),
+    ('y', np.int32),
+    ('width', np.int32),
+    ('height', np.int32),
+    ('area', np.int64),
+    ('cx', np.float64),     # 무게중심
+    ('cy', np.float64),
+])
+
 @dataclass
 class DetectedObject:
     """검출된 객체 정보"""
@@ -15,10 +40,14 @@ class DetectedObject:
     width: int
     height: int
     area: float
-    contour: np.ndarray
+    contour: Optional[np.ndarray] = None
+    centroid: Tuple[float, float] = (0.0, 0.0)
+    label: int = 0  # 라벨 이미지에서의 요소 번호
+    class_name: Optional[str] = None  # 다중 범위 검출 시 클래스 이름
 
 class CustomDetector:
-    def __init__(self, h_lower=0, h_upper=179, s_lower=0, s_upper=255, v_lower=0, v_upper=255):
+    def __init__(self, h_lower=0, h_upper=179, s_lower=0, s_upper=255, v_lower=0, v_upper=255,
+                 use_lut=False, lut_bits=8):
         """HSV 기반 객체 검출기 초기화
         
         Args:
@@ -28,134 +57,98 @@ class CustomDetector:
             s_upper (int): Saturation 상한값 (0-255)
             v_lower (int): Value 하한값 (0-255)
             v_upper (int): Value 상한값 (0-255)
+            use_lut (bool): 색상 LUT로 마스크 생성 (임계값 변경 시 백그라운드 재생성)
+            lut_bits (int): LUT 채널당 비트 수 (8: 전체 2^24 색상, 미만: 양자화)
         """
+        self.lut = ColorLUT(lut_bits) if use_lut else None
+        self.min_area = 20  # 이 값 이하 면적(픽셀 수)의 요소는 무시
+        self.set_morphology()
+        self._batch_buffers = None  # detect_batch 출력 버퍼 (모양이 같으면 재사용)
+        self._raw_mask = None  # detect/detect_hsv의 모폴로지 전 마스크 (결과에 포함되지 않으므로 재사용)
+        self.profiler = NULL_PROFILER  # 단계별 시간 계측 (StageProfiler를 넣으면 기록)
+        self.clear_color_ranges()
         self.set_hsv_range(h_lower, h_upper, s_lower, s_upper, v_lower, v_upper)
     
     def set_hsv_range(self, h_lower, h_upper, s_lower, s_upper, v_lower, v_upper):
         """HSV 범위 설정"""
         self.lower_color = np.array([h_lower, s_lower, v_lower], dtype=np.uint8)
         self.upper_color = np.array([h_upper, s_upper, v_upper], dtype=np.uint8)
+        
+        # LUT 모드에서는 캡처 스레드를 막지 않도록 백그라운드에서 테이블 재생성
+        if self.lut is not None:
+            self.lut.request_build(self.lower_color, self.upper_color)
     
-    @staticmethod
-    @jit(nopython=True)
-    def _bgr_to_hsv_compute(b: int, g: int, r: int) -> np.ndarray:
-        """단일 픽셀의 BGR을 HSV로 변환
+    def add_color_range(self, name: str, h_lower, h_upper, s_lower, s_upper, v_lower, v_upper):
+        """다중 범위 검출에 이름 붙은 HSV 범위 추가
+        
+        같은 이름으로 여러 번 추가하면 하나의 클래스로 합쳐집니다
+        (예: 빨간색의 H 0-10과 170-179).
         
         Args:
-            b (int): Blue 값 (0-255)
-            g (int): Green 값 (0-255)
-            r (int): Red 값 (0-255)
-            
-        Returns:
-            np.ndarray: HSV 값 [H(0-179), S(0-255), V(0-255)]
+            name (str): 클래스 이름
+            h_lower ~ v_upper (int): HSV 범위 (set_hsv_range와 동일)
         """
-        b = b / 255.0
-        g = g / 255.0
-        r = r / 255.0
-        
-        maxc = max(r, g, b)
-        minc = min(r, g, b)
-        v = maxc
-        diff = maxc - minc
-        
-        s = 0.0 if maxc == 0 else (diff / maxc)
-        
-        h = 0.0
-        if maxc != minc:
-            if maxc == r:
-                h = 60.0 * (g - b) / diff
-                if g < b:
-                    h += 360.0
-            elif maxc == g:
-                h = 60.0 * (b - r) / diff + 120.0
-            else:
-                h = 60.0 * (r - g) / diff + 240.0
-        
-        # OpenCV 범위로 변환
-        h = (h / 2.0)  # 0-180 범위로 변환
-        s = s * 255.0  # 0-255 범위로 변환
-        v = v * 255.0  # 0-255 범위로 변환
-        
-        return np.array([
-            min(max(round(h), 0), 180),
-            min(max(round(s), 0), 255),
-            min(max(round(v), 0), 255)
-        ], dtype=np.uint8)
+        if name not in self.class_names:
+            if len(self.class_names) >= 255:
+                raise ValueError("At most 255 color classes are supported")
+            self.class_names.append(name)
+        self.color_ranges.append((name,
+                                  np.array([h_lower, s_lower, v_lower], dtype=np.uint8),
+                                  np.array([h_upper, s_upper, v_upper], dtype=np.uint8)))
+        self._range_arrays = None
     
-    def bgr_to_hsv(self, bgr_image: np.ndarray) -> np.ndarray:
+    def clear_color_ranges(self):
+        """등록된 다중 범위 모두 제거"""
+        self.color_ranges = []
+        self.class_names = []
+        self._range_arrays = None
+    
+    def _get_range_arrays(self):
+        """다중 범위를 커널 입력 배열 (lowers, uppers, class_ids)로 변환 (캐시)"""
+        if self._range_arrays is None:
+            lowers = np.array([lower for _, lower, _ in self.color_ranges], dtype=np.uint8).reshape(-1, 3)
+            uppers = np.array([upper for _, _, upper in self.color_ranges], dtype=np.uint8).reshape(-1, 3)
+            class_ids = np.array([self.class_names.index(name) + 1 for name, _, _ in self.color_ranges],
+                                 dtype=np.uint8)
+            self._range_arrays = (lowers, uppers, class_ids)
+        return self._range_arrays
+    
+    def bgr_to_hsv(self, bgr_image: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """BGR 이미지를 HSV로 변환
         
         Args:
-            bgr_image (np.ndarray): BGR 이미지
+            bgr_image (np.ndarray): BGR 이미지 (BGRA도 가능, 앞 3채널만 사용)
+            out (Optional[np.ndarray]): 결과를 기록할 (H, W, 3) uint8 버퍼
             
         Returns:
             np.ndarray: HSV 이미지
         """
-        # 4채널 이미지를 3채널로 변환
-        if bgr_image.shape[2] == 4:
-            bgr_image = bgr_image[..., :3]
-        
         height, width = bgr_image.shape[:2]
-        hsv = np.zeros((height, width, 3), dtype=np.uint8)
-        
-        for y in range(height):
-            for x in range(width):
-                b, g, r = bgr_image[y, x]
-                hsv[y, x] = self._bgr_to_hsv_compute(b, g, r)
-        
-        return hsv
-    
-    @staticmethod
-    @jit(nopython=True)
-    def _check_color_range(h: int, s: int, v: int, lower: np.ndarray, upper: np.ndarray) -> bool:
-        """단일 픽셀의 HSV 값이 지정된 범위 내에 있는지 확인
+        if out is None:
+            out = np.empty((height, width, 3), dtype=np.uint8)
         
-        Args:
-            h (int): Hue 값 (0-179)
-            s (int): Saturation 값 (0-255)
-            v (int): Value 값 (0-255)
-            lower (np.ndarray): HSV 하한값 [H, S, V]
-            upper (np.ndarray): HSV 상한값 [H, S, V]
-            
-        Returns:
-            bool: 범위 내에 있으면 True
-        """
-        # Hue는 원형이므로 특별 처리
-        if lower[0] <= upper[0]:
-            h_match = lower[0] <= h <= upper[0]
-        else:
-            h_match = h >= lower[0] or h <= upper[0]
-        
-        # Saturation과 Value는 일반 범위 비교
-        s_match = lower[1] <= s <= upper[1]
-        v_match = lower[2] <= v <= upper[2]
-        
-        return h_match and s_match and v_match
+        # 프레임 전체를 한 번의 병렬 커널 호출로 변환
+        return bgr_to_hsv_image(bgr_image, out)
     
-    def create_mask(self, hsv_image: np.ndarray) -> np.ndarray:
+    def create_mask(self, hsv_image: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """HSV 이미지에서 마스크 생성
         
         Args:
             hsv_image (np.ndarray): HSV 이미지
+            out (Optional[np.ndarray]): 결과를 기록할 (H, W) uint8 버퍼
             
         Returns:
             np.ndarray: 이진 마스크 이미지
         """
-        height, width = hsv_image.shape[:2]
-        mask = np.zeros((height, width), dtype=np.uint8)
-        
-        for y in prange(height):
-            for x in prange(width):
-                h, s, v = hsv_image[y, x]
-                if self._check_color_range(h, s, v, self.lower_color, self.upper_color):
-                    mask[y, x] = 255
+        if out is None:
+            out = np.empty(hsv_image.shape[:2], dtype=np.uint8)
         
-        return mask
+        # 임계값은 인자로 넘겨 컴파일된 병렬 커널에서 처리
+        return hsv_to_mask(hsv_image, self.lower_color, self.upper_color, out)
     
     @staticmethod
-    @jit(nopython=True)
     def _dilate_compute(mask: np.ndarray, kernel_size: int = 3, iterations: int = 2) -> np.ndarray:
-        """마스크 팽창 연산
+        """마스크 팽창 연산 (사각형 커널)
         
         Args:
             mask (np.ndarray): 이진 마스크 이미지
@@ -165,25 +158,82 @@ class CustomDetector:
         Returns:
             np.ndarray: 팽창된 마스크 이미지
         """
-        height, width = mask.shape
-        pad = kernel_size // 2
-        result = mask.copy()
-        
-        for _ in range(iterations):
-            temp = np.zeros_like(result)
-            for y in range(height):
-                for x in range(width):
-                    # 커널 영역 검사
-                    for ky in range(max(0, y-pad), min(height, y+pad+1)):
-                        for kx in range(max(0, x-pad), min(width, x+pad+1)):
-                            if result[ky, kx] > 0:
-                                temp[y, x] = 255
-                                break
-                        if temp[y, x] > 0:
-                            break
-            result = temp
-        
-        return result
+        return morphology.dilate(mask, kernel_size, iterations)
+    
+    def set_morphology(self, open_size: int = 0, open_iterations: int = 1,
+                       dilate_size: int = 3, dilate_iterations: int = 2, shape: str = 'rect',
+                       close_size: int = 0, close_iterations: int = 1,
+                       erode_size: int = 0, erode_iterations: int = 1, stages=None):
+        """마스크 후처리(모폴로지) 설정
+        
+        stages를 주지 않으면 열림 → 닫힘 → 침식 → 팽창 순서로 적용하며,
+        크기가 0 또는 1이거나 반복 횟수가 0인 연산은 생략합니다.
+        
+        Args:
+            open_size (int): 열림 연산 커널 크기 (0 또는 1이면 생략)
+            open_iterations (int): 열림 연산 반복 횟수
+            dilate_size (int): 팽창 커널 크기 (0 또는 1이면 생략)
+            dilate_iterations (int): 팽창 반복 횟수
+            shape (str): 기본 커널 모양 ('rect', 'cross', 'ellipse')
+            close_size (int): 닫힘 연산 커널 크기 (0 또는 1이면 생략)
+            close_iterations (int): 닫힘 연산 반복 횟수
+            erode_size (int): 침식 커널 크기 (0 또는 1이면 생략)
+            erode_iterations (int): 침식 반복 횟수
+            stages: 순서대로 적용할 단계 목록 [(연산, 크기, 반복 횟수[, 모양]), ...]
+                    (주면 위의 크기/반복 인자는 무시, 연산은 'erode', 'dilate', 'open', 'close')
+        """
+        if shape not in morphology.KERNEL_SHAPES:
+            raise ValueError(f"Unknown kernel shape: {shape}")
+        if stages is None:
+            stages = (('open', open_size, open_iterations),
+                      ('close', close_size, close_iterations),
+                      ('erode', erode_size, erode_iterations),
+                      ('dilate', dilate_size, dilate_iterations))
+        normalized = []
+        for stage in stages:
+            operation, size, iterations = stage[:3]
+            stage_shape = stage[3] if len(stage) > 3 else shape
+            if operation not in morphology.OPERATIONS:
+                raise ValueError(f"Unknown morphology operation: {operation}")
+            if stage_shape not in morphology.KERNEL_SHAPES:
+                raise ValueError(f"Unknown kernel shape: {stage_shape}")
+            if size > 1 and iterations > 0:
+                normalized.append((operation, int(size), int(iterations), stage_shape))
+        self.kernel_shape = shape
+        # (연산, 크기, 반복 횟수, 모양) 튜플 (설정 비교/프로세스 간 전달에 그대로 사용)
+        self.morphology_stages = tuple(normalized)
+    
+    def morphology_radius(self) -> int:
+        """모폴로지 전체가 영향을 미치는 최대 거리(픽셀)
+        
+        마스크 일부만 다시 처리할 때 필요한 주변 여백 크기입니다.
+        """
+        return sum(morphology.stage_radius(operation, size, iterations)
+                   for operation, size, iterations, _ in self.morphology_stages)
+    
+    def apply_morphology(self, mask: np.ndarray, serial: bool = False,
+                         out: Optional[np.ndarray] = None) -> np.ndarray:
+        """설정된 모폴로지 단계를 순서대로 적용
+        
+        Args:
+            mask (np.ndarray): 이진 마스크 이미지
+            serial (bool): 단일 스레드 커널 사용 (스레드 풀 작업자에서 호출할 때)
+            out (Optional[np.ndarray]): 결과를 기록할 버퍼 (mask와 달라야 함)
+            
+        Returns:
+            np.ndarray: 후처리된 마스크 이미지
+        """
+        stages = self.morphology_stages
+        if not stages:
+            if out is None:
+                return np.array(mask, dtype=np.uint8, order='C')
+            out[...] = mask
+            return out
+        last = len(stages) - 1
+        for i, (operation, size, iterations, shape) in enumerate(stages):
+            mask = morphology.apply_stage(mask, operation, size, iterations, shape,
+                                          out=out if i == last else None, serial=serial)
+        return mask
     
     def find_contours(self, mask: np.ndarray, min_area: int = 20) -> List[Tuple[np.ndarray, float]]:
         """마스크에서 윤곽선 찾기
@@ -194,67 +244,14 @@ class CustomDetector:
             
         Returns:
             List[Tuple[np.ndarray, float]]: (윤곽선 좌표 배열, 면적) 리스트
+                                            (좌표는 경계를 따라 순서대로 정렬된 외곽선)
         """
-        height, width = mask.shape
-        visited = np.zeros_like(mask, dtype=bool)
+        contour_set = ContourSet(mask)
         contours = []
-        
-        def trace_contour(start_y: int, start_x: int) -> Optional[np.ndarray]:
-            """윤곽선 추적"""
-            contour = []
-            stack = [(start_y, start_x)]
-            directions = [
-                (0, 1),   # 오른쪽
-                (1, 1),   # 오른쪽 아래
-                (1, 0),   # 아래
-                (1, -1),  # 왼쪽 아래
-                (0, -1),  # 왼쪽
-                (-1, -1), # 왼쪽 위
-                (-1, 0),  # 위
-                (-1, 1)   # 오른쪽 위
-            ]
-            
-            while stack:
-                y, x = stack.pop()
-                if visited[y, x]:
-                    continue
-                
-                visited[y, x] = True
-                is_edge = False
-                
-                # 가장자리 픽셀 확인
-                for dy, dx in directions:
-                    ny, nx = y + dy, x + dx
-                    if 0 <= ny < height and 0 <= nx < width:
-                        if mask[ny, nx] == 0:
-                            is_edge = True
-                            break
-                    else:
-                        is_edge = True
-                        break
-                
-                if is_edge:
-                    contour.append((x, y))
-                    
-                    # 가장자리 우선 탐색
-                    for dy, dx in directions:
-                        ny, nx = y + dy, x + dx
-                        if (0 <= ny < height and 0 <= nx < width and 
-                            mask[ny, nx] > 0 and not visited[ny, nx]):
-                            stack.append((ny, nx))
-            
-            return np.array(contour) if contour else None
-        
-        # 외곽 윤곽선 찾기
-        for y in range(height):
-            for x in range(width):
-                if mask[y, x] > 0 and not visited[y, x]:
-                    contour = trace_contour(y, x)
-                    if contour is not None:
-                        area = self.calculate_contour_area(contour)
-                        if area >= min_area:
-                            contours.append((contour, area))
-        
+        for i in contour_set.outer_indices():
+            area = float(contour_set.areas[i])
+            if area >= min_area:
+                contours.append((contour_set.points(i), area))
         return contours
     
     @staticmethod
@@ -291,50 +288,349 @@ class CustomDetector:
         
         return (x, y, w, h)
     
-    def detect(self, frame: np.ndarray) -> dict:
+    def threshold(self, frame: np.ndarray, out: Optional[np.ndarray] = None, serial: bool = False) -> np.ndarray:
+        """BGR 프레임에서 바로 이진 마스크 생성 (HSV 이미지를 만들지 않음)
+        
+        현재 임계값에 맞는 LUT가 준비되어 있으면 LUT 조회를, 아니면
+        변환과 범위 검사를 합친 단일 커널을 사용합니다.
+        
+        Args:
+            frame (np.ndarray): BGR 이미지 (BGRA도 가능)
+            out (Optional[np.ndarray]): (H, W) uint8 출력 버퍼
+            serial (bool): 단일 스레드 커널 사용 (스레드 풀 작업자에서 호출할 때)
+            
+        Returns:
+            np.ndarray: 이진 마스크 이미지
+        """
+        lower, upper = self.lower_color, self.upper_color
+        if out is None:
+            out = np.empty(frame.shape[:2], dtype=np.uint8)
+        
+        if self.lut is not None:
+            table = self.lut.lookup(lower, upper)
+            if table is not None:
+                if serial:
+                    return self.lut.apply_serial(frame, table, out)
+                return self.lut.apply(frame, table, out)
+        
+        if serial:
+            return bgr_to_mask_serial(frame, lower, upper, out)
+        return bgr_to_mask(frame, lower, upper, out)
+    
+    def detect(self, frame: np.ndarray, return_hsv: bool = False, with_contours: bool = False,
+               layout: str = LAYOUT_RGB) -> dict:
         """프레임에서 객체 검출
         
         Args:
             frame (np.ndarray): BGR 이미지 (numpy array)
+            return_hsv (bool): True이면 HSV 이미지를 만들어 결과에 포함
+            with_contours (bool): True이면 각 객체의 외곽선 좌표를 contour에 채움
+            layout (str): frame의 채널 배치 (mss 원본 BGRA 버퍼는 LAYOUT_BGRA)
             
         Returns:
             dict: 검출 결과 
-                  {'hsv': hsv_image, 
+                  {'hsv': hsv_image (return_hsv=False이면 None), 
                    'mask': dilated_mask, 
                    'objects': detected_objects,
                    'bbox_frame': bbox_drawn_frame}
         """
-        # 1. BGR to HSV 변환
-        hsv_image = self.bgr_to_hsv(frame)
+        frame = channel_view(frame, layout)
+        profiler = self.profiler
+        t = profiler.begin()
+        if return_hsv:
+            # 1. BGR to HSV 변환
+            hsv_image = self.bgr_to_hsv(frame)
+            t = profiler.lap('hsv', t)
+            
+            # 2. HSV 범위 기반 마스크 생성
+            mask = self.create_mask(hsv_image, out=self._raw_mask_buffer(frame.shape[:2]))
+            t = profiler.lap('mask', t)
+        else:
+            # 1-2. 변환과 범위 검사를 한 번에 수행 (HSV 이미지 생략)
+            hsv_image = None
+            mask = self.threshold(frame, out=self._raw_mask_buffer(frame.shape[:2]))
+            t = profiler.lap('threshold', t)
+        
+        return self._detect_from_mask(frame, hsv_image, mask, with_contours, t)
+    
+    def detect_hsv(self, frame: np.ndarray, hsv_image: np.ndarray, with_contours: bool = False,
+                   layout: str = LAYOUT_RGB) -> dict:
+        """미리 변환해 둔 HSV 이미지로 객체 검출 (같은 프레임을 범위만 바꿔 반복 검출할 때)
         
-        # 2. HSV 범위 기반 마스크 생성
-        mask = self.create_mask(hsv_image)
+        Args:
+            frame (np.ndarray): hsv_image를 만든 BGR 이미지 (바운딩 박스를 그릴 원본)
+            hsv_image (np.ndarray): bgr_to_hsv(frame) 결과
+            with_contours (bool): True이면 각 객체의 외곽선 좌표를 contour에 채움
+            layout (str): frame의 채널 배치
+            
+        Returns:
+            dict: detect()와 같은 형식의 검출 결과 ('hsv'는 hsv_image)
+        """
+        frame = channel_view(frame, layout)
+        t = self.profiler.begin()
+        mask = self.create_mask(hsv_image, out=self._raw_mask_buffer(hsv_image.shape[:2]))
+        t = self.profiler.lap('mask', t)
+        return self._detect_from_mask(frame, hsv_image, mask, with_contours, t)
+    
+    def _raw_mask_buffer(self, shape: Tuple[int, int]) -> np.ndarray:
+        """모폴로지 전 마스크 버퍼 (모양이 같으면 재사용, 결과에는 모폴로지 출력만 포함됨)"""
+        if self._raw_mask is None or self._raw_mask.shape != shape:
+            self._raw_mask = np.empty(shape, dtype=np.uint8)
+        return self._raw_mask
+    
+    def _detect_from_mask(self, frame: np.ndarray, hsv_image: Optional[np.ndarray], mask: np.ndarray,
+                          with_contours: bool, t: float) -> dict:
+        """마스크 이후 단계 (모폴로지 → 라벨링 → 객체 생성 → 그리기)"""
+        profiler = self.profiler
         
-        # 3. 노이즈 제거 (팽창)
-        dilated_mask = self._dilate_compute(mask)
+        # 3. 노이즈 제거 (열림) 및 팽창
+        dilated_mask = self.apply_morphology(mask)
+        t = profiler.lap('morphology', t)
         
-        # 4. 윤곽선 찾기
-        contours_with_area = self.find_contours(dilated_mask)
+        # 4. 연결 요소 라벨링 (면적, 경계 사각형, 무게중심을 한 번에 계산)
+        labels, stats, centroids = connected_components_with_stats(dilated_mask)
         
         # 5. 객체 정보 생성
-        detected_objects = []
-        for contour, area in contours_with_area:
-            if area > 20: # 최소 면적 필터링
-                x, y, w, h = self.get_bounding_rect(contour)
-                detected_objects.append(DetectedObject(
-                    x=x, y=y, width=w, height=h, area=area, contour=contour
-                ))
+        detected_objects = self.objects_from_stats(stats, centroids)
+        t = profiler.lap('labeling', t)
+        if with_contours:
+            self.attach_contours(detected_objects, dilated_mask, labels)
+            t = profiler.lap('contours', t)
         
         # 6. 바운딩 박스가 그려진 프레임 생성 (추가)
         bbox_drawn_frame = self.draw_objects(frame.copy(), detected_objects) # 원본을 복사하여 그림
+        profiler.lap('draw', t)
         
         return {
             'hsv': hsv_image,
             'mask': dilated_mask,
+            'labels': labels,
             'objects': detected_objects,
             'bbox_frame': bbox_drawn_frame # 결과에 추가
         }
     
+    def create_class_mask(self, frame: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """등록된 모든 범위를 한 번에 검사하여 클래스 라벨 마스크 생성
+        
+        Args:
+            frame (np.ndarray): BGR 이미지 (BGRA도 가능)
+            out (Optional[np.ndarray]): (H, W) uint8 출력 버퍼
+            
+        Returns:
+            np.ndarray: 픽셀별 클래스 번호 (0: 배경, k: class_names[k - 1])
+        """
+        if out is None:
+            out = np.empty(frame.shape[:2], dtype=np.uint8)
+        lowers, uppers, class_ids = self._get_range_arrays()
+        return bgr_to_class_mask(frame, lowers, uppers, class_ids, out)
+    
+    def detect_classes(self, frame: np.ndarray, layout: str = LAYOUT_RGB) -> dict:
+        """등록된 이름 붙은 범위들로 다중 클래스 객체 검출
+        
+        프레임당 HSV 변환은 범위 수와 관계없이 한 번만 수행합니다. 모폴로지는
+        클래스별로 적용하며, 겹치는 픽셀은 먼저 등록된 클래스가 차지합니다.
+        
+        Args:
+            frame (np.ndarray): BGR 이미지
+            layout (str): frame의 채널 배치
+            
+        Returns:
+            dict: 검출 결과 
+                  {'mask': 클래스 라벨 마스크, 
+                   'labels': 라벨 이미지,
+                   'objects': class_name이 채워진 객체 리스트,
+                   'class_names': 클래스 이름 리스트,
+                   'bbox_frame': 클래스별 색상으로 바운딩 박스를 그린 프레임}
+        """
+        frame = channel_view(frame, layout)
+        class_mask = self.create_class_mask(frame)
+        
+        # 클래스별 모폴로지 (같은 클래스 픽셀끼리만 팽창/열림)
+        if self.morphology_radius() > 0:
+            merged = np.zeros_like(class_mask)
+            for class_id in range(1, len(self.class_names) + 1):
+                binary = np.where(class_mask == class_id, np.uint8(255), np.uint8(0))
+                morphed = self.apply_morphology(binary)
+                merged[(morphed > 0) & (merged == 0)] = class_id
+            class_mask = merged
+        
+        # 같은 클래스 값끼리만 연결되는 라벨링
+        labels = np.empty(class_mask.shape, dtype=np.int32)
+        _, raw = label_components(class_mask, labels)
+        stats, centroids = stats_from_raw(raw)
+        detected_objects = self.objects_from_stats(stats, centroids)
+        for obj in detected_objects:
+            obj.class_name = self.class_names[raw[obj.label - 1, RAW_VALUE] - 1]
+        
+        bbox_drawn_frame = frame.copy()
+        for class_id, name in enumerate(self.class_names):
+            color = CLASS_COLORS[class_id % len(CLASS_COLORS)]
+            self.draw_objects(bbox_drawn_frame, [o for o in detected_objects if o.class_name == name], color)
+        
+        return {
+            'mask': class_mask,
+            'labels': labels,
+            'objects': detected_objects,
+            'class_names': list(self.class_names),
+            'bbox_frame': bbox_drawn_frame,
+        }
+    
+    def detect_batch(self, frames: np.ndarray, layout: str = LAYOUT_RGB) -> dict:
+        """프레임 묶음에서 객체 검출 (녹화 영상 재분석 등 오프라인 처리용)
+        
+        임계값 처리와 라벨링은 묶음 전체에 대해 한 번씩 호출하며, 출력 버퍼는
+        같은 모양의 다음 호출에서 재사용됩니다. 결과를 보관하려면 복사해야 합니다.
+        
+        Args:
+            frames (np.ndarray): (N, H, W, C) BGR(또는 BGRA) 프레임 묶음
+            layout (str): frames의 채널 배치
+            
+        Returns:
+            dict: 검출 결과
+                  {'masks': (N, H, W) uint8 마스크,
+                   'labels': (N, H, W) int32 라벨 이미지,
+                   'objects': OBJECT_DTYPE 구조화 배열 (최소 면적 초과 요소),
+                   'counts': (N,) 프레임별 객체 수}
+        """
+        frames = channel_view(frames, layout)
+        n, height, width, channels = frames.shape
+        buffers = self._batch_buffers
+        if buffers is None or buffers[0].shape != (n, height, width):
+            buffers = (np.empty((n, height, width), dtype=np.uint8),
+                       np.empty((n, height, width), dtype=np.uint8),
+                       np.empty((n, height, width), dtype=np.int32))
+            self._batch_buffers = buffers
+        raw_masks, masks, labels = buffers
+        
+        # 1-2. 프레임을 세로로 이어 붙인 한 장의 이미지로 보고 한 번에 임계값 처리
+        self.threshold(frames.reshape(n * height, width, channels),
+                       out=raw_masks.reshape(n * height, width))
+        
+        # 3. 모폴로지는 프레임 경계를 넘지 않도록 프레임별로 적용
+        for i in range(n):
+            self.apply_morphology(raw_masks[i], out=masks[i])
+        
+        # 4. 묶음 전체 라벨링
+        counts, raw = label_batch(masks, labels)
+        stats, centroids = stats_from_raw(raw)
+        frame_index = np.repeat(np.arange(n, dtype=np.int32), counts)
+        local_label = (np.arange(raw.shape[0]) - np.repeat(np.cumsum(counts) - counts, counts) + 1)
+        
+        # 5. 최소 면적 필터링 후 객체 표 생성
+        table = self.object_table(stats, centroids, frame_index, local_label)
+        
+        return {
+            'masks': masks,
+            'labels': labels,
+            'objects': table,
+            'counts': np.bincount(table['frame'], minlength=n),
+        }
+    
+    def object_table(self, stats: np.ndarray, centroids: np.ndarray,
+                     frame_index: Optional[np.ndarray] = None,
+                     local_label: Optional[np.ndarray] = None) -> np.ndarray:
+        """연결 요소 통계에서 OBJECT_DTYPE 객체 표 생성 (최소 면적 필터링 포함)
+        
+        Args:
+            stats (np.ndarray): (n, 5) 통계 [x, y, w, h, area]
+            centroids (np.ndarray): (n, 2) 무게중심 [x, y]
+            frame_index (Optional[np.ndarray]): (n,) 요소별 프레임 번호 (기본값: 모두 0)
+            local_label (Optional[np.ndarray]): (n,) 요소별 라벨 번호 (기본값: 1..n)
+            
+        Returns:
+            np.ndarray: OBJECT_DTYPE 구조화 배열
+        """
+        keep = stats[:, STAT_AREA] > self.min_area
+        table = np.empty(int(keep.sum()), dtype=OBJECT_DTYPE)
+        table['frame'] = 0 if frame_index is None else frame_index[keep]
+        table['label'] = np.flatnonzero(keep) + 1 if local_label is None else local_label[keep]
+        table['x'] = stats[keep, STAT_X]
+        table['y'] = stats[keep, STAT_Y]
+        table['width'] = stats[keep, STAT_WIDTH]
+        table['height'] = stats[keep, STAT_HEIGHT]
+        table['area'] = stats[keep, STAT_AREA]
+        table['cx'] = centroids[keep, 0]
+        table['cy'] = centroids[keep, 1]
+        return table
+    
+    @staticmethod
+    def objects_from_table(table: np.ndarray) -> List[DetectedObject]:
+        """OBJECT_DTYPE 객체 표를 DetectedObject 리스트로 변환"""
+        return [DetectedObject(x=int(row['x']), y=int(row['y']),
+                               width=int(row['width']), height=int(row['height']),
+                               area=float(row['area']),
+                               centroid=(float(row['cx']), float(row['cy'])),
+                               label=int(row['label']))
+                for row in table]
+    
+    @staticmethod
+    def table_from_objects(objects: List[DetectedObject], frame_index: int = 0) -> np.ndarray:
+        """DetectedObject 리스트를 OBJECT_DTYPE 객체 표로 변환 (objects_from_table의 역변환)"""
+        table = np.empty(len(objects), dtype=OBJECT_DTYPE)
+        for i, obj in enumerate(objects):
+            table[i] = (frame_index, obj.label, obj.x, obj.y, obj.width, obj.height,
+                        obj.area, obj.centroid[0], obj.centroid[1])
+        return table
+    
+    def get_config(self) -> dict:
+        """결과에 영향을 주는 검출 설정 (다른 프로세스의 검출기에 전달용)"""
+        return {
+            'lower': self.lower_color.copy(),
+            'upper': self.upper_color.copy(),
+            'min_area': self.min_area,
+            'morphology': (self.morphology_stages, self.kernel_shape),
+        }
+    
+    def apply_config(self, config: dict):
+        """get_config()로 얻은 설정 적용"""
+        lower, upper = config['lower'], config['upper']
+        self.set_hsv_range(lower[0], upper[0], lower[1], upper[1], lower[2], upper[2])
+        self.min_area = config['min_area']
+        stages, shape = config['morphology']
+        self.set_morphology(shape=shape, stages=stages)
+    
+    def objects_from_stats(self, stats: np.ndarray, centroids: np.ndarray) -> List[DetectedObject]:
+        """연결 요소 통계에서 객체 리스트 생성 (최소 면적 필터링 포함)
+        
+        Args:
+            stats (np.ndarray): (n, 5) 통계 [x, y, w, h, area]
+            centroids (np.ndarray): (n, 2) 무게중심 [x, y]
+            
+        Returns:
+            List[DetectedObject]: 검출된 객체 리스트 (label은 1부터 시작하는 요소 번호)
+        """
+        detected_objects = []
+        for i in np.flatnonzero(stats[:, STAT_AREA] > self.min_area):
+            detected_objects.append(DetectedObject(
+                x=int(stats[i, STAT_X]), y=int(stats[i, STAT_Y]),
+                width=int(stats[i, STAT_WIDTH]), height=int(stats[i, STAT_HEIGHT]),
+                area=float(stats[i, STAT_AREA]),
+                centroid=(float(centroids[i, 0]), float(centroids[i, 1])),
+                label=int(i) + 1
+            ))
+        return detected_objects
+    
+    @staticmethod
+    def attach_contours(objects: List[DetectedObject], mask: np.ndarray, labels: np.ndarray):
+        """객체마다 순서가 정렬된 외곽선 좌표를 채움
+        
+        각 연결 요소의 외곽 경계는 하나이며, 그 시작점의 라벨로 객체와 대응시킵니다.
+        
+        Args:
+            objects (List[DetectedObject]): label이 채워진 객체 리스트
+            mask (np.ndarray): 라벨링에 사용한 마스크
+            labels (np.ndarray): 라벨 이미지
+        """
+        by_label = {obj.label: obj for obj in objects}
+        if not by_label:
+            return
+        contour_set = ContourSet(mask)
+        starts = contour_set.start_points
+        for i in contour_set.outer_indices():
+            obj = by_label.get(int(labels[starts[i, 1], starts[i, 0]]))
+            if obj is not None:
+                obj.contour = contour_set.points(i)
+    
     def draw_objects(self, frame: np.ndarray, objects: List[DetectedObject], 
                     color: Tuple[int, int, int] = (0, 255, 0), thickness: int = 2) -> np.ndarray: # thickness 추가
         """프레임에 검출된 객체 바운딩 박스 그리기 (NumPy 사용)
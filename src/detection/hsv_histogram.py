@@ -0,0 +1,114 @@
+"""
+HSV 3차원 히스토그램과 누적 합 테이블
+
+정적 이미지의 HSV 값을 (H, S, V) 히스토그램으로 한 번 세어 두고, 세 축으로
+누적한 합 테이블(summed-volume table)을 만들어 둡니다. 이후 어떤 HSV 범위든
+테이블 8칸의 포함-배제 계산으로 일치 픽셀 수를 바로 얻으므로, 슬라이더를
+움직이는 동안 마스크를 만들지 않고도 커버리지를 표시할 수 있습니다.
+
+H는 변환 결과 그대로(0-180) 구간을 나누고, S/V는 sv_bits 비트로 양자화합니다.
+양자화한 경우 범위 경계가 구간 경계와 맞지 않으면 경계 구간 전체를 포함하므로
+개수가 근사값이 됩니다 (sv_bits=8이면 정확하지만 테이블이 약 48MB입니다).
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numba import jit
+
+# bgr_to_hsv의 H 결과는 반올림 때문에 180까지 나올 수 있음
+HUE_BINS = 181
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def _count_hsv(hsv_image: np.ndarray, shift: int, hist: np.ndarray) -> np.ndarray:
+    """HSV 이미지의 픽셀을 (H, S >> shift, V >> shift) 구간별로 세기
+
+    Args:
+        hsv_image (np.ndarray): (H, W, 3) uint8 HSV 이미지
+        shift (int): S/V 양자화 시프트 (8 - sv_bits)
+        hist (np.ndarray): (HUE_BINS, 2**sv_bits, 2**sv_bits) int32 출력 (0으로 초기화된 상태)
+
+    Returns:
+        np.ndarray: hist
+    """
+    height, width = hsv_image.shape[:2]
+    for y in range(height):
+        for x in range(width):
+            hist[hsv_image[y, x, 0], hsv_image[y, x, 1] >> shift, hsv_image[y, x, 2] >> shift] += 1
+    return hist
+
+
+class HSVHistogram:
+    """HSV 범위별 픽셀 수를 O(1)로 조회하는 3차원 누적 히스토그램"""
+
+    def __init__(self, hsv_image: np.ndarray, sv_bits: int = 6):
+        """히스토그램 및 누적 합 테이블 생성
+
+        Args:
+            hsv_image (np.ndarray): (H, W, 3) uint8 HSV 이미지 (bgr_to_hsv 결과)
+            sv_bits (int): S/V 채널당 비트 수 (1-8, 기본 6 = 구간 폭 4)
+        """
+        if not 1 <= sv_bits <= 8:
+            raise ValueError(f"sv_bits must be in [1, 8]: {sv_bits}")
+        self.sv_bits = sv_bits
+        self.shift = 8 - sv_bits
+        self.total = int(hsv_image.shape[0] * hsv_image.shape[1])
+
+        bins = 1 << sv_bits
+        hist = _count_hsv(np.ascontiguousarray(hsv_image), self.shift,
+                          np.zeros((HUE_BINS, bins, bins), dtype=np.int32))
+        # table[h, s, v] = hist[:h, :s, :v]의 합 (앞쪽에 0 한 칸을 덧대어 경계 처리를 없앰)
+        table = np.zeros((HUE_BINS + 1, bins + 1, bins + 1), dtype=np.int32)
+        table[1:, 1:, 1:] = hist.cumsum(0).cumsum(1).cumsum(2)
+        self.table = table
+
+    def _box(self, h0: int, h1: int, s0: int, s1: int, v0: int, v1: int) -> int:
+        """반열린 구간 [h0, h1) x [s0, s1) x [v0, v1)의 합 (구간 인덱스 기준)"""
+        t = self.table
+        return int(t[h1, s1, v1] - t[h0, s1, v1] - t[h1, s0, v1] - t[h1, s1, v0]
+                   + t[h0, s0, v1] + t[h0, s1, v0] + t[h1, s0, v0] - t[h0, s0, v0])
+
+    def count(self, lower, upper) -> int:
+        """HSV 범위에 드는 픽셀 수 (하한/상한 포함)
+
+        H 하한이 상한보다 크면 0/179 경계를 넘는 범위(예: 170-10)로 봅니다.
+
+        Args:
+            lower: HSV 하한값 [H, S, V]
+            upper: HSV 상한값 [H, S, V]
+
+        Returns:
+            int: 일치 픽셀 수 (S/V를 양자화한 경우 근사값)
+        """
+        h_lower, s_lower, v_lower = (int(c) for c in lower)
+        h_upper, s_upper, v_upper = (int(c) for c in upper)
+        if s_lower > s_upper or v_lower > v_upper:
+            return 0
+        s0, s1 = s_lower >> self.shift, (s_upper >> self.shift) + 1
+        v0, v1 = v_lower >> self.shift, (v_upper >> self.shift) + 1
+        h_lower = max(h_lower, 0)
+        if h_lower <= h_upper:
+            return self._box(h_lower, min(h_upper, HUE_BINS - 1) + 1, s0, s1, v0, v1)
+        # 경계를 넘는 범위: [h_lower, 끝] + [0, h_upper]
+        return (self._box(min(h_lower, HUE_BINS), HUE_BINS, s0, s1, v0, v1)
+                + self._box(0, min(h_upper, HUE_BINS - 1) + 1, s0, s1, v0, v1))
+
+    def coverage(self, lower, upper) -> Tuple[int, float]:
+        """HSV 범위의 일치 픽셀 수와 전체 대비 비율
+
+        Args:
+            lower: HSV 하한값 [H, S, V]
+            upper: HSV 상한값 [H, S, V]
+
+        Returns:
+            Tuple[int, float]: (일치 픽셀 수, 비율 0.0-1.0)
+        """
+        matched = self.count(lower, upper)
+        return matched, (matched / self.total if self.total else 0.0)
+
+    def is_exact(self, lower, upper) -> bool:
+        """S/V 범위 경계가 양자화 구간 경계와 맞아 count가 정확한지 여부"""
+        step = 1 << self.shift
+        return all(int(lo) % step == 0 and (int(hi) + 1) % step == 0
+                   for lo, hi in ((lower[1], upper[1]), (lower[2], upper[2])))
@@ -0,0 +1,214 @@
+"""
+프레임 단위 HSV 변환 커널
+
+픽셀마다 Python에서 JIT 함수를 호출하던 방식을 대신하여,
+프레임 전체를 한 번의 컴파일된 병렬 루프로 처리합니다.
+"""
+
+import numpy as np
+from numba import jit, prange
+
+from src.detection.jit_cache import serial_variant
+
+# 입력 프레임의 채널 배치
+# 커널은 채널 0, 1, 2를 b, g, r 자리로 읽으며, 저장된 HSV 설정은
+# ScreenCapture.capture가 반환하는 배치(LAYOUT_RGB)를 기준으로 맞춰져 있습니다.
+LAYOUT_RGB = 'rgb'    # ScreenCapture.capture 기본 출력 (변환 없음)
+LAYOUT_BGR = 'bgr'    # 채널 순서가 반대인 3채널 프레임
+LAYOUT_BGRA = 'bgra'  # mss 원본 BGRA 버퍼
+LAYOUTS = (LAYOUT_RGB, LAYOUT_BGR, LAYOUT_BGRA)
+
+
+def channel_view(frame: np.ndarray, layout: str = LAYOUT_RGB) -> np.ndarray:
+    """프레임을 커널이 읽는 채널 배치의 뷰로 변환 (복사하지 않음)
+
+    Args:
+        frame (np.ndarray): (..., H, W, C) 프레임 또는 프레임 묶음
+        layout (str): frame의 채널 배치 (LAYOUTS 중 하나)
+
+    Returns:
+        np.ndarray: (..., H, W, 3) 뷰
+    """
+    if layout == LAYOUT_RGB:
+        return frame
+    if layout == LAYOUT_BGR:
+        return frame[..., ::-1]
+    if layout == LAYOUT_BGRA:
+        return frame[..., 2::-1]
+    raise ValueError(f"Unknown frame layout: {layout}")
+
+
+@jit(nopython=True, inline='always', cache=True)
+def _hsv_pixel(b, g, r):
+    """단일 픽셀의 BGR을 HSV로 변환 (모든 변환 커널과 색상 LUT가 공유하는 유일한 정의)
+
+    Args:
+        b (int): Blue 값 (0-255)
+        g (int): Green 값 (0-255)
+        r (int): Red 값 (0-255)
+
+    Returns:
+        Tuple[int, int, int]: (H(0-180), S(0-255), V(0-255))
+    """
+    b = b / 255.0
+    g = g / 255.0
+    r = r / 255.0
+
+    maxc = max(r, g, b)
+    minc = min(r, g, b)
+    v = maxc
+    diff = maxc - minc
+
+    s = 0.0 if maxc == 0 else (diff / maxc)
+
+    h = 0.0
+    if maxc != minc:
+        if maxc == r:
+            h = 60.0 * (g - b) / diff
+            if g < b:
+                h += 360.0
+        elif maxc == g:
+            h = 60.0 * (b - r) / diff + 120.0
+        else:
+            h = 60.0 * (r - g) / diff + 240.0
+
+    # OpenCV 범위로 변환
+    h = h / 2.0
+    s = s * 255.0
+    v = v * 255.0
+
+    return (min(max(round(h), 0), 180),
+            min(max(round(s), 0), 255),
+            min(max(round(v), 0), 255))
+
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def bgr_to_hsv_image(bgr_image: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """BGR 이미지 전체를 HSV로 변환하여 out에 기록
+
+    입력의 앞 3채널만 읽으므로 BGRA 이미지도 그대로 받을 수 있습니다.
+
+    Args:
+        bgr_image (np.ndarray): (H, W, C>=3) uint8 BGR 이미지
+        out (np.ndarray): (H, W, 3) uint8 출력 버퍼
+
+    Returns:
+        np.ndarray: out
+    """
+    height, width = bgr_image.shape[0], bgr_image.shape[1]
+    for y in prange(height):
+        for x in range(width):
+            h, s, v = _hsv_pixel(bgr_image[y, x, 0], bgr_image[y, x, 1], bgr_image[y, x, 2])
+            out[y, x, 0] = h
+            out[y, x, 1] = s
+            out[y, x, 2] = v
+    return out
+
+
+@jit(nopython=True, inline='always', cache=True)
+def _in_hsv_range(h, s, v, lower, upper):
+    """HSV 값이 범위 내에 있는지 확인 (모든 마스크 커널과 색상 LUT가 공유)
+
+    Args:
+        h, s, v (int): HSV 값
+        lower (np.ndarray): HSV 하한값 [H, S, V]
+        upper (np.ndarray): HSV 상한값 [H, S, V]
+
+    Returns:
+        bool: 범위 내에 있으면 True
+    """
+    # Hue는 원형이므로 하한 > 상한이면 경계를 넘어가는 범위로 처리
+    if lower[0] <= upper[0]:
+        h_match = lower[0] <= h <= upper[0]
+    else:
+        h_match = h >= lower[0] or h <= upper[0]
+
+    return h_match and lower[1] <= s <= upper[1] and lower[2] <= v <= upper[2]
+
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def bgr_to_mask(bgr_image: np.ndarray, lower: np.ndarray, upper: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """HSV 이미지를 만들지 않고 BGR 이미지에서 바로 마스크 생성
+
+    변환과 범위 검사를 한 루프에서 수행하므로 프레임을 한 번만 읽습니다.
+
+    Args:
+        bgr_image (np.ndarray): (H, W, C>=3) uint8 BGR 이미지
+        lower (np.ndarray): HSV 하한값 [H, S, V]
+        upper (np.ndarray): HSV 상한값 [H, S, V]
+        out (np.ndarray): (H, W) uint8 출력 마스크
+
+    Returns:
+        np.ndarray: out (범위 내 픽셀은 255)
+    """
+    height, width = bgr_image.shape[0], bgr_image.shape[1]
+    for y in prange(height):
+        for x in range(width):
+            h, s, v = _hsv_pixel(bgr_image[y, x, 0], bgr_image[y, x, 1], bgr_image[y, x, 2])
+            if _in_hsv_range(h, s, v, lower, upper):
+                out[y, x] = 255
+            else:
+                out[y, x] = 0
+    return out
+
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def hsv_to_mask(hsv_image: np.ndarray, lower: np.ndarray, upper: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """HSV 이미지에서 이진 마스크 생성
+
+    Hue 하한이 상한보다 크면 0/179 경계를 넘어가는 범위로 처리합니다.
+
+    Args:
+        hsv_image (np.ndarray): (H, W, 3) uint8 HSV 이미지
+        lower (np.ndarray): HSV 하한값 [H, S, V]
+        upper (np.ndarray): HSV 상한값 [H, S, V]
+        out (np.ndarray): (H, W) uint8 출력 마스크
+
+    Returns:
+        np.ndarray: out (범위 내 픽셀은 255)
+    """
+    height, width = hsv_image.shape[0], hsv_image.shape[1]
+    for y in prange(height):
+        for x in range(width):
+            if _in_hsv_range(hsv_image[y, x, 0], hsv_image[y, x, 1], hsv_image[y, x, 2], lower, upper):
+                out[y, x] = 255
+            else:
+                out[y, x] = 0
+    return out
+
+
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def bgr_to_class_mask(bgr_image: np.ndarray, lowers: np.ndarray, uppers: np.ndarray,
+                      class_ids: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """여러 HSV 범위를 한 번의 변환으로 검사하여 픽셀별 클래스 라벨 마스크 생성
+
+    범위 수와 관계없이 픽셀마다 HSV 변환은 한 번만 수행하며, 먼저 등록된 범위가
+    우선합니다.
+
+    Args:
+        bgr_image (np.ndarray): (H, W, C>=3) uint8 BGR 이미지
+        lowers (np.ndarray): (R, 3) uint8 범위별 HSV 하한값
+        uppers (np.ndarray): (R, 3) uint8 범위별 HSV 상한값
+        class_ids (np.ndarray): (R,) uint8 범위별 클래스 번호 (1부터)
+        out (np.ndarray): (H, W) uint8 출력 (일치하는 범위가 없으면 0)
+
+    Returns:
+        np.ndarray: out
+    """
+    height, width = bgr_image.shape[0], bgr_image.shape[1]
+    n_ranges = lowers.shape[0]
+    for y in prange(height):
+        for x in range(width):
+            h, s, v = _hsv_pixel(bgr_image[y, x, 0], bgr_image[y, x, 1], bgr_image[y, x, 2])
+            label = 0
+            for r in range(n_ranges):
+                if _in_hsv_range(h, s, v, lowers[r], uppers[r]):
+                    label = class_ids[r]
+                    break
+            out[y, x] = label
+    return out
+
+# 스레드 풀 작업자에서 동시에 호출하기 위한 단일 스레드 버전
+# (numba 기본 workqueue 스레딩 계층은 병렬 커널을 여러 스레드에서 동시에 실행할 수 없음)
+bgr_to_mask_serial = serial_variant(bgr_to_mask)
@@ -0,0 +1,273 @@
+"""
+타일 단위 증분 검출
+
+이전 프레임과 마스크를 보관해 두고, 바뀐 타일(및 모폴로지 커널 크기만큼의 주변)만
+변환 → 임계값 → 모폴로지를 다시 수행합니다. 정적인 화면에서는 대부분의 프레임이
+비교만으로 끝납니다. 결과는 전체 검출(CustomDetector.detect)과 동일합니다.
+"""
+
+import numpy as np
+from numba import jit, prange
+from typing import List, Tuple
+
+from src.capture.frame_pool import FramePool
+from src.detection.hsv_kernels import channel_view, LAYOUT_RGB
+from src.detection.labeling import connected_components_with_stats
+
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def _update_dirty_tiles(frame: np.ndarray, prev: np.ndarray, tile: int, dirty: np.ndarray) -> int:
+    """타일별 변경 여부를 판정하고 바뀐 타일을 prev에 복사
+
+    타일 안에서 처음 다른 픽셀을 찾으면 비교를 멈춥니다.
+
+    Args:
+        frame (np.ndarray): (H, W, C) 현재 프레임
+        prev (np.ndarray): (H, W, C) 이전 프레임 (바뀐 타일은 갱신됨)
+        tile (int): 타일 한 변의 크기
+        dirty (np.ndarray): (타일 행 수, 타일 열 수) bool 출력
+
+    Returns:
+        int: 바뀐 타일 수
+    """
+    height, width, channels = frame.shape
+    rows, cols = dirty.shape
+    for t in prange(rows * cols):
+        ty = t // cols
+        tx = t % cols
+        y0 = ty * tile
+        x0 = tx * tile
+        y1 = min(height, y0 + tile)
+        x1 = min(width, x0 + tile)
+        changed = False
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                for c in range(channels):
+                    if frame[y, x, c] != prev[y, x, c]:
+                        changed = True
+                        break
+                if changed:
+                    break
+            if changed:
+                break
+        dirty[ty, tx] = changed
+        if changed:
+            for y in range(y0, y1):
+                for x in range(x0, x1):
+                    for c in range(channels):
+                        prev[y, x, c] = frame[y, x, c]
+    count = 0
+    for ty in range(rows):
+        for tx in range(cols):
+            if dirty[ty, tx]:
+                count += 1
+    return count
+
+
+def _row_runs(tiles: np.ndarray) -> List[Tuple[int, int, int]]:
+    """타일 행마다 연속된 True 구간 목록 (행, 시작 열, 끝 열(미포함))"""
+    runs = []
+    for ty in np.flatnonzero(tiles.any(axis=1)):
+        row = np.concatenate(([False], tiles[ty], [False]))
+        edges = np.flatnonzero(row[1:] != row[:-1])
+        for start, end in zip(edges[::2], edges[1::2]):
+            runs.append((int(ty), int(start), int(end)))
+    return runs
+
+
+def _grow_tiles(tiles: np.ndarray, halo: int) -> np.ndarray:
+    """타일 마스크를 halo 타일만큼 사방으로 확장"""
+    if halo <= 0:
+        return tiles.copy()
+    rows, cols = tiles.shape
+    grown = np.zeros_like(tiles)
+    for ty, tx in zip(*np.nonzero(tiles)):
+        grown[max(0, ty - halo):min(rows, ty + halo + 1), max(0, tx - halo):min(cols, tx + halo + 1)] = True
+    return grown
+
+
+class IncrementalDetector:
+    """바뀐 화면 영역만 다시 처리하는 CustomDetector 래퍼
+
+    반환하는 mask와 bbox_frame은 버퍼 풀에서 빌린 버퍼이며, 결과를 다 쓴 사용자가
+    release()로 돌려주면 다음 프레임에 재사용됩니다 (돌려주지 않으면 새로 할당할 뿐
+    내용이 덮어써지지는 않음). 이전 프레임, 임계값 마스크, 라벨 이미지는 모양이 같은
+    동안 계속 재사용합니다.
+    """
+
+    def __init__(self, detector, tile_size: int = 32, draw: bool = True, pool_size: int = 4):
+        """증분 검출기 초기화
+
+        Args:
+            detector (CustomDetector): 임계값과 모폴로지 설정을 제공할 검출기
+            tile_size (int): 변경 비교 단위 타일 크기(픽셀)
+            draw (bool): 바운딩 박스를 그린 프레임을 만들지 여부 (False이면 bbox_frame은 None)
+            pool_size (int): mask/bbox_frame 버퍼 수 (검출기 보관 1 + 단계 사이 버퍼 + 표시 중)
+        """
+        self.detector = detector
+        self.tile_size = tile_size
+        self.draw = draw
+        self.pool_size = pool_size
+        self._prev = None
+        self._raw_mask = None
+        self._labels = None
+        self.reset()
+
+    def reset(self):
+        """보관 중인 결과를 버림 (다음 프레임은 전체 처리)
+
+        반환되었지만 아직 돌려받지 못한 버퍼는 이전 풀과 함께 버려집니다.
+        """
+        self._mask = None
+        self._objects = []
+        self._bbox_frame = None
+        self._config = None
+        self._valid = False
+        self._mask_pool = FramePool(self.pool_size)
+        self._bbox_pool = FramePool(self.pool_size)
+        self.last_dirty_tiles = 0
+
+    def release(self, buf: np.ndarray):
+        """결과의 mask 또는 bbox_frame 사용을 마침 (이 검출기의 풀 버퍼가 아니면 무시)"""
+        if buf is not None and not self._mask_pool.release(buf):
+            self._bbox_pool.release(buf)
+
+    def release_result(self, result: dict):
+        """detect() 결과의 풀 버퍼를 모두 돌려줌"""
+        self.release(result['mask'])
+        self.release(result['bbox_frame'])
+
+    def pool_stats(self) -> dict:
+        """mask/bbox_frame 버퍼 풀의 할당/부족 횟수"""
+        return {'mask': self._mask_pool.stats(), 'bbox': self._bbox_pool.stats()}
+
+    def _replace_mask(self, mask: np.ndarray):
+        """보관 마스크를 교체 (이전 마스크는 검출기가 보관하던 몫만 돌려줌)"""
+        previous, self._mask = self._mask, mask
+        if previous is not None:
+            self._mask_pool.release(previous)
+
+    def _draw(self, frame: np.ndarray):
+        """풀 버퍼에 프레임을 복사해 바운딩 박스를 그리고 보관 bbox_frame을 교체"""
+        bbox_frame = self._bbox_pool.acquire_or_allocate(frame.shape)
+        np.copyto(bbox_frame, frame)
+        self.detector.draw_objects(bbox_frame, self._objects)
+        previous, self._bbox_frame = self._bbox_frame, bbox_frame
+        if previous is not None:
+            self._bbox_pool.release(previous)
+
+    def _config_key(self):
+        """결과에 영향을 주는 검출기 설정 (바뀌면 전체 재처리)"""
+        d = self.detector
+        lut_ready = d.lut is not None and d.lut.lookup(d.lower_color, d.upper_color) is not None
+        return (d.lower_color.tobytes(), d.upper_color.tobytes(), lut_ready, d.min_area,
+                d.morphology_stages)
+
+    def _full(self, frame: np.ndarray, config) -> dict:
+        """전체 프레임 처리 후 상태 저장"""
+        d = self.detector
+        height, width = frame.shape[:2]
+        tile = self.tile_size
+        profiler = d.profiler
+        if self._prev is None or self._prev.shape != frame.shape:
+            # 모양이 바뀔 때만 상태 버퍼를 새로 할당 (뷰 입력도 연속 메모리로 복사됨)
+            self._prev = np.empty(frame.shape, dtype=np.uint8)
+            self._raw_mask = np.empty((height, width), dtype=np.uint8)
+            self._labels = np.empty((height, width), dtype=np.int32)
+            self._dirty = np.zeros(((height + tile - 1) // tile, (width + tile - 1) // tile), dtype=np.bool_)
+        np.copyto(self._prev, frame)
+        t = profiler.begin()
+        d.threshold(frame, out=self._raw_mask)
+        t = profiler.lap('threshold', t)
+        self._replace_mask(d.apply_morphology(self._raw_mask, out=self._mask_pool.acquire_or_allocate((height, width))))
+        t = profiler.lap('morphology', t)
+        _, stats, centroids = connected_components_with_stats(self._mask, labels=self._labels)
+        self._objects = d.objects_from_stats(stats, centroids)
+        t = profiler.lap('labeling', t)
+        if self.draw:
+            self._draw(frame)
+            profiler.lap('draw', t)
+        self._config = config
+        self._valid = True
+        self.last_dirty_tiles = self._dirty.size
+        return self._result()
+
+    def _result(self) -> dict:
+        # 같은 버퍼를 여러 결과로 반환할 수 있으므로 반환할 때마다 사용자 수를 늘림
+        self._mask_pool.retain(self._mask)
+        if self._bbox_frame is not None:
+            self._bbox_pool.retain(self._bbox_frame)
+        return {
+            'hsv': None,
+            'mask': self._mask,
+            'labels': self._labels,
+            'objects': self._objects,
+            'bbox_frame': self._bbox_frame,
+        }
+
+    def detect(self, frame: np.ndarray, layout: str = LAYOUT_RGB) -> dict:
+        """프레임에서 객체 검출 (CustomDetector.detect와 같은 형식의 결과)
+
+        반환된 mask와 bbox_frame은 이후 호출에서 수정되지 않으므로 다른 스레드로 그대로
+        넘길 수 있으며, 다 쓰면 release()로 돌려줍니다. labels는 다음 호출까지만 유효합니다.
+
+        Args:
+            frame (np.ndarray): BGR 이미지
+            layout (str): frame의 채널 배치 (mss 원본 BGRA 버퍼는 LAYOUT_BGRA)
+
+        Returns:
+            dict: 검출 결과 {'hsv': None, 'mask', 'labels', 'objects', 'bbox_frame'}
+        """
+        frame = channel_view(frame, layout)
+        config = self._config_key()
+        if not self._valid or self._prev.shape != frame.shape or config != self._config:
+            return self._full(frame, config)
+
+        d = self.detector
+        profiler = d.profiler
+        tile = self.tile_size
+        height, width = frame.shape[:2]
+        t = profiler.begin()
+        self.last_dirty_tiles = _update_dirty_tiles(frame, self._prev, tile, self._dirty)
+        t = profiler.lap('compare', t)
+        if self.last_dirty_tiles == 0:
+            return self._result()
+
+        # 1. 바뀐 타일만 다시 임계값 처리 (픽셀 단위 연산이므로 여백 불필요)
+        for ty, tx0, tx1 in _row_runs(self._dirty):
+            y0, y1 = ty * tile, min(height, (ty + 1) * tile)
+            x0, x1 = tx0 * tile, min(width, tx1 * tile)
+            d.threshold(frame[y0:y1, x0:x1], out=self._raw_mask[y0:y1, x0:x1])
+        t = profiler.lap('threshold', t)
+
+        # 2. 모폴로지 결과가 바뀔 수 있는 타일을 여백(halo)을 두고 다시 계산
+        radius = d.morphology_radius()
+        affected = _grow_tiles(self._dirty, (radius + tile - 1) // tile)
+        mask_changed = False
+        for ty, tx0, tx1 in _row_runs(affected):
+            y0, y1 = ty * tile, min(height, (ty + 1) * tile)
+            x0, x1 = tx0 * tile, min(width, tx1 * tile)
+            wy0, wy1 = max(0, y0 - radius), min(height, y1 + radius)
+            wx0, wx1 = max(0, x0 - radius), min(width, x1 + radius)
+            window = d.apply_morphology(self._raw_mask[wy0:wy1, wx0:wx1])
+            center = window[y0 - wy0:y1 - wy0, x0 - wx0:x1 - wx0]
+            if not np.array_equal(center, self._mask[y0:y1, x0:x1]):
+                if not mask_changed:
+                    # 이전에 반환한 마스크는 건드리지 않도록 풀 버퍼에 복사 후 갱신
+                    mask = self._mask_pool.acquire_or_allocate(self._mask.shape)
+                    np.copyto(mask, self._mask)
+                    self._replace_mask(mask)
+                    mask_changed = True
+                self._mask[y0:y1, x0:x1] = center
+        t = profiler.lap('morphology', t)
+
+        # 3. 마스크가 바뀐 경우에만 다시 라벨링
+        if mask_changed:
+            _, stats, centroids = connected_components_with_stats(self._mask, labels=self._labels)
+            self._objects = d.objects_from_stats(stats, centroids)
+            t = profiler.lap('labeling', t)
+
+        if self.draw:
+            self._draw(frame)
+            profiler.lap('draw', t)
+        return self._result()
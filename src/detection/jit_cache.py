@@ -0,0 +1,30 @@
+"""
+JIT 컴파일 결과 디스크 캐시 관련 도우미
+
+검출 커널은 모두 cache=True로 컴파일되어, 처음 실행할 때 만든 기계어를 소스 옆의
+__pycache__(쓰기 불가하면 사용자 캐시 디렉토리)에 저장하고 다음 실행부터 다시 읽습니다.
+"""
+
+import types
+from numba import jit
+
+
+def serial_variant(kernel):
+    """병렬 커널의 단일 스레드 버전 생성 (디스크 캐시 사용)
+
+    numba 캐시 파일은 함수 이름(qualname)과 정의 위치로만 구분되고 parallel 같은
+    컴파일 옵션은 구분하지 않으므로, 같은 py_func로 만든 두 버전이 서로의 캐시를
+    읽지 않도록 이름을 바꾼 복사본으로 컴파일합니다.
+
+    Args:
+        kernel: @jit(parallel=True)로 만든 디스패처
+
+    Returns:
+        nogil 단일 스레드 디스패처
+    """
+    func = kernel.py_func
+    copy = types.FunctionType(func.__code__, func.__globals__, func.__name__ + '_serial',
+                              func.__defaults__, func.__closure__)
+    copy.__qualname__ = func.__qualname__ + '_serial'
+    copy.__doc__ = func.__doc__
+    return jit(nopython=True, nogil=True, cache=True)(copy)
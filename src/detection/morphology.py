@@ -0,0 +1,291 @@
+"""
+분리형(separable) 모폴로지 연산
+
+가로/세로 1차원 패스로 나누고 각 패스를 van Herk/Gil-Werman 방식의
+블록 누적 최대/최소로 계산하여, 커널 크기와 무관하게 픽셀당 비용이 일정합니다.
+경계 밖은 팽창에서 0, 침식에서 255로 취급합니다 (OpenCV 기본값과 동일).
+"""
+
+import numpy as np
+from numba import jit, prange
+from collections import namedtuple
+from typing import Optional
+
+from src.detection.jit_cache import serial_variant
+
+# 세로 패스에서 한 번에 처리할 열 수 (행 방향 연속 메모리 접근 유지)
+_COLUMN_CHUNK = 64
+
+KERNEL_SHAPES = ('rect', 'cross', 'ellipse')
+
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def _line_pass_rows(src: np.ndarray, r: int, is_max: bool, out: np.ndarray) -> np.ndarray:
+    """가로 방향 길이 2r+1 선분 커널의 최대(팽창)/최소(침식) 필터
+
+    Args:
+        src (np.ndarray): (H, W) uint8 입력
+        r (int): 커널 반지름
+        is_max (bool): True이면 최대, False이면 최소
+        out (np.ndarray): (H, W) uint8 출력 (src와 달라야 함)
+
+    Returns:
+        np.ndarray: out
+    """
+    height, width = src.shape
+    k = 2 * r + 1
+    n = width + 2 * r
+    pad = np.uint8(0) if is_max else np.uint8(255)
+    for y in prange(height):
+        g = np.empty(n, dtype=np.uint8)  # 블록 시작부터의 누적값
+        h = np.empty(n, dtype=np.uint8)  # 블록 끝까지의 누적값
+        for i in range(n):
+            xs = i - r
+            v = src[y, xs] if 0 <= xs < width else pad
+            if i % k == 0:
+                g[i] = v
+            elif is_max:
+                g[i] = max(g[i - 1], v)
+            else:
+                g[i] = min(g[i - 1], v)
+        for i in range(n - 1, -1, -1):
+            xs = i - r
+            v = src[y, xs] if 0 <= xs < width else pad
+            if i == n - 1 or (i + 1) % k == 0:
+                h[i] = v
+            elif is_max:
+                h[i] = max(h[i + 1], v)
+            else:
+                h[i] = min(h[i + 1], v)
+        for x in range(width):
+            if is_max:
+                out[y, x] = max(h[x], g[x + k - 1])
+            else:
+                out[y, x] = min(h[x], g[x + k - 1])
+    return out
+
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def _line_pass_cols(src: np.ndarray, r: int, is_max: bool, out: np.ndarray) -> np.ndarray:
+    """세로 방향 길이 2r+1 선분 커널의 최대(팽창)/최소(침식) 필터
+
+    열을 묶음 단위로 나누어 행 방향으로 연속된 메모리를 읽습니다.
+
+    Args:
+        src (np.ndarray): (H, W) uint8 입력
+        r (int): 커널 반지름
+        is_max (bool): True이면 최대, False이면 최소
+        out (np.ndarray): (H, W) uint8 출력 (src와 달라야 함)
+
+    Returns:
+        np.ndarray: out
+    """
+    height, width = src.shape
+    k = 2 * r + 1
+    n = height + 2 * r
+    pad = np.uint8(0) if is_max else np.uint8(255)
+    n_chunks = (width + _COLUMN_CHUNK - 1) // _COLUMN_CHUNK
+    for c in prange(n_chunks):
+        x0 = c * _COLUMN_CHUNK
+        x1 = min(width, x0 + _COLUMN_CHUNK)
+        cw = x1 - x0
+        g = np.empty((n, cw), dtype=np.uint8)
+        h = np.empty((n, cw), dtype=np.uint8)
+        for i in range(n):
+            ys = i - r
+            inside = 0 <= ys < height
+            start = i % k == 0
+            for j in range(cw):
+                v = src[ys, x0 + j] if inside else pad
+                if start:
+                    g[i, j] = v
+                elif is_max:
+                    g[i, j] = max(g[i - 1, j], v)
+                else:
+                    g[i, j] = min(g[i - 1, j], v)
+        for i in range(n - 1, -1, -1):
+            ys = i - r
+            inside = 0 <= ys < height
+            end = i == n - 1 or (i + 1) % k == 0
+            for j in range(cw):
+                v = src[ys, x0 + j] if inside else pad
+                if end:
+                    h[i, j] = v
+                elif is_max:
+                    h[i, j] = max(h[i + 1, j], v)
+                else:
+                    h[i, j] = min(h[i + 1, j], v)
+        for y in range(height):
+            for j in range(cw):
+                if is_max:
+                    out[y, x0 + j] = max(h[y, j], g[y + k - 1, j])
+                else:
+                    out[y, x0 + j] = min(h[y, j], g[y + k - 1, j])
+    return out
+
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def _combine(a: np.ndarray, b: np.ndarray, is_max: bool, out: np.ndarray) -> np.ndarray:
+    """두 결과의 픽셀별 최대/최소 (out은 a 또는 b와 같아도 됨)"""
+    height, width = a.shape
+    for y in prange(height):
+        for x in range(width):
+            if is_max:
+                out[y, x] = max(a[y, x], b[y, x])
+            else:
+                out[y, x] = min(a[y, x], b[y, x])
+    return out
+
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def _accumulate_shifted(line: np.ndarray, dy: int, is_max: bool, out: np.ndarray) -> np.ndarray:
+    """out[y] = max/min(out[y], line[y + dy]) (범위 밖 행은 무시)"""
+    height, width = line.shape
+    for y in prange(height):
+        ys = y + dy
+        if 0 <= ys < height:
+            for x in range(width):
+                if is_max:
+                    out[y, x] = max(out[y, x], line[ys, x])
+                else:
+                    out[y, x] = min(out[y, x], line[ys, x])
+    return out
+
+
+_Kernels = namedtuple('_Kernels', ['rows', 'cols', 'combine', 'shifted'])
+
+_PARALLEL = _Kernels(_line_pass_rows, _line_pass_cols, _combine, _accumulate_shifted)
+
+# 스레드 풀 작업자에서 동시에 호출하기 위한 단일 스레드 버전
+# (numba 기본 workqueue 스레딩 계층은 병렬 커널을 여러 스레드에서 동시에 실행할 수 없음)
+_SERIAL = _Kernels(*(serial_variant(k) for k in _PARALLEL))
+
+
+def _ellipse_half_widths(size: int) -> np.ndarray:
+    """타원 커널의 행별 가로 반지름 (OpenCV MORPH_ELLIPSE와 같은 모양)"""
+    r = size // 2
+    if r == 0:
+        return np.zeros(1, dtype=np.int64)
+    dy = np.arange(-r, r + 1)
+    return np.round(np.sqrt(np.maximum(r * r - dy * dy, 0))).astype(np.int64)
+
+
+def _apply_once(src: np.ndarray, size: int, shape: str, is_max: bool, out: np.ndarray,
+                kernels: _Kernels) -> np.ndarray:
+    """구조 요소 한 번 적용 (src와 out은 달라야 함)"""
+    r = size // 2
+    if shape == 'rect':
+        tmp = np.empty_like(src)
+        kernels.rows(src, r, is_max, tmp)
+        return kernels.cols(tmp, r, is_max, out)
+    if shape == 'cross':
+        tmp = np.empty_like(src)
+        kernels.rows(src, r, is_max, tmp)
+        kernels.cols(src, r, is_max, out)
+        return kernels.combine(out, tmp, is_max, out)
+    if shape == 'ellipse':
+        # 행마다 다른 길이의 가로 선분을 적용한 뒤 세로로 이동시켜 합침
+        half_widths = _ellipse_half_widths(size)
+        out[...] = 0 if is_max else 255
+        done = {}
+        for i, w in enumerate(half_widths):
+            w = int(w)
+            if w not in done:
+                done[w] = kernels.rows(src, w, is_max, np.empty_like(src))
+            kernels.shifted(done[w], i - r, is_max, out)
+        return out
+    raise ValueError(f"Unknown kernel shape: {shape}")
+
+
+def _morph(mask: np.ndarray, size: int, iterations: int, shape: str, is_max: bool,
+           out: Optional[np.ndarray], serial: bool) -> np.ndarray:
+    """팽창/침식 반복 적용"""
+    kernels = _SERIAL if serial else _PARALLEL
+    mask = np.ascontiguousarray(mask, dtype=np.uint8)
+    if out is None:
+        out = np.empty_like(mask)
+    if size <= 1 or iterations <= 0:
+        out[...] = mask
+        return out
+
+    # 사각형 커널은 n번 반복이 크기 n*(size-1)+1 한 번과 같음
+    if shape == 'rect':
+        size, iterations = iterations * (size // 2) * 2 + 1, 1
+
+    src = mask
+    spare = np.empty_like(mask)
+    for i in range(iterations):
+        dst = out if (iterations - i) % 2 == 1 else spare
+        _apply_once(src, size, shape, is_max, dst, kernels)
+        src = dst
+    return out
+
+
+def dilate(mask: np.ndarray, size: int = 3, iterations: int = 1, shape: str = 'rect',
+           out: Optional[np.ndarray] = None, serial: bool = False) -> np.ndarray:
+    """팽창 연산
+
+    Args:
+        mask (np.ndarray): (H, W) uint8 마스크
+        size (int): 커널 크기 (홀수 권장)
+        iterations (int): 반복 횟수
+        shape (str): 커널 모양 ('rect', 'cross', 'ellipse')
+        out (Optional[np.ndarray]): 결과를 기록할 버퍼 (mask와 달라야 함)
+        serial (bool): 단일 스레드 커널 사용 (여러 스레드에서 동시에 호출할 때)
+
+    Returns:
+        np.ndarray: 팽창된 마스크
+    """
+    return _morph(mask, size, iterations, shape, True, out, serial)
+
+
+def erode(mask: np.ndarray, size: int = 3, iterations: int = 1, shape: str = 'rect',
+          out: Optional[np.ndarray] = None, serial: bool = False) -> np.ndarray:
+    """침식 연산 (인자는 dilate와 동일)"""
+    return _morph(mask, size, iterations, shape, False, out, serial)
+
+
+def opening(mask: np.ndarray, size: int = 3, iterations: int = 1, shape: str = 'rect',
+            out: Optional[np.ndarray] = None, serial: bool = False) -> np.ndarray:
+    """열림 연산 (침식 후 팽창, 작은 잡음 제거)"""
+    return dilate(erode(mask, size, iterations, shape, serial=serial), size, iterations, shape, out, serial)
+
+
+def closing(mask: np.ndarray, size: int = 3, iterations: int = 1, shape: str = 'rect',
+            out: Optional[np.ndarray] = None, serial: bool = False) -> np.ndarray:
+    """닫힘 연산 (팽창 후 침식, 작은 구멍 메우기)"""
+    return erode(dilate(mask, size, iterations, shape, serial=serial), size, iterations, shape, out, serial)
+
+
+# 검출기 후처리 단계에서 쓸 수 있는 연산 이름
+OPERATIONS = ('erode', 'dilate', 'open', 'close')
+
+
+def apply_stage(mask: np.ndarray, operation: str, size: int, iterations: int = 1,
+                shape: str = 'rect', out: Optional[np.ndarray] = None,
+                serial: bool = False) -> np.ndarray:
+    """이름으로 지정한 연산 한 단계 적용 (인자는 dilate와 동일)
+
+    Args:
+        operation (str): OPERATIONS 중 하나
+
+    Returns:
+        np.ndarray: 연산 결과
+    """
+    if operation == 'erode':
+        return erode(mask, size, iterations, shape, out, serial)
+    if operation == 'dilate':
+        return dilate(mask, size, iterations, shape, out, serial)
+    if operation == 'open':
+        return opening(mask, size, iterations, shape, out, serial)
+    if operation == 'close':
+        return closing(mask, size, iterations, shape, out, serial)
+    raise ValueError(f"Unknown morphology operation: {operation}")
+
+
+def stage_radius(operation: str, size: int, iterations: int = 1) -> int:
+    """한 단계가 영향을 미치는 최대 거리(픽셀) (열림/닫힘은 두 번 적용하므로 2배)"""
+    if size <= 1 or iterations <= 0:
+        return 0
+    radius = (size // 2) * iterations
+    return 2 * radius if operation in ('open', 'close') else radius
@@ -0,0 +1,97 @@
+"""
+가로 스트립 병렬 검출
+
+프레임을 가로 스트립으로 나누어 스레드 풀에서 임계값 → 모폴로지 → 라벨링을
+동시에 수행하고, 스트립 경계를 넘는 요소는 마지막에 합칩니다. 각 작업자는 GIL을
+해제하는 단일 스레드 커널을 사용하므로 코어 수에 비례하여 빨라집니다.
+결과는 전체 검출(CustomDetector.detect)과 동일합니다.
+"""
+
+import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from src.detection.hsv_kernels import channel_view, LAYOUT_RGB
+from src.detection.labeling import (label_components, merge_strips, relabel, stats_from_raw,
+                                    RAW_COLUMNS)
+
+
+class StripParallelDetector:
+    """스레드 풀에서 스트립 단위로 처리하는 CustomDetector 래퍼"""
+
+    def __init__(self, detector, workers: Optional[int] = None, min_strip_rows: int = 32):
+        """스트립 병렬 검출기 초기화
+
+        Args:
+            detector (CustomDetector): 임계값과 모폴로지 설정을 제공할 검출기
+            workers (Optional[int]): 작업 스레드 수 (기본값: CPU 코어 수)
+            min_strip_rows (int): 스트립 하나의 최소 행 수 (작은 프레임은 스트립 수를 줄임)
+        """
+        self.detector = detector
+        self.workers = workers or os.cpu_count() or 1
+        self.min_strip_rows = min_strip_rows
+        self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                            thread_name_prefix='strip-detector')
+
+    def close(self):
+        """스레드 풀 종료"""
+        self._executor.shutdown(wait=True)
+
+    def _strip_starts(self, height: int) -> np.ndarray:
+        """스트립 시작 행 목록"""
+        count = max(1, min(self.workers, height // max(1, self.min_strip_rows)))
+        return (np.arange(count) * height) // count
+
+    def _process_strip(self, frame, mask, labels, y0, y1, radius):
+        """스트립 하나의 임계값/모폴로지/라벨링 (작업 스레드에서 실행)"""
+        d = self.detector
+        height = frame.shape[0]
+        # 모폴로지 경계 효과가 스트립 안쪽에 닿지 않도록 위아래 여백을 두고 처리
+        wy0, wy1 = max(0, y0 - radius), min(height, y1 + radius)
+        raw = d.threshold(frame[wy0:wy1], serial=True)
+        morphed = d.apply_morphology(raw, serial=True)
+        mask[y0:y1] = morphed[y0 - wy0:y1 - wy0]
+        return label_components(mask[y0:y1], labels[y0:y1], y0)
+
+    def detect(self, frame: np.ndarray, layout: str = LAYOUT_RGB) -> dict:
+        """프레임에서 객체 검출 (CustomDetector.detect와 같은 형식의 결과)
+
+        Args:
+            frame (np.ndarray): BGR 이미지
+            layout (str): frame의 채널 배치
+
+        Returns:
+            dict: 검출 결과 {'hsv': None, 'mask', 'labels', 'objects', 'bbox_frame'}
+        """
+        frame = channel_view(frame, layout)
+        d = self.detector
+        height, width = frame.shape[:2]
+        mask = np.empty((height, width), dtype=np.uint8)
+        labels = np.empty((height, width), dtype=np.int32)
+        radius = d.morphology_radius()
+
+        starts = self._strip_starts(height)
+        ends = np.append(starts[1:], height)
+        futures = [self._executor.submit(self._process_strip, frame, mask, labels, int(y0), int(y1), radius)
+                   for y0, y1 in zip(starts, ends)]
+        results = [f.result() for f in futures]
+
+        # 스트립 경계를 넘는 요소 병합
+        counts = np.array([n for n, _ in results], dtype=np.int64)
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+        raw = np.concatenate([r for _, r in results]) if len(results) > 1 else results[0][1]
+        raw = raw.reshape(-1, RAW_COLUMNS)
+        final, merged = merge_strips(mask, labels, starts.astype(np.int64), offsets, raw)
+        list(self._executor.map(lambda i: relabel(labels[starts[i]:ends[i]], int(offsets[i]), final),
+                                range(len(starts))))
+
+        stats, centroids = stats_from_raw(merged)
+        objects = d.objects_from_stats(stats, centroids)
+        return {
+            'hsv': None,
+            'mask': mask,
+            'labels': labels,
+            'objects': objects,
+            'bbox_frame': d.draw_objects(frame.copy(), objects),
+        }
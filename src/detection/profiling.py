@@ -0,0 +1,139 @@
+"""
+검출 단계별 실행 시간 계측
+
+검출기와 파이프라인은 profiler.begin()/lap()으로 단계 시간을 기록합니다. 기본값인
+NULL_PROFILER는 아무것도 기록하지 않으므로 계측을 끄면 단계마다 빈 메서드 호출
+한 번의 비용만 남습니다.
+
+StageProfiler는 단계마다 최근 window개의 시간을 고정 크기 링 버퍼에 보관하고,
+요약을 요청할 때만 백분위수(p50/p95/p99)와 FPS를 계산합니다.
+"""
+
+import time
+import threading
+from typing import Dict, Optional
+
+import numpy as np
+
+
+class NullProfiler:
+    """계측을 끈 상태의 프로파일러 (모든 호출이 아무것도 하지 않음)"""
+
+    enabled = False
+
+    def begin(self) -> float:
+        return 0.0
+
+    def lap(self, stage: str, start: float) -> float:
+        return 0.0
+
+    def record(self, stage: str, seconds: float):
+        pass
+
+    def frame_done(self):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class StageProfiler:
+    """단계별 실행 시간 롤링 버퍼
+
+    사용 예)
+        t = profiler.begin()
+        mask = detector.threshold(frame)
+        t = profiler.lap('threshold', t)
+
+    같은 단계를 여러 스레드(캡처/검출/UI 등)에서 기록할 수 있으므로 링 버퍼의
+    위치와 개수 갱신은 잠금 안에서 합니다.
+    """
+
+    enabled = True
+
+    def __init__(self, window: int = 240):
+        """프로파일러 초기화
+
+        Args:
+            window (int): 단계마다 보관할 최근 기록 수
+        """
+        self.window = window
+        self._samples: Dict[str, np.ndarray] = {}
+        self._counts: Dict[str, int] = {}
+        self._frame_times = np.zeros(window, dtype=np.float64)
+        self._frames = 0
+        self._lock = threading.Lock()
+
+    def begin(self) -> float:
+        """구간 측정 시작 시각"""
+        return time.perf_counter()
+
+    def lap(self, stage: str, start: float) -> float:
+        """start 이후 경과 시간을 stage로 기록
+
+        Returns:
+            float: 현재 시각 (다음 단계의 start로 사용)
+        """
+        now = time.perf_counter()
+        self.record(stage, now - start)
+        return now
+
+    def record(self, stage: str, seconds: float):
+        """stage의 실행 시간(초) 기록"""
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = np.zeros(self.window, dtype=np.float64)
+                self._counts[stage] = 0
+            count = self._counts[stage]
+            samples[count % self.window] = seconds
+            self._counts[stage] = count + 1
+
+    def frame_done(self):
+        """프레임 하나의 처리 완료 기록 (FPS 계산용)"""
+        now = time.perf_counter()
+        with self._lock:
+            self._frame_times[self._frames % self.window] = now
+            self._frames += 1
+
+    def fps(self) -> float:
+        """최근 window 프레임의 평균 FPS"""
+        n = min(self._frames, self.window)
+        if n < 2:
+            return 0.0
+        newest = (self._frames - 1) % self.window
+        oldest = (self._frames - n) % self.window
+        span = self._frame_times[newest] - self._frame_times[oldest]
+        return (n - 1) / span if span > 0 else 0.0
+
+    def summary(self) -> dict:
+        """단계별 백분위수 요약
+
+        Returns:
+            dict: {'fps': float, 'stages': {단계: {'count', 'p50', 'p95', 'p99'} (ms)}}
+        """
+        stages = {}
+        for stage, samples in list(self._samples.items()):
+            count = self._counts[stage]
+            n = min(count, self.window)
+            if n == 0:
+                continue
+            p50, p95, p99 = np.percentile(samples[:n], (50, 95, 99)) * 1000.0
+            stages[stage] = {'count': count, 'p50': round(float(p50), 3),
+                             'p95': round(float(p95), 3), 'p99': round(float(p99), 3)}
+        return {'fps': round(self.fps(), 1), 'stages': stages}
+
+    def format_summary(self, summary: Optional[dict] = None) -> str:
+        """상태 표시줄용 한 줄 요약 ("FPS 60.0 | 단계 p50/p95/p99 ms ...")"""
+        summary = summary or self.summary()
+        parts = [f"FPS {summary['fps']:.1f}"]
+        for stage, s in summary['stages'].items():
+            parts.append(f"{stage} {s['p50']:.1f}/{s['p95']:.1f}/{s['p99']:.1f}")
+        return " | ".join(parts) + " (ms p50/p95/p99)"
+
+    def reset(self):
+        """기록 초기화"""
+        with self._lock:
+            self._samples = {}
+            self._counts = {}
+            self._frames = 0
@@ -0,0 +1,137 @@
+"""
+시작 시 검출 커널 미리 컴파일(워밍업) 및 시작 시간 측정
+
+실시간 캡처를 시작하기 전에 실제로 사용할 자료형과 배열 배치로 모든 커널을 한 번씩
+실행해 두면, 첫 프레임이 JIT 컴파일 때문에 수 초씩 멈추지 않습니다. 디스크 캐시가
+있으면 이 단계는 컴파일 대신 캐시 로드만 합니다.
+"""
+
+import sys
+import time
+import numpy as np
+from numba.core.registry import CPUDispatcher
+from typing import List, Optional, Tuple
+
+from src.detection.hsv_histogram import HSVHistogram
+from src.detection.labeling import connected_components_with_stats
+
+
+class StartupTimer:
+    """시작 단계별 소요 시간 기록"""
+
+    def __init__(self, start: Optional[float] = None):
+        """타이머 초기화
+
+        Args:
+            start (Optional[float]): 기준 시각 (time.perf_counter 값, 기본값: 지금)
+        """
+        self.start = time.perf_counter() if start is None else start
+        self._last = self.start
+        self.stages: List[Tuple[str, float]] = []
+
+    def mark(self, name: str) -> float:
+        """직전 mark 이후 걸린 시간을 name 단계로 기록
+
+        Returns:
+            float: 기록한 단계의 소요 시간(초)
+        """
+        now = time.perf_counter()
+        elapsed = now - self._last
+        self.stages.append((name, elapsed))
+        self._last = now
+        return elapsed
+
+    def total(self) -> float:
+        """기준 시각부터 마지막 mark까지의 시간(초)"""
+        return self._last - self.start
+
+    def report(self) -> str:
+        """단계별 소요 시간 표"""
+        width = max([len(name) for name, _ in self.stages] + [5])
+        lines = [f"  {name:<{width}}  {seconds * 1000.0:9.1f} ms" for name, seconds in self.stages]
+        lines.append(f"  {'total':<{width}}  {self.total() * 1000.0:9.1f} ms")
+        return "\n".join(lines)
+
+
+def kernel_cache_stats() -> dict:
+    """지금까지 로드/컴파일된 검출 커널 수
+
+    Returns:
+        dict: {'cache_hits': 디스크 캐시에서 읽은 수, 'cache_misses': 새로 컴파일한 수}
+    """
+    hits = misses = 0
+    seen = set()
+    for name, module in list(sys.modules.items()):
+        if not name.startswith('src.detection') or module is None:
+            continue
+        candidates = list(vars(module).values())
+        for value in vars(module).values():
+            if isinstance(value, type):
+                candidates.extend(v.__func__ if isinstance(v, staticmethod) else v
+                                  for v in vars(value).values())
+            elif isinstance(value, tuple):
+                candidates.extend(value)
+        for value in candidates:
+            if isinstance(value, CPUDispatcher) and id(value) not in seen:
+                seen.add(id(value))
+                stats = value.stats
+                hits += sum(stats.cache_hits.values())
+                misses += sum(stats.cache_misses.values())
+    return {'cache_hits': hits, 'cache_misses': misses}
+
+
+def warm_up(detector, frame_shape: Tuple[int, int, int] = (320, 320, 3), incremental=None,
+            contours: bool = False, timer: Optional[StartupTimer] = None) -> StartupTimer:
+    """검출에 쓰이는 모든 커널을 실제 사용할 형식의 빈 프레임으로 한 번씩 실행
+
+    Args:
+        detector (CustomDetector): 설정(LUT 사용 여부, 모폴로지 모양 등)이 끝난 검출기
+        frame_shape (Tuple[int, int, int]): 캡처 프레임 모양 (H, W, C)
+        incremental (Optional[IncrementalDetector]): 함께 준비할 증분 검출기
+        contours (bool): 윤곽선 추적 커널도 준비할지 여부
+        timer (Optional[StartupTimer]): 단계별 시간을 기록할 타이머 (없으면 새로 생성)
+
+    Returns:
+        StartupTimer: 단계별 소요 시간이 기록된 타이머
+    """
+    timer = timer or StartupTimer()
+    frame = np.zeros(frame_shape, dtype=np.uint8)
+
+    # 1. 변환 + 임계값 (LUT를 쓰면 현재 범위의 테이블도 미리 생성)
+    mask = detector.threshold(frame)
+    if detector.lut is not None:
+        detector.lut.build(detector.lower_color, detector.upper_color)
+        mask = detector.threshold(frame)
+    timer.mark('warmup: threshold')
+
+    # 2. HSV 이미지 경로 (정적 이미지 재처리 및 커버리지 히스토그램용)
+    hsv_image = detector.bgr_to_hsv(frame)
+    detector.create_mask(hsv_image)
+    HSVHistogram(hsv_image)
+    timer.mark('warmup: hsv image')
+
+    # 3. 모폴로지
+    morphed = detector.apply_morphology(mask)
+    timer.mark('warmup: morphology')
+
+    # 4. 라벨링
+    connected_components_with_stats(morphed)
+    timer.mark('warmup: labeling')
+
+    # 5. 증분 검출 (변경 비교 커널과 타일 단위(비연속 배열) 임계값 경로)
+    if incremental is not None:
+        incremental.detect(frame)
+        changed = frame.copy()
+        changed[0, 0] = 1
+        incremental.detect(changed)
+        incremental.reset()
+        timer.mark('warmup: incremental')
+
+    if contours:
+        detector.find_contours(morphed)
+        timer.mark('warmup: contours')
+
+    # 6. 전체 detect 경로 (Python 부분 포함)
+    detector.detect(frame)
+    timer.mark('warmup: detect')
+    return timer
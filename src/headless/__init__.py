@@ -0,0 +1,3 @@
+"""
+헤드리스(UI 없는) 실행 관련 모듈
+""" 
\ No newline at end of file
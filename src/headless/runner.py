@@ -0,0 +1,130 @@
+"""
+UI 없이 캡처 → 검출을 반복하며 검출 결과를 스트림으로 출력
+
+출력 형식
+- jsonl: 프레임마다 한 줄
+  {"frame": n, "time": 유닉스 시각, "objects": [{"x", "y", "width", "height", "area", "cx", "cy"}, ...]}
+- binary: 프레임마다 RECORD_HEADER (매직 b'HSVF', 프레임 번호 uint32, 시각 float64,
+  객체 수 uint32, 리틀 엔디언) 뒤에 객체 수만큼 OBJECT_DTYPE 레코드
+"""
+
+import itertools
+import json
+import struct
+import time
+from typing import BinaryIO, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+import numpy as np
+
+from src.detection.custom_detector import CustomDetector, DetectedObject, OBJECT_DTYPE
+from src.detection.profiling import NULL_PROFILER
+
+RECORD_MAGIC = b'HSVF'
+RECORD_HEADER = struct.Struct('<4sIdI')
+
+
+class JsonLinesWriter:
+    """프레임마다 JSON 한 줄을 쓰는 출력기"""
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def write(self, frame_index: int, timestamp: float, objects: List[DetectedObject]):
+        record = {
+            'frame': frame_index,
+            'time': round(timestamp, 6),
+            'objects': [{'x': o.x, 'y': o.y, 'width': o.width, 'height': o.height,
+                         'area': o.area, 'cx': round(o.centroid[0], 3), 'cy': round(o.centroid[1], 3)}
+                        for o in objects],
+        }
+        self.stream.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self.stream.flush()
+
+
+class BinaryRecordWriter:
+    """프레임마다 고정 헤더 + OBJECT_DTYPE 레코드를 쓰는 출력기"""
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+
+    def write(self, frame_index: int, timestamp: float, objects: List[DetectedObject]):
+        table = CustomDetector.table_from_objects(objects, frame_index)
+        self.stream.write(RECORD_HEADER.pack(RECORD_MAGIC, frame_index, timestamp, len(table)))
+        self.stream.write(table.tobytes())
+        self.stream.flush()
+
+
+def read_binary_records(stream: BinaryIO) -> Iterator[Tuple[int, float, np.ndarray]]:
+    """BinaryRecordWriter 출력 읽기
+
+    Yields:
+        Tuple[int, float, np.ndarray]: (프레임 번호, 시각, OBJECT_DTYPE 배열)
+
+    Raises:
+        ValueError: 레코드 형식이 맞지 않는 경우
+    """
+    while True:
+        header = stream.read(RECORD_HEADER.size)
+        if not header:
+            return
+        if len(header) < RECORD_HEADER.size:
+            raise ValueError("Truncated record header")
+        magic, frame_index, timestamp, count = RECORD_HEADER.unpack(header)
+        if magic != RECORD_MAGIC:
+            raise ValueError(f"Bad record magic: {magic!r}")
+        body = stream.read(count * OBJECT_DTYPE.itemsize)
+        if len(body) < count * OBJECT_DTYPE.itemsize:
+            raise ValueError("Truncated record body")
+        yield frame_index, timestamp, np.frombuffer(body, dtype=OBJECT_DTYPE)
+
+
+def run(frames: Iterable[np.ndarray], detect, writer, max_frames: Optional[int] = None,
+        governor=None, profiler=None, release=None) -> dict:
+    """프레임을 검출하여 writer로 출력하는 반복 실행
+
+    Args:
+        frames (Iterable[np.ndarray]): 프레임 반복자 (끝나면 종료)
+        detect: 프레임을 받아 {'objects': ...}를 반환하는 함수
+        writer: write(frame_index, timestamp, objects)를 가진 출력기
+        max_frames (Optional[int]): 처리할 최대 프레임 수
+        governor (Optional[FrameGovernor]): 목표 FPS 조절 (None이면 최대 속도)
+        profiler (Optional[StageProfiler]): 프레임 읽기/검출/출력 시간 기록
+        release: 출력을 마친 검출 결과를 받아 풀 버퍼를 돌려주는 함수 (None이면 호출 안 함)
+
+    Returns:
+        dict: {'frames': 처리한 프레임 수, 'objects': 출력한 객체 수, 'seconds': 소요 시간, 'fps'}
+    """
+    profiler = profiler or NULL_PROFILER
+    count = 0
+    total_objects = 0
+    if max_frames is not None:
+        frames = itertools.islice(frames, max_frames)
+    frames = iter(frames)
+    start = time.perf_counter()
+    while True:
+        # 캡처 전에 간격을 맞춰야 하므로 다음 프레임은 대기 후에 가져옴
+        if governor is not None and not governor.wait_next_frame():
+            break
+        t = profiler.begin()
+        frame = next(frames, None)
+        if frame is None:
+            break
+        t = profiler.lap('capture', t)
+        timestamp = time.time()
+        t0 = time.perf_counter()
+        result = detect(frame)
+        elapsed = time.perf_counter() - t0
+        if governor is not None:
+            governor.record_detect(elapsed)
+        profiler.record('detect', elapsed)
+        t = profiler.begin()
+        writer.write(count, timestamp, result['objects'])
+        profiler.lap('write', t)
+        if release is not None:
+            release(result)
+        profiler.frame_done()
+        total_objects += len(result['objects'])
+        count += 1
+    seconds = time.perf_counter() - start
+    return {'frames': count, 'objects': total_objects, 'seconds': round(seconds, 3),
+            'fps': round(count / seconds, 1) if seconds > 0 else 0.0}
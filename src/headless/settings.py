@@ -0,0 +1,81 @@
+"""
+Tk 없이 HSV 설정 파일을 읽는 모듈
+
+두 가지 형식을 지원합니다.
+- hsv_settings.json: ControlWindow가 저장하는 {'hue_min', 'hue_max', 'sat_min', ...}
+- settings.json: {'hsv_presets': {이름: {'h_lower', 'h_upper', ...}}, 'current_preset': 이름}
+"""
+
+import json
+import os
+from typing import Optional, Tuple
+
+DEFAULT_SETTINGS_FILES = ('hsv_settings.json', 'settings.json')
+PRESET_SETTINGS_FILE = 'settings.json'  # 프리셋을 지정하면 이 파일만 읽음
+DEFAULT_RANGE = (0, 179, 0, 255, 0, 255)
+
+# (h_lower, h_upper, s_lower, s_upper, v_lower, v_upper) 순서의 키
+_HSV_SETTINGS_KEYS = ('hue_min', 'hue_max', 'sat_min', 'sat_max', 'val_min', 'val_max')
+_PRESET_KEYS = ('h_lower', 'h_upper', 's_lower', 's_upper', 'v_lower', 'v_upper')
+
+
+def parse_hsv_settings(settings: dict, preset: Optional[str] = None) -> Tuple[int, ...]:
+    """설정 dict에서 HSV 범위 추출
+
+    Args:
+        settings (dict): 설정 파일 내용
+        preset (Optional[str]): settings.json 형식에서 사용할 프리셋 이름 (기본값: current_preset)
+
+    Returns:
+        Tuple[int, ...]: (h_lower, h_upper, s_lower, s_upper, v_lower, v_upper)
+
+    Raises:
+        KeyError: 지정한 프리셋이 없는 경우
+        ValueError: 프리셋을 지정했지만 프리셋이 없는 형식(hsv_settings.json)인 경우
+    """
+    if preset is not None and 'hsv_presets' not in settings:
+        raise ValueError(f"Preset '{preset}' requested but the settings have no 'hsv_presets'")
+    if 'hsv_presets' in settings:
+        name = preset or settings.get('current_preset', 'default')
+        values = settings['hsv_presets'][name]
+        keys = _PRESET_KEYS
+    else:
+        values = settings
+        keys = _HSV_SETTINGS_KEYS
+    return tuple(int(values.get(key, default)) for key, default in zip(keys, DEFAULT_RANGE))
+
+
+def load_hsv_range(path: Optional[str] = None, preset: Optional[str] = None
+                   ) -> Tuple[Tuple[int, ...], Optional[str]]:
+    """설정 파일에서 HSV 범위 읽기
+
+    Args:
+        path (Optional[str]): 설정 파일 경로 (None이면 프리셋 지정 시 PRESET_SETTINGS_FILE,
+                              아니면 DEFAULT_SETTINGS_FILES 중 처음 있는 파일)
+        preset (Optional[str]): settings.json 형식에서 사용할 프리셋 이름
+
+    Returns:
+        Tuple[Tuple[int, ...], Optional[str]]: (HSV 범위, 읽은 파일 경로 (기본값 사용 시 None))
+
+    Raises:
+        FileNotFoundError: 지정한 파일(또는 프리셋 지정 시 PRESET_SETTINGS_FILE)이 없는 경우
+        ValueError: 파일 내용을 해석할 수 없거나 프리셋을 찾을 수 없는 경우
+    """
+    if path is None and preset is not None:
+        # 프리셋은 settings.json 형식에만 있으므로 hsv_settings.json으로 대신하지 않음
+        path = PRESET_SETTINGS_FILE
+    if path is None:
+        path = next((p for p in DEFAULT_SETTINGS_FILES if os.path.exists(p)), None)
+        if path is None:
+            return DEFAULT_RANGE, None
+    with open(path, 'r') as f:
+        try:
+            settings = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid settings file {path}: {e}") from e
+    try:
+        return parse_hsv_settings(settings, preset), path
+    except KeyError as e:
+        raise ValueError(f"Preset {e} not found in {path}") from e
+    except ValueError as e:
+        raise ValueError(f"{e} ({path})") from e
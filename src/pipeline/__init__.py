@@ -0,0 +1,3 @@
+"""
+캡처 → 검출 → 표시 처리 파이프라인 관련 모듈
+""" 
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""
+파이프라인 단계 사이의 단일 슬롯 "최신 값" 버퍼
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+# 슬롯이 차 있을 때 새 값을 넣는 경우의 처리 방식
+DROP_OLDEST = 'drop_oldest'  # 기존 값을 버리고 새 값으로 교체 (항상 최신 프레임 유지)
+DROP_NEWEST = 'drop_newest'  # 새 값을 버림 (소비자가 가져갈 때까지 기존 값 유지)
+
+
+class LatestValueBuffer:
+    """값을 최대 하나만 보관하는 스레드 안전 버퍼
+
+    생산자는 절대 막히지 않으며, 소비자가 느리면 정책에 따라 값을 버리고
+    dropped 카운터를 올립니다. 따라서 메모리 사용량이 항상 한 항목으로 제한됩니다.
+    queue.Queue의 put_nowait/get_nowait/empty와 같은 방식으로도 사용할 수 있습니다.
+    """
+
+    def __init__(self, policy: str = DROP_OLDEST, name: str = '',
+                 on_drop: Optional[Callable[[Any], None]] = None):
+        """버퍼 초기화
+
+        Args:
+            policy (str): DROP_OLDEST 또는 DROP_NEWEST
+            name (str): 통계 표시용 이름
+            on_drop: 버려진 값을 받는 함수 (예: 풀 버퍼 반환, None이면 호출 안 함)
+        """
+        if policy not in (DROP_OLDEST, DROP_NEWEST):
+            raise ValueError(f"Unknown drop policy: {policy}")
+        self.policy = policy
+        self.name = name
+        self.on_drop = on_drop
+        self._cond = threading.Condition()
+        self._item = None
+        self._full = False
+        self._closed = False
+        self.put_count = 0
+        self.get_count = 0
+        self.dropped = 0
+
+    def put(self, item: Any, block: bool = False, timeout: Optional[float] = None) -> bool:
+        """값 넣기 (막히지 않음, block/timeout은 queue.Queue 호환용으로 무시)
+
+        Returns:
+            bool: 새 값이 저장되었으면 True, DROP_NEWEST 정책으로 버려졌으면 False
+        """
+        with self._cond:
+            self.put_count += 1
+            stored = True
+            dropped = None
+            if self._full:
+                self.dropped += 1
+                if self.policy == DROP_NEWEST:
+                    stored = False
+                    dropped = item
+                else:
+                    dropped = self._item
+            if stored:
+                self._item = item
+                self._full = True
+                self._cond.notify()
+        # 버린 값 처리는 잠금 밖에서 (콜백이 다른 잠금을 잡아도 안전하도록)
+        if dropped is not None and self.on_drop is not None:
+            self.on_drop(dropped)
+        return stored
+
+    def put_nowait(self, item: Any) -> bool:
+        """put()과 동일"""
+        return self.put(item)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        """값 꺼내기
+
+        Args:
+            block (bool): 값이 없으면 기다릴지 여부
+            timeout (Optional[float]): 최대 대기 시간(초)
+
+        Raises:
+            queue.Empty: 값이 없거나 대기 시간이 지났거나 버퍼가 닫힌 경우
+        """
+        with self._cond:
+            if block and not self._full and not self._closed:
+                self._cond.wait_for(lambda: self._full or self._closed, timeout)
+            if not self._full:
+                raise queue.Empty
+            item = self._item
+            self._item = None
+            self._full = False
+            self.get_count += 1
+            self._cond.notify_all()
+            return item
+
+    def get_nowait(self) -> Any:
+        """get(block=False)와 동일"""
+        return self.get(block=False)
+
+    def wait_empty(self, timeout: Optional[float] = None) -> bool:
+        """소비자가 값을 가져갈 때까지 대기
+
+        Returns:
+            bool: 슬롯이 비었으면 True, 시간 초과 또는 닫힌 경우 False
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: not self._full or self._closed, timeout)
+            return not self._full
+
+    def empty(self) -> bool:
+        """보관 중인 값이 없으면 True"""
+        with self._cond:
+            return not self._full
+
+    def close(self):
+        """대기 중인 소비자를 깨움 (이후 get은 남은 값이 없으면 바로 queue.Empty)"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        """입출력/버림 횟수"""
+        with self._cond:
+            return {'put': self.put_count, 'get': self.get_count, 'dropped': self.dropped}
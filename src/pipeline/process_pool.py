@@ -0,0 +1,358 @@
+"""
+다중 프로세스 검출 작업자 풀
+
+캡처 스레드가 공유 메모리(multiprocessing.shared_memory) 슬롯에 프레임을 직접 쓰고
+슬롯 번호만 작업 큐로 보내면, 검출 작업자 프로세스들이 같은 슬롯에 마스크와 라벨
+이미지를 기록하고 객체 정보는 OBJECT_DTYPE 배열로 돌려줍니다. 프레임이나
+DetectedObject 리스트를 피클링하지 않으며, 각 프로세스가 자신의 GIL을 가지므로
+Python으로 실행되는 부분까지 코어 수만큼 동시에 실행됩니다.
+"""
+
+import os
+import queue
+import signal
+import threading
+import time
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
+
+from src.capture.frame_pool import FramePool
+from src.detection.custom_detector import CustomDetector
+from src.detection.labeling import connected_components_with_stats
+from src.detection.profiling import NULL_PROFILER
+from src.pipeline.buffers import LatestValueBuffer
+from src.pipeline.scheduler import FrameGovernor
+
+
+class SharedFrameSlots:
+    """공유 메모리 한 블록에 잡은 슬롯별 프레임/마스크/라벨 배열
+
+    frames[i]: (H, W, C) uint8, masks[i]: (H, W) uint8, labels[i]: (H, W) int32
+    """
+
+    def __init__(self, slots: int, frame_shape: Tuple[int, int, int], name: Optional[str] = None):
+        """공유 메모리 생성 (name이 주어지면 기존 블록에 연결)
+
+        Args:
+            slots (int): 슬롯 수
+            frame_shape (Tuple[int, int, int]): 프레임 모양 (H, W, C)
+            name (Optional[str]): 연결할 공유 메모리 이름 (작업자 프로세스용)
+        """
+        height, width, channels = frame_shape
+        self.slots = slots
+        self.frame_shape = tuple(frame_shape)
+        frame_bytes = slots * height * width * channels
+        mask_bytes = slots * height * width
+        label_bytes = slots * height * width * 4
+        size = frame_bytes + mask_bytes + label_bytes
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+        buf = self.shm.buf
+        self.frames = np.ndarray((slots, height, width, channels), dtype=np.uint8, buffer=buf)
+        self.masks = np.ndarray((slots, height, width), dtype=np.uint8, buffer=buf, offset=frame_bytes)
+        self.labels = np.ndarray((slots, height, width), dtype=np.int32, buffer=buf,
+                                 offset=frame_bytes + mask_bytes)
+
+    def spec(self) -> tuple:
+        """작업자 프로세스에서 같은 블록에 연결하기 위한 정보"""
+        return (self.slots, self.frame_shape, self.shm.name)
+
+    @classmethod
+    def attach(cls, spec: tuple) -> 'SharedFrameSlots':
+        """spec()으로 얻은 정보로 기존 블록에 연결"""
+        slots, frame_shape, name = spec
+        return cls(slots, frame_shape, name)
+
+    def close(self):
+        """배열 참조를 버리고 공유 메모리 연결 해제 (생성한 쪽은 블록도 삭제)"""
+        self.frames = self.masks = self.labels = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _detect_into(detector: CustomDetector, frame: np.ndarray, mask: np.ndarray,
+                 labels: np.ndarray) -> np.ndarray:
+    """프레임을 검출하여 마스크/라벨은 주어진 버퍼에 기록하고 객체 표 반환
+
+    (공유 메모리를 가리키는 뷰가 함수 밖에 남지 않도록 분리)
+    """
+    # 작업자가 여러 프로세스이므로 각 프로세스는 단일 스레드 커널 사용
+    raw_mask = detector.threshold(frame, serial=True)
+    detector.apply_morphology(raw_mask, serial=True, out=mask)
+    _, stats, centroids = connected_components_with_stats(mask, labels)
+    return detector.object_table(stats, centroids)
+
+
+def _worker_main(spec: tuple, tasks, results):
+    """검출 작업자 프로세스 진입점
+
+    작업 큐에서 (슬롯, 순번, 설정 버전, 설정)을 받아 슬롯의 프레임을 검출하고
+    (슬롯, 순번, 객체 표, 검출 시간)을 결과 큐에 넣습니다. None을 받으면 종료합니다.
+    """
+    # Ctrl+C는 메인 프로세스가 받아서 정리 순서를 정함
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # 종료 시 메인 프로세스가 더 이상 결과를 읽지 않아도 멈추지 않도록 함
+    results.cancel_join_thread()
+    slots = SharedFrameSlots.attach(spec)
+    detector = CustomDetector()
+    # 첫 작업이 JIT 컴파일 시간을 포함하지 않도록 슬롯과 같은 형식의 배열로 미리 실행
+    _detect_into(detector, np.zeros_like(slots.frames[0]), np.zeros_like(slots.masks[0]),
+                 np.zeros_like(slots.labels[0]))
+    version = -1
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            slot, seq, config_version, config = task
+            if config_version != version:
+                detector.apply_config(config)
+                version = config_version
+            start = time.perf_counter()
+            table = _detect_into(detector, slots.frames[slot], slots.masks[slot], slots.labels[slot])
+            results.put((slot, seq, table, time.perf_counter() - start))
+    finally:
+        slots.close()
+
+
+class ProcessPoolRunner:
+    """검출을 작업자 프로세스들에 나누어 실행하는 파이프라인 (PipelineRunner와 같은 사용법)
+
+    - 캡처 스레드: 빈 슬롯을 얻어 프레임을 슬롯에 직접 캡처하고 슬롯 번호를 작업 큐로 보냄
+    - 작업자 프로세스: 슬롯의 프레임을 검출하여 마스크/라벨은 슬롯에, 객체 표는 결과 큐로
+    - 수집 스레드: 결과를 받아 슬롯 내용을 출력 버퍼 풀로 복사하고 슬롯을 반납한 뒤 출력 버퍼에 넣음
+      (출력 항목의 frame/mask/bbox_frame은 사용자가 release()로 돌려줌, labels는 다음 결과까지만 유효)
+
+    빈 슬롯이 없으면(모든 작업자가 바쁘면) 그 프레임은 찍지 않고 건너뜁니다.
+    늦게 끝난 이전 프레임의 결과는 버리므로 출력 순서는 항상 캡처 순서입니다.
+    """
+
+    def __init__(self, capture: Callable[..., Any], detector: CustomDetector,
+                 output: LatestValueBuffer, package: Callable[[Any, dict], Any],
+                 frame_shape: Tuple[int, int, int], workers: Optional[int] = None,
+                 governor: Optional[FrameGovernor] = None, max_wait: float = 0.1,
+                 profiler=None, pool_size: int = 4):
+        """작업자 풀 파이프라인 초기화
+
+        Args:
+            capture: out=버퍼를 받아 프레임을 채우고 반환하는 함수 (실패 시 None)
+            detector (CustomDetector): 설정을 제공하는 검출기 (작업자에 설정만 전달)
+            output: 결과를 넣을 출력 버퍼 (UI 스레드가 소비)
+            package: (프레임, 검출 결과)를 출력 항목으로 변환하는 함수
+            frame_shape (Tuple[int, int, int]): 캡처 프레임 모양 (H, W, C)
+            workers (Optional[int]): 작업자 프로세스 수 (기본값: CPU 코어 수 - 1)
+            governor: 캡처 간격과 일시 정지를 정하는 스케줄러 (None이면 FPS 제한 없음)
+            max_wait (float): 빈 슬롯을 기다리는 최대 시간(초)
+            profiler: 캡처/작업자 검출/그리기 시간과 FPS를 기록할 StageProfiler
+                      (작업자 프로세스 안의 단계별 시간은 기록하지 않음)
+            pool_size (int): 출력 frame/mask/bbox_frame 버퍼 수 (각각, 단계 사이 버퍼 + 표시 중 + 여유)
+        """
+        self.capture = capture
+        self.detector = detector
+        self.output = output
+        self.package = package
+        self.frame_shape = tuple(frame_shape)
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.governor = governor or FrameGovernor(target_fps=None)
+        self.max_wait = max_wait
+        self.profiler = profiler or NULL_PROFILER
+        # 작업자마다 하나씩 + 캡처 중 1 + 수집 중 1
+        self.slot_count = self.workers + 2
+        self._frame_pool = FramePool(pool_size)
+        self._mask_pool = FramePool(pool_size)
+        self._bbox_pool = FramePool(pool_size)
+        self._labels = None
+        self._running = False
+        self._slots = None
+        self._processes = []
+        self._threads = []
+        self.capture_failures = 0
+        self.submitted = 0
+        self.completed = 0
+        self.busy_skips = 0     # 빈 슬롯이 없어 건너뛴 캡처 수
+        self.stale_results = 0  # 더 최근 프레임보다 늦게 끝나 버린 결과 수
+
+    def start(self):
+        """공유 메모리, 작업자 프로세스, 캡처/수집 스레드 시작"""
+        if self._running:
+            return
+        self._slots = SharedFrameSlots(self.slot_count, self.frame_shape)
+        # Tk나 numba 스레드가 있는 프로세스를 fork하지 않도록 spawn 사용
+        ctx = mp.get_context('spawn')
+        self._tasks = ctx.Queue()
+        self._results = ctx.Queue()
+        self._free = queue.Queue()
+        for slot in range(self.slot_count):
+            self._free.put(slot)
+        self._processes = [
+            ctx.Process(target=_worker_main, args=(self._slots.spec(), self._tasks, self._results),
+                        name=f'detect-worker-{i}', daemon=True)
+            for i in range(self.workers)
+        ]
+        for process in self._processes:
+            process.start()
+
+        self._running = True
+        self._seq = 0
+        self._last_seq = -1
+        self._config_key = None
+        self._config_version = -1
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name='pool-capture', daemon=True),
+            threading.Thread(target=self._collect_loop, name='pool-collect', daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float = 2.0) -> bool:
+        """스레드와 작업자 프로세스를 종료하고 공유 메모리 해제
+
+        Returns:
+            bool: 모든 스레드와 프로세스가 제시간에 종료되었으면 True
+        """
+        if not self._threads:
+            return True
+        self._running = False
+        self.governor.close()
+        finished = True
+        capture_thread, collect_thread = self._threads
+        capture_thread.join(timeout=timeout)
+
+        # 작업자마다 종료 신호를 보내고, 제시간에 끝나지 않으면 강제 종료
+        for _ in self._processes:
+            self._tasks.put(None)
+        for process in self._processes:
+            process.join(timeout=timeout)
+            if process.is_alive():
+                print(f"Warning: {process.name} did not exit, terminating.")
+                process.terminate()
+                process.join(timeout=timeout)
+                finished = False
+
+        collect_thread.join(timeout=timeout)
+        for thread in self._threads:
+            if thread.is_alive():
+                print(f"Warning: {thread.name} did not complete gracefully.")
+                finished = False
+
+        for q in (self._tasks, self._results):
+            q.cancel_join_thread()
+            q.close()
+        self._slots.close()
+        self._processes = []
+        self._threads = []
+        return finished
+
+    def _current_config(self):
+        """검출기 설정과 버전 (설정이 바뀌면 버전 증가)"""
+        config = self.detector.get_config()
+        key = (config['lower'].tobytes(), config['upper'].tobytes(),
+               config['min_area'], config['morphology'])
+        if key != self._config_key:
+            self._config_key = key
+            self._config_version += 1
+        return self._config_version, config
+
+    def _capture_loop(self):
+        """캡처 단계: 빈 슬롯에 프레임을 캡처하고 작업 큐에 슬롯 번호 전달"""
+        while self._running:
+            if not self.governor.wait_active():
+                continue
+            try:
+                slot = self._free.get(timeout=self.max_wait)
+            except queue.Empty:
+                self.busy_skips += 1
+                continue
+            if not self._running or not self.governor.wait_next_frame():
+                self._free.put(slot)
+                continue
+            try:
+                t = self.profiler.begin()
+                frame = self.capture(out=self._slots.frames[slot])
+                self.profiler.lap('capture', t)
+            except Exception as e:
+                print(f"Error in process pool capture stage: {e}")
+                frame = None
+            if frame is None:
+                self.capture_failures += 1
+                self._free.put(slot)
+                time.sleep(0.01)
+                continue
+            version, config = self._current_config()
+            self._tasks.put((slot, self._seq, version, config))
+            self._seq += 1
+            self.submitted += 1
+        print("Process pool capture stage finished.")
+
+    def _collect_loop(self):
+        """수집 단계: 작업자 결과를 검출 결과 dict로 만들어 출력 버퍼에 넣음"""
+        while self._running:
+            try:
+                slot, seq, table, elapsed = self._results.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            self.completed += 1
+            # 작업자 N개가 동시에 처리하므로 프레임당 유효 검출 시간은 1/N
+            self.governor.record_detect(elapsed / self.workers)
+            self.profiler.record('worker', elapsed)
+            if seq < self._last_seq:
+                self.stale_results += 1
+                self._free.put(slot)
+                continue
+            self._last_seq = seq
+            frame = self._frame_pool.acquire_or_allocate(self.frame_shape)
+            mask = self._mask_pool.acquire_or_allocate(self.frame_shape[:2])
+            if self._labels is None:
+                self._labels = np.empty(self.frame_shape[:2], dtype=np.int32)
+            np.copyto(frame, self._slots.frames[slot])
+            np.copyto(mask, self._slots.masks[slot])
+            np.copyto(self._labels, self._slots.labels[slot])
+            self._free.put(slot)
+            try:
+                t = self.profiler.begin()
+                objects = CustomDetector.objects_from_table(table)
+                bbox_frame = self._bbox_pool.acquire_or_allocate(self.frame_shape)
+                np.copyto(bbox_frame, frame)
+                result = {
+                    'hsv': None,
+                    'mask': mask,
+                    'labels': self._labels,
+                    'objects': objects,
+                    'object_table': table,
+                    'bbox_frame': self.detector.draw_objects(bbox_frame, objects),
+                }
+                self.profiler.lap('draw', t)
+                self.output.put(self.package(frame, result))
+                self.profiler.frame_done()
+            except Exception as e:
+                if self._running:
+                    print(f"Error in process pool collect stage: {e}")
+        print("Process pool collect stage finished.")
+
+    def release(self, buf: np.ndarray):
+        """출력 항목의 frame, mask 또는 bbox_frame 사용을 마침 (이 파이프라인의 풀 버퍼가 아니면 무시)"""
+        if buf is None:
+            return
+        for pool in (self._frame_pool, self._mask_pool, self._bbox_pool):
+            if pool.release(buf):
+                return
+
+    def stats(self) -> dict:
+        """단계별 처리/버림 통계"""
+        return {
+            'capture': {'failures': self.capture_failures, 'submitted': self.submitted,
+                        'busy_skips': self.busy_skips, **self.governor.stats()},
+            'workers': {'count': self.workers, 'completed': self.completed,
+                        'stale': self.stale_results},
+            'detect': self.output.stats(),
+            'buffers': {'frame': self._frame_pool.stats(), 'mask': self._mask_pool.stats(),
+                        'bbox': self._bbox_pool.stats()},
+        }
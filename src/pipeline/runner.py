@@ -0,0 +1,155 @@
+"""
+캡처 단계와 검출 단계를 별도 스레드로 실행하는 파이프라인
+"""
+
+import time
+import threading
+import queue
+from typing import Any, Callable, Optional
+
+from src.detection.profiling import NULL_PROFILER
+from src.pipeline.buffers import LatestValueBuffer, DROP_OLDEST
+from src.pipeline.scheduler import FrameGovernor
+
+
+class PipelineRunner:
+    """캡처 → 검출 → 출력 버퍼로 이어지는 2단계 파이프라인
+
+    단계 사이는 단일 슬롯 버퍼로 연결되어 N+1번째 프레임 캡처가 N번째 프레임
+    검출과 겹쳐 실행되며, 어느 단계가 느려도 쌓이는 프레임은 최대 한 개입니다.
+    캡처 단계는 검출 단계가 이전 프레임을 가져갈 때까지 최대 max_wait초 기다린 뒤
+    다음 프레임을 찍으므로, 검출이 느릴 때 캡처가 CPU를 낭비하지 않습니다.
+    캡처 시점과 일시 정지는 FrameGovernor가 결정합니다.
+
+    release를 주면 버려지거나 검출에 실패한 프레임을 그 함수로 돌려줍니다. 출력
+    버퍼에 넣은 프레임은 출력 소비자(또는 출력 버퍼의 on_drop)가 돌려줘야 합니다.
+    """
+
+    def __init__(self, capture: Callable[[], Any], detect: Callable[[Any], dict],
+                 output: LatestValueBuffer, package: Callable[[Any, dict], Any],
+                 governor: Optional[FrameGovernor] = None, frame_policy: str = DROP_OLDEST,
+                 max_wait: float = 0.1, profiler=None,
+                 release: Optional[Callable[[Any], None]] = None):
+        """파이프라인 초기화
+
+        Args:
+            capture: 프레임을 반환하는 함수 (실패 시 None)
+            detect: 프레임을 받아 검출 결과 dict를 반환하는 함수
+            output: 결과를 넣을 출력 버퍼 (UI 스레드가 소비)
+            package: (프레임, 검출 결과)를 출력 항목으로 변환하는 함수
+            governor: 캡처 간격과 일시 정지를 정하는 스케줄러 (None이면 FPS 제한 없음)
+            frame_policy: 캡처 → 검출 버퍼의 버림 정책
+            max_wait: 검출 단계가 이전 프레임을 가져가길 기다리는 최대 시간(초).
+                      초과하면 정책에 따라 프레임을 버리며 캡처를 계속함
+            profiler: 캡처/검출 시간과 FPS를 기록할 StageProfiler (None이면 기록 안 함)
+            release: 파이프라인 안에서 버려진 프레임을 받는 함수 (FrameSource.release 등)
+        """
+        self.capture = capture
+        self.detect = detect
+        self.output = output
+        self.package = package
+        self.governor = governor or FrameGovernor(target_fps=None)
+        self.release = release or (lambda frame: None)
+        self.frames = LatestValueBuffer(frame_policy, name='capture->detect', on_drop=self.release)
+        self.max_wait = max_wait
+        self.profiler = profiler or NULL_PROFILER
+        self._running = False
+        self._threads = []
+        self.capture_failures = 0
+        self.detect_errors = 0
+
+    def start(self):
+        """캡처/검출 스레드 시작"""
+        if self._running:
+            return
+        self._running = True
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name='pipeline-capture', daemon=True),
+            threading.Thread(target=self._detect_loop, name='pipeline-detect', daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float = 2.0) -> bool:
+        """스레드 종료 요청 및 대기
+
+        Returns:
+            bool: 모든 스레드가 제시간에 종료되었으면 True
+        """
+        self._running = False
+        self.governor.close()
+        self.frames.close()
+        finished = True
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+            if thread.is_alive():
+                print(f"Warning: {thread.name} did not complete gracefully.")
+                finished = False
+        # 검출 단계가 가져가지 못한 마지막 프레임을 프레임 소스에 돌려줌
+        try:
+            frame = self.frames.get_nowait()
+        except queue.Empty:
+            frame = None
+        if frame is not None:
+            self.release(frame)
+        return finished
+
+    def _capture_loop(self):
+        """캡처 단계: 프레임을 찍어 검출 단계 버퍼에 넣음"""
+        while self._running:
+            # 일시 정지 중에는 재개(또는 종료)될 때까지 CPU를 쓰지 않고 대기
+            if not self.governor.wait_active():
+                continue
+            # 검출 단계가 이전 프레임을 가져간 직후에 다음 프레임을 찍음
+            self.frames.wait_empty(self.max_wait)
+            if not self._running:
+                break
+            if not self.governor.wait_next_frame():
+                continue
+            try:
+                t = self.profiler.begin()
+                frame = self.capture()
+                self.profiler.lap('capture', t)
+            except Exception as e:
+                print(f"Error in pipeline capture stage: {e}")
+                frame = None
+            if frame is None:
+                self.capture_failures += 1
+                time.sleep(0.01)
+                continue
+            self.frames.put(frame)
+        print("Pipeline capture stage finished.")
+
+    def _detect_loop(self):
+        """검출 단계: 최신 프레임을 검출하여 출력 버퍼에 넣음"""
+        while self._running:
+            try:
+                # 버퍼가 닫히면 (종료 시) 바로 깨어남
+                frame = self.frames.get()
+            except queue.Empty:
+                continue
+            try:
+                start = time.perf_counter()
+                result = self.detect(frame)
+                elapsed = time.perf_counter() - start
+                self.governor.record_detect(elapsed)
+                self.profiler.record('detect', elapsed)
+                item = self.package(frame, result)
+            except Exception as e:
+                self.release(frame)
+                self.detect_errors += 1
+                if self._running:
+                    print(f"Error in pipeline detect stage: {e}")
+                time.sleep(0.1)
+                continue
+            # 이후 프레임은 출력 소비자가 돌려줌
+            self.output.put(item)
+            self.profiler.frame_done()
+        print("Pipeline detect stage finished.")
+
+    def stats(self) -> dict:
+        """단계별 처리/버림 통계"""
+        return {
+            'capture': {'failures': self.capture_failures, **self.frames.stats(), **self.governor.stats()},
+            'detect': {'errors': self.detect_errors, **self.output.stats()},
+        }
@@ -0,0 +1,134 @@
+"""
+캡처 속도 조절 (목표 FPS, CPU 예산, 일시 정지)
+"""
+
+import time
+import threading
+from typing import Optional
+
+
+class FrameGovernor:
+    """캡처 단계의 프레임 간격을 정하는 스케줄러
+
+    - 단조 시계(time.monotonic) 기준으로 목표 FPS 간격에 맞춰 캡처 시점을 정합니다.
+    - 검출 시간이 길어지면 간격을 (평균 검출 시간 / CPU 예산)까지 늘려, 어차피 버려질
+      프레임은 찍지 않고 건너뜁니다. 한 주기 이상 밀리면 밀린 프레임을 몰아서 찍지
+      않고 현재 시각에 다시 맞춥니다.
+    - 일시 정지/재개는 threading.Event로 처리하므로 정지 중에는 CPU를 쓰지 않고,
+      재개하면 대기 중인 캡처 스레드가 바로 깨어납니다.
+
+    pause/resume/set_target_fps는 어느 스레드에서든 호출할 수 있습니다.
+    """
+
+    def __init__(self, target_fps: Optional[float] = 60.0, cpu_budget: float = 1.0,
+                 smoothing: float = 0.2):
+        """스케줄러 초기화 (실행 상태로 시작)
+
+        Args:
+            target_fps (Optional[float]): 목표 FPS (None 또는 0이면 제한 없음)
+            cpu_budget (float): 검출이 차지할 수 있는 시간 비율 (0 < cpu_budget <= 1).
+                                0.5이면 검출 시간의 두 배 간격보다 자주 캡처하지 않음
+            smoothing (float): 검출 시간 지수 이동 평균의 가중치
+        """
+        if not 0.0 < cpu_budget <= 1.0:
+            raise ValueError(f"cpu_budget must be in (0, 1]: {cpu_budget}")
+        self.cpu_budget = cpu_budget
+        self.smoothing = smoothing
+        self.set_target_fps(target_fps)
+        self._active = threading.Event()
+        self._interrupt = threading.Event()
+        self._active.set()
+        self._closed = False
+        self._deadline = None
+        self._last = None
+        self.detect_time = 0.0  # 검출 시간 이동 평균(초)
+        self._detect_samples = 0
+        self.frames = 0
+        self.skipped = 0
+
+    def set_target_fps(self, target_fps: Optional[float]):
+        """목표 FPS 변경 (None 또는 0이면 제한 없음)"""
+        self.target_fps = target_fps if target_fps and target_fps > 0 else None
+        self.base_interval = 1.0 / self.target_fps if self.target_fps else 0.0
+
+    def interval(self) -> float:
+        """현재 프레임 간격(초): 목표 FPS 간격과 검출 시간 기반 간격 중 큰 값"""
+        return max(self.base_interval, self.detect_time / self.cpu_budget)
+
+    @property
+    def paused(self) -> bool:
+        return not self._active.is_set()
+
+    def pause(self):
+        """캡처 일시 정지 (대기 중인 wait_next_frame도 바로 반환)"""
+        self._active.clear()
+        self._interrupt.set()
+
+    def resume(self):
+        """캡처 재개 (정지 전의 시각 기준은 버림)"""
+        self._deadline = None
+        self._last = None
+        self._interrupt.clear()
+        self._active.set()
+
+    def close(self):
+        """대기 중인 스레드를 모두 깨움 (파이프라인 종료 시)"""
+        self._closed = True
+        self._interrupt.set()
+        self._active.set()
+
+    def wait_active(self, timeout: Optional[float] = None) -> bool:
+        """실행 상태가 될 때까지 대기
+
+        Returns:
+            bool: 실행 상태이면 True, 시간 초과 또는 종료된 경우 False
+        """
+        return self._active.wait(timeout) and not self._closed
+
+    def wait_next_frame(self) -> bool:
+        """다음 캡처 시점까지 대기
+
+        Returns:
+            bool: 캡처할 차례이면 True, 대기 중 일시 정지/종료되었으면 False
+        """
+        interval = self.interval()
+        now = time.monotonic()
+        if self._deadline is None or now - self._deadline >= interval:
+            # 첫 프레임이거나 한 주기 이상 밀렸으면 현재 시각에 다시 맞춤
+            self._deadline = now
+        delay = self._deadline - now
+        if delay > 0 and self._interrupt.wait(delay):
+            return False
+        if self._interrupt.is_set():
+            return False
+
+        now = time.monotonic()
+        if self._last is not None and self.base_interval > 0:
+            # 목표 FPS 기준으로 찍지 못한 프레임 수
+            self.skipped += max(0, int((now - self._last) / self.base_interval + 0.5) - 1)
+        self._last = now
+        self._deadline += interval
+        self.frames += 1
+        return True
+
+    def record_detect(self, seconds: float):
+        """검출 한 번에 걸린 시간 기록 (검출 스레드에서 호출)
+
+        첫 기록은 JIT 컴파일 시간이 섞여 있을 수 있으므로 평균에 넣지 않습니다.
+        """
+        self._detect_samples += 1
+        if self._detect_samples == 1:
+            return
+        if self.detect_time == 0.0:
+            self.detect_time = seconds
+        else:
+            self.detect_time += self.smoothing * (seconds - self.detect_time)
+
+    def stats(self) -> dict:
+        """캡처 프레임 수, 건너뛴 프레임 수, 현재 간격"""
+        return {
+            'frames': self.frames,
+            'skipped': self.skipped,
+            'interval_ms': round(self.interval() * 1000.0, 2),
+            'detect_ms': round(self.detect_time * 1000.0, 2),
+        }
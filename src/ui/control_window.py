@@ -7,24 +7,35 @@ from tkinter import ttk, filedialog
 import json
 import os
 import sys # main.py의 exit_flag 접근을 위해
+import time
 from src.ui.monitor_window import MonitorWindow
+from src.pipeline.buffers import LatestValueBuffer, DROP_OLDEST
+from src.detection.hsv_histogram import HSVHistogram
 import queue
 
 SETTINGS_FILE = 'hsv_settings.json'
 
 class ControlWindow:
-    def __init__(self, screen_capture, detector):
+    def __init__(self, screen_capture, detector, governor=None, profiler=None, preview=None):
         """컨트롤 윈도우 초기화
         
         Args:
-            screen_capture: 화면 캡처 객체
+            screen_capture: 프레임 소스 (ScreenCapture 또는 src.capture.sources의 FrameSource)
             detector: 객체 검출기
+            governor: 실시간 캡처 스케줄러 (FrameGovernor, 모드 전환 시 일시 정지/재개)
+            profiler: 단계별 시간 계측기 (StageProfiler, 있으면 모니터 상태 표시줄에 요약 표시)
+            preview: 모니터 창 미리보기 합성기 (PreviewCompositor, None이면 기본 설정)
         """
         # 루트 윈도우 먼저 생성!
         self.root = tk.Tk()
         
         self.screen_capture = screen_capture
         self.detector = detector
+        self.governor = governor
+        self.profiler = profiler
+        self.release_result = None # 출력 항목의 풀 버퍼를 검출 단계에 돌려줄 함수 (파이프라인 생성 후 지정)
+        self.status_interval = 0.5 # 초 (상태 표시줄 갱신 주기)
+        self._last_status = 0.0
         
         # 모니터 목록 가져오기
         self.monitors = screen_capture.get_monitors()
@@ -32,21 +43,26 @@ class ControlWindow:
         # === 모드 상태 변수 ===
         self.monitoring_mode = tk.StringVar(value="realtime") # 이제 오류 발생 안 함
         self.static_image = None
+        self.static_hsv = None # 정적 이미지의 HSV 변환 결과 (이미지가 바뀔 때만 다시 계산)
+        self.static_histogram = None # 정적 이미지의 HSV 누적 히스토그램 (슬라이더 범위의 커버리지 조회용)
+        self.static_job = None # 예약된 정적 이미지 재처리 (after ID)
+        self.static_delay = 30 # ms (슬라이더 이벤트를 모아 최신 설정으로 한 번만 처리)
         # ====================
         
         # UI 초기화 (루트 윈도우 생성 후 호출)
         self.init_ui()
         
         # MonitorWindow 생성 (Toplevel)
-        self.monitor_window = MonitorWindow(self.root, "Detection Monitor")
+        self.monitor_window = MonitorWindow(self.root, "Detection Monitor", preview)
         self.monitor_window.withdraw() # 초기에는 숨김
         
         # 모니터링 윈도우 표시/숨김 버튼 추가
         self.show_monitor_button = ttk.Button(self.root, text="Show Monitor", command=self.toggle_monitor_window)
         self.show_monitor_button.pack(pady=5)
         
-        # 스레드 통신을 위한 큐 생성
-        self.queue = queue.Queue()
+        # 스레드 통신을 위한 단일 슬롯 버퍼 (UI가 밀리면 오래된 결과는 버림)
+        # 항목의 원본/마스크/바운딩 박스는 풀 버퍼이므로 버리거나 표시한 뒤 돌려줌
+        self.queue = LatestValueBuffer(DROP_OLDEST, name='detect->ui', on_drop=self.release_item)
         
         # 주기적으로 큐 확인 및 UI 업데이트
         self.queue_check_interval = 15 # ms (약 66 FPS 목표)
@@ -127,6 +143,10 @@ class ControlWindow:
         self.hsv_label = ttk.Label(self.root, text='HSV Range: H[0-179], S[0-255], V[0-255]', anchor='center')
         self.hsv_label.pack(fill='x', padx=10, pady=5)
         
+        # 정적 이미지에서 현재 범위에 드는 픽셀 수/비율 (정적 모드에서만 표시)
+        self.coverage_label = ttk.Label(self.root, text='', anchor='center')
+        self.coverage_label.pack(fill='x', padx=10)
+        
         # --- 설정 저장/불러오기 버튼 --- 
         button_frame = ttk.Frame(self.root)
         button_frame.pack(fill='x', padx=10, pady=10)
@@ -154,14 +174,20 @@ class ControlWindow:
         if mode == "static":
             self.capture_button.config(state='normal')
             print("Switched to Static Image mode.")
-            # TODO: 실시간 스레드 일시 중지 또는 큐 전송 중단 신호
-            # (main.py에서 이 모드를 확인하도록 함)
+            # 실시간 캡처 스레드 일시 정지 (Tk 변수는 UI 스레드에서만 읽음)
+            if self.governor is not None:
+                self.governor.pause()
         else: # realtime
             self.capture_button.config(state='disabled')
+            self.cancel_static_update()
             self.static_image = None # 실시간 모드로 전환 시 정적 이미지 초기화
+            self.static_hsv = None
+            self.static_histogram = None
+            self.update_coverage_label()
             print("Switched to Real-time mode.")
-            # TODO: 실시간 스레드 재개 또는 큐 전송 재개 신호
-            # (main.py에서 이 모드를 확인하도록 함)
+            # 실시간 캡처 스레드 재개
+            if self.governor is not None:
+                self.governor.resume()
             # MonitorWindow 내용 초기화 (선택적)
             # if self.monitor_window and self.monitor_window.winfo_exists():
             #     self.monitor_window.clear_canvas() # 이런 메서드 추가 필요
@@ -170,9 +196,17 @@ class ControlWindow:
         """정적 이미지 캡처 버튼 클릭 시"""
         if self.monitoring_mode.get() == "static":
             print("Capturing static image...")
-            self.static_image = self.screen_capture.capture()
+            # 정적 이미지는 계속 보관하므로 버퍼 풀을 쓰지 않음
+            self.static_image = self.screen_capture.capture(use_pool=False)
+            self.static_hsv = None
+            self.static_histogram = None
             if self.static_image is not None:
+                # HSV 변환은 캡처할 때 한 번만 (슬라이더 변경 시에는 범위 검사부터 다시 수행)
+                self.static_hsv = self.detector.bgr_to_hsv(self.static_image)
+                # 범위별 픽셀 수는 히스토그램 누적 합으로 조회 (슬라이더 이벤트마다 마스크를 세지 않음)
+                self.static_histogram = HSVHistogram(self.static_hsv)
                 print("Static image captured.")
+                self.update_coverage_label()
                 # 즉시 처리 및 업데이트
                 self.process_and_update_static() 
             else:
@@ -187,8 +221,10 @@ class ControlWindow:
              return # 모니터 창이 없으면 중단
 
         try:
-             print("Processing static image with current HSV settings...")
-             result = self.detector.detect(self.static_image.copy()) # 원본 유지 위해 복사본 사용
+             if self.static_hsv is None:
+                 self.static_hsv = self.detector.bgr_to_hsv(self.static_image)
+             # 캐시한 HSV 이미지로 마스크 → 모폴로지 → 라벨링만 수행 (바운딩 박스는 복사본에 그림)
+             result = self.detector.detect_hsv(self.static_image, self.static_hsv)
              original_frame = self.static_image
              mask_image = result['mask']
              bbox_frame = result['bbox_frame']
@@ -201,9 +237,8 @@ class ControlWindow:
              
              # MonitorWindow 업데이트 (메인 스레드이므로 직접 호출)
              if self.monitor_window.winfo_viewable(): # 보이는 경우에만 업데이트
-                  self.monitor_window.update_frame(original_frame, mask_image, bbox_frame)
+                  self.monitor_window.update_frame(original_frame, mask_image, bbox_frame, force=True)
                   self.monitor_window.update_hsv_range(*hsv_ranges)
-             print("Monitor updated with static image processing result.")
              
         except Exception as e:
              print(f"Error processing or updating static image: {e}")
@@ -228,9 +263,28 @@ class ControlWindow:
         # HSV 값 표시 업데이트
         self.update_hsv_label()
         
-        # 정적 모드일 경우, 정적 이미지 즉시 재처리 및 업데이트
+        # 정적 모드일 경우, 정적 이미지 재처리 예약
         if self.monitoring_mode.get() == "static":
-            self.process_and_update_static()
+            self.schedule_static_update()
+            
+    def schedule_static_update(self):
+        """정적 이미지 재처리 예약 (이미 예약되어 있으면 그 처리가 최신 설정을 사용)
+        
+        슬라이더를 끄는 동안 연달아 들어오는 이벤트를 static_delay 간격으로 모아
+        한 번만 처리하므로 Tk 스레드가 멈추지 않습니다.
+        """
+        if self.static_job is None:
+            self.static_job = self.root.after(self.static_delay, self._run_static_update)
+            
+    def cancel_static_update(self):
+        """예약된 정적 이미지 재처리 취소"""
+        if self.static_job is not None:
+            self.root.after_cancel(self.static_job)
+            self.static_job = None
+            
+    def _run_static_update(self):
+        self.static_job = None
+        self.process_and_update_static()
             
     def update_hsv_label(self):
          """HSV 레이블 업데이트"""
@@ -239,6 +293,18 @@ class ControlWindow:
                  f'S[{self.sat_min.get()}-{self.sat_max.get()}], '
                  f'V[{self.val_min.get()}-{self.val_max.get()}]'
         )
+         self.update_coverage_label()
+         
+    def update_coverage_label(self):
+        """정적 이미지에서 현재 HSV 범위에 드는 픽셀 수와 비율 표시 (누적 히스토그램 조회)"""
+        if self.static_histogram is None:
+            self.coverage_label.config(text='')
+            return
+        lower, upper = self.detector.lower_color, self.detector.upper_color
+        matched, ratio = self.static_histogram.coverage(lower, upper)
+        # S/V 양자화 경계와 맞지 않는 범위는 근사값
+        approx = '' if self.static_histogram.is_exact(lower, upper) else '~'
+        self.coverage_label.config(text=f'Matched: {approx}{matched:,} px ({ratio * 100:.1f}%)')
 
     def save_settings(self):
         """현재 HSV 설정을 파일에 저장"""
@@ -322,7 +388,9 @@ class ControlWindow:
                 data = self.queue.get_nowait()
                 if data is None: # 종료 신호 처리
                     # 필요한 종료 로직 수행 (예: 플래그 설정)
+                    self.release_item(latest_data)
                     return # 큐 처리 중단
+                self.release_item(latest_data) # 건너뛴 항목의 프레임 반환
                 latest_data = data # 마지막 데이터 저장
                     
         except queue.Empty:
@@ -338,13 +406,34 @@ class ControlWindow:
                 if self.monitor_window and self.monitor_window.winfo_exists() and self.monitor_window.winfo_viewable():
                     self.monitor_window.update_frame(original, mask, bbox)
                     self.monitor_window.update_hsv_range(*hsv_ranges)
+                    self.update_status()
             except Exception as e:
                  print(f"Error updating UI from queue data: {e}")
+            # 미리보기는 합성 버퍼에 복사했으므로 항목의 프레임들은 더 이상 읽지 않음
+            self.release_item(latest_data)
                  
         # 다음 큐 확인 예약
         if hasattr(self, 'root') and self.root.winfo_exists():
              self.root.after(self.queue_check_interval, self.check_queue)
 
+    def release_item(self, item):
+        """출력 항목 (원본, 마스크, 바운딩 박스, HSV 범위)의 버퍼를 프레임 소스와 검출 단계에 돌려줌"""
+        if item:
+            self.screen_capture.release(item[0])
+            if self.release_result is not None:
+                for buf in item[:3]:
+                    self.release_result(buf)
+
+    def update_status(self):
+        """계측 요약을 모니터 상태 표시줄에 표시 (status_interval마다 한 번)"""
+        if self.profiler is None:
+            return
+        now = time.monotonic()
+        if now - self._last_status < self.status_interval:
+            return
+        self._last_status = now
+        self.monitor_window.update_status(self.profiler.format_summary())
+
     def on_closing(self):
         """창 닫기 버튼 클릭 시 호출될 함수"""
         print("Control window closing...")
@@ -358,6 +447,9 @@ class ControlWindow:
         except KeyError:
              print("Warning: Could not set exit_flag in main module.")
         
+        # 예약된 정적 이미지 재처리 취소
+        self.cancel_static_update()
+        
         # MonitorWindow 닫기 (destroy 호출)
         if self.monitor_window and self.monitor_window.winfo_exists():
             print("Destroying monitor window...")
@@ -3,19 +3,20 @@
 """
 
 import tkinter as tk
-import numpy as np
+from src.ui.preview import PreviewCompositor
 
 class MonitorWindow(tk.Toplevel):
-    def __init__(self, parent, title):
+    def __init__(self, parent, title, preview=None):
         """모니터링 윈도우 초기화
         
         Args:
             parent: 부모 윈도우 (ControlWindow의 root)
             title: 윈도우 제목
+            preview: 미리보기 합성기 (PreviewCompositor, 기본값: 패널 너비 640 이하, 최대 60 FPS)
         """
         super().__init__(parent)
         self.title(title)
-        self.geometry("960x350") # 초기 크기 설정
+        self.geometry("960x380") # 초기 크기 설정
         
         # 창 닫기 버튼 동작 재정의 (숨기기)
         self.protocol("WM_DELETE_WINDOW", self.withdraw)
@@ -28,24 +29,37 @@ class MonitorWindow(tk.Toplevel):
         self.hsv_label = tk.Label(self, text="HSV Range: [0-179, 0-255, 0-255]")
         self.hsv_label.pack(side='bottom', fill='x')
         
+        # 단계별 처리 시간 표시 레이블 (계측을 켠 경우에만 갱신)
+        self.status_label = tk.Label(self, text="", anchor='w', justify='left')
+        self.status_label.pack(side='bottom', fill='x')
+        self.status_label.bind('<Configure>',
+                               lambda e: self.status_label.config(wraplength=e.width))
+        
         # 업데이트 주기 (ms)
         self.delay = 15
         
-        # 이미지 참조 저장
-        self.photo_original = None
-        self.photo_mask = None
-        self.photo_bbox = None
+        # 세 패널을 한 장으로 합성하는 미리보기 버퍼 (축소 배율, 최대 FPS)
+        self.preview = preview or PreviewCompositor(max_panel_width=640, max_fps=60)
+        
+        # 캔버스 이미지 항목 (세 패널 합성 이미지) - 한 번만 만들고 내용만 교체
+        self.image_item = None
+        
+        # 이중 버퍼 PhotoImage
+        # 화면에 연결되지 않은 쪽에 새 프레임을 채운 뒤 항목이 가리키는 이미지를 바꿈
+        self.photos = None
+        self.front = 0
         
         self.last_width = 0
         self.last_height = 0
 
-    def update_frame(self, original_frame, mask_image, bbox_frame):
+    def update_frame(self, original_frame, mask_image, bbox_frame, force=False):
         """프레임 업데이트 (ControlWindow에서 호출)
         
         Args:
             original_frame: 원본 프레임 (numpy array, RGB)
             mask_image: 마스크 이미지 (numpy array, 흑백)
             bbox_frame: 바운딩 박스가 그려진 프레임 (numpy array, RGB)
+            force: True이면 미리보기 최대 FPS와 관계없이 표시 (정적 이미지 모드)
         """
         if original_frame is None or mask_image is None or bbox_frame is None:
             return
@@ -53,38 +67,45 @@ class MonitorWindow(tk.Toplevel):
         # Toplevel이 파괴되었는지 확인
         if not self.winfo_exists():
             return
+        
+        # 미리보기 최대 FPS를 넘는 프레임은 합성하지 않음
+        if not force and not self.preview.due():
+            return
             
-        height, width = original_frame.shape[:2]
-
-        # 창 크기 변경 감지 및 캔버스/창 크기 조정
-        if width > 0 and height > 0 and (width != self.last_width or height != self.last_height):
-            total_width = width * 3
-            self.geometry(f"{total_width}x{height + 30}") # 레이블 공간 고려
-            self.canvas.config(width=total_width, height=height)
-            self.last_width = width
-            self.last_height = height
-
-        # 이미지 업데이트 (try-except 추가)
         try:
-            # 1. 원본 이미지 표시
-            img_data_orig = self._array_to_photoimage(original_frame)
-            self.photo_original = img_data_orig
-            self.canvas.create_image(0, 0, image=self.photo_original, anchor='nw')
-            
-            # 2. 마스크 이미지 표시
-            mask_rgb = np.stack((mask_image,) * 3, axis=-1)
-            img_data_mask = self._array_to_photoimage(mask_rgb)
-            self.photo_mask = img_data_mask
-            self.canvas.create_image(width, 0, image=self.photo_mask, anchor='nw')
+            data = self.preview.compose(original_frame, mask_image, bbox_frame)
+            width, height = self.preview.size
+
+            # 미리보기 크기 변경 감지 및 캔버스/창 크기 조정
+            if width != self.last_width or height != self.last_height:
+                total_width = width * 3
+                self.geometry(f"{total_width}x{height + 60}") # 레이블 공간 고려
+                self.canvas.config(width=total_width, height=height)
+                self._layout_images(total_width, height)
+                self.last_width = width
+                self.last_height = height
 
-            # 3. 바운딩 박스 이미지 표시
-            img_data_bbox = self._array_to_photoimage(bbox_frame)
-            self.photo_bbox = img_data_bbox
-            self.canvas.create_image(width * 2, 0, image=self.photo_bbox, anchor='nw')
+            # 기존 PhotoImage 내용만 교체 (새 이미지/항목을 만들지 않음)
+            back = 1 - self.front
+            self.photos[back].configure(data=data, format='PPM')
+            self.canvas.itemconfigure(self.image_item, image=self.photos[back])
+            self.front = back
         except tk.TclError as e:
             # 위젯이 파괴된 후 업데이트 시도 시 발생 가능
             print(f"MonitorWindow TclError during image update: {e}")
         
+    def _layout_images(self, width, height):
+        """합성 이미지 크기에 맞춰 PhotoImage를 만들고 캔버스 항목 배치 (크기가 바뀔 때만 호출)"""
+        # 이전 PhotoImage는 항목이 새 이미지를 가리킨 뒤에 해제되도록 참조를 잠시 유지
+        previous = self.photos
+        self.photos = [tk.PhotoImage(width=width, height=height) for _ in range(2)]
+        self.front = 0
+        if self.image_item is None:
+            self.image_item = self.canvas.create_image(0, 0, anchor='nw', image=self.photos[0])
+        else:
+            self.canvas.itemconfigure(self.image_item, image=self.photos[0])
+        del previous
+        
     def update_hsv_range(self, hue_range, sat_range, val_range):
         """HSV 범위 표시 업데이트 (ControlWindow에서 호출)
         
@@ -103,10 +124,17 @@ class MonitorWindow(tk.Toplevel):
         except tk.TclError as e:
             print(f"MonitorWindow TclError during HSV update: {e}")
             
-    def _array_to_photoimage(self, arr):
-        """numpy 배열을 PhotoImage로 변환"""
-        height, width = arr.shape[:2]
-        data = f'P6 {width} {height} 255 '.encode() + arr.astype(np.uint8).tobytes()
-        return tk.PhotoImage(width=width, height=height, data=data, format='PPM')
+    def update_status(self, text):
+        """상태 표시줄 업데이트 (ControlWindow에서 호출)
         
+        Args:
+            text: 표시할 문자열 (예: 단계별 처리 시간 요약)
+        """
+        if not self.winfo_exists():
+             return
+        try:
+            self.status_label.config(text=text)
+        except tk.TclError as e:
+            print(f"MonitorWindow TclError during status update: {e}")
+            
     # start() 와 stop() 메서드는 더 이상 필요 없음 (부모가 관리) 
\ No newline at end of file
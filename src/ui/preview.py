@@ -0,0 +1,151 @@
+"""
+모니터 창 미리보기 합성
+
+원본, 마스크, 바운딩 박스 세 패널을 미리 할당한 한 장의 (H, 3W, 3) 버퍼에 바로
+써넣고, 그 버퍼 앞에 PPM(P6) 헤더를 붙여 둔 바이트 배열을 PhotoImage에 넘깁니다.
+마스크는 3채널로 늘린 배열을 만들지 않고 합성 중에 회색조로 씁니다.
+
+축소 배율을 주면 출력 크기만큼만 (최근접 샘플링으로) 읽으므로, 미리보기 비용은
+캡처 크기가 아니라 미리보기 크기에 비례합니다.
+"""
+
+import time
+from typing import Optional
+
+import numpy as np
+from numba import jit, prange
+
+
+@jit(nopython=True, parallel=True, nogil=True, cache=True)
+def compose_panels(original: np.ndarray, mask: np.ndarray, bbox: np.ndarray,
+                   rows: np.ndarray, cols: np.ndarray, out: np.ndarray):
+    """세 패널을 가로로 이어 붙여 out에 기록 (최근접 샘플링)
+
+    Args:
+        original (np.ndarray): (H, W, 3) 원본 프레임
+        mask (np.ndarray): (H, W) 마스크 (값을 그대로 회색조로 표시)
+        bbox (np.ndarray): (H, W, 3) 바운딩 박스 프레임
+        rows (np.ndarray): (h,) 출력 행마다 읽을 원본 행 번호
+        cols (np.ndarray): (w,) 출력 열마다 읽을 원본 열 번호
+        out (np.ndarray): (h, 3w, 3) uint8 출력
+    """
+    width = cols.shape[0]
+    for y in prange(rows.shape[0]):
+        sy = rows[y]
+        for x in range(width):
+            sx = cols[x]
+            m = mask[sy, sx]
+            for c in range(3):
+                out[y, x, c] = original[sy, sx, c]
+                out[y, width + x, c] = m
+                out[y, 2 * width + x, c] = bbox[sy, sx, c]
+
+
+@jit(nopython=True, nogil=True, cache=True)
+def expand_gray(mask: np.ndarray, out: np.ndarray):
+    """(H, W) 마스크를 (H, W, 3) 출력 패널에 회색조로 기록 (중간 배열 없음)"""
+    height, width = mask.shape
+    for y in range(height):
+        for x in range(width):
+            m = mask[y, x]
+            out[y, x, 0] = m
+            out[y, x, 1] = m
+            out[y, x, 2] = m
+
+
+class PreviewCompositor:
+    """세 패널 미리보기를 PPM 바이트 하나로 합성
+
+    출력 버퍼는 프레임 크기나 배율이 바뀔 때만 다시 할당합니다.
+    """
+
+    def __init__(self, scale: float = 1.0, max_panel_width: Optional[int] = None,
+                 max_fps: Optional[float] = None):
+        """합성기 초기화
+
+        Args:
+            scale (float): 미리보기 배율 (0 < scale <= 1)
+            max_panel_width (Optional[int]): 패널 한 개의 최대 너비 (넘으면 배율을 더 줄임)
+            max_fps (Optional[float]): 미리보기 최대 FPS (None이면 제한 없음)
+        """
+        if not 0.0 < scale <= 1.0:
+            raise ValueError(f"Preview scale must be in (0, 1]: {scale}")
+        self.scale = scale
+        self.max_panel_width = max_panel_width
+        self.max_fps = max_fps if max_fps and max_fps > 0 else None
+        self._last = None
+        self._source_shape = None
+        self.size = (0, 0)  # 패널 한 개의 (너비, 높이)
+        self._data = None
+        self.buffer = None
+        self._rows = None
+        self._cols = None
+        self.skipped = 0
+
+    def due(self) -> bool:
+        """max_fps 기준으로 새 미리보기를 만들 때가 되었는지 여부 (True이면 시각 기록)"""
+        if self.max_fps is None:
+            return True
+        now = time.monotonic()
+        if self._last is not None and now - self._last < 1.0 / self.max_fps:
+            self.skipped += 1
+            return False
+        self._last = now
+        return True
+
+    def panel_size(self, width: int, height: int):
+        """원본 크기에 대한 패널 크기 (너비, 높이)"""
+        scale = self.scale
+        if self.max_panel_width and width * scale > self.max_panel_width:
+            scale = self.max_panel_width / width
+        return max(1, int(round(width * scale))), max(1, int(round(height * scale)))
+
+    def _allocate(self, height: int, width: int):
+        panel_width, panel_height = self.panel_size(width, height)
+        header = f'P6 {panel_width * 3} {panel_height} 255 '.encode()
+        self._data = bytearray(len(header) + panel_height * panel_width * 3 * 3)
+        self._data[:len(header)] = header
+        self.buffer = np.frombuffer(self._data, dtype=np.uint8, offset=len(header)).reshape(
+            panel_height, panel_width * 3, 3)
+        # 출력 픽셀 중심에 해당하는 원본 좌표
+        self._rows = ((np.arange(panel_height) + 0.5) * height / panel_height).astype(np.int64)
+        self._cols = ((np.arange(panel_width) + 0.5) * width / panel_width).astype(np.int64)
+        self._source_shape = (height, width)
+        self.size = (panel_width, panel_height)
+
+    def compose(self, original: np.ndarray, mask: np.ndarray, bbox: np.ndarray) -> bytes:
+        """세 패널을 합성하여 PPM(P6) 바이트로 반환
+
+        Args:
+            original (np.ndarray): (H, W, 3) 원본 프레임
+            mask (np.ndarray): (H, W) 마스크
+            bbox (np.ndarray): (H, W, 3) 바운딩 박스 프레임
+
+        Returns:
+            bytes: (패널 높이) x (패널 너비 x 3) 크기의 PPM 데이터
+        """
+        height, width = original.shape[:2]
+        if self._source_shape != (height, width):
+            self._allocate(height, width)
+        panel_width = self.size[0]
+        if panel_width == width:
+            # 배율 1이면 샘플링 없이 패널별로 한 번씩 복사
+            self.buffer[:, :panel_width] = original
+            expand_gray(mask, self.buffer[:, panel_width:2 * panel_width])
+            self.buffer[:, 2 * panel_width:] = bbox
+        else:
+            compose_panels(original, mask, bbox, self._rows, self._cols, self.buffer)
+        # Tk에는 bytes만 이미지 데이터로 넘길 수 있으므로 합성 버퍼를 한 번 복사
+        return bytes(self._data)
+
+    def warm_up(self, frame_shape):
+        """합성 커널 미리 컴파일 및 버퍼 할당 (첫 미리보기에서 멈추지 않도록)
+
+        Args:
+            frame_shape: 프레임 모양 (H, W, 3)
+        """
+        frame = np.zeros(frame_shape, dtype=np.uint8)
+        mask = np.zeros(frame_shape[:2], dtype=np.uint8)
+        self.compose(frame, mask, frame)
+        # 배율 1이면 compose()가 expand_gray만 쓰므로 축소 경로 커널도 컴파일
+        compose_panels(frame, mask, frame, self._rows, self._cols, self.buffer)